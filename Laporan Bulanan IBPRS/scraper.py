@@ -240,14 +240,23 @@ class IBPRSScraper:
             self.driver.execute_script("arguments[0].scrollIntoView(true);", input_element)
             time.sleep(0.5)
             
-            # Clear the field first
-            input_element.clear()
+            # Set the province name in one call (clear + value + input/keyup/change events)
+            # instead of one WebDriver round-trip per typed character
+            typed_value = self.driver.execute_script("""
+                const el = arguments[0];
+                el.value = '';
+                el.value = arguments[1];
+                ['input', 'keyup', 'change'].forEach(type => el.dispatchEvent(new Event(type, {bubbles: true})));
+                return el.value;
+            """, input_element, province_name)
+            
+            # Fallback: type it if the page rejected the scripted value
+            if typed_value != province_name:
+                self.logger.info("Scripted input did not stick, typing province name instead")
+                input_element.clear()
+                input_element.send_keys(province_name)
             time.sleep(0.5)
             
-            # Type the province name
-            input_element.send_keys(province_name)
-            time.sleep(1.0)
-            
             self.logger.info(f"Successfully typed '{province_name}' into input field (id='search_4')")
             return True
             
@@ -33,7 +33,7 @@ class ExtJSHelper:
         """
         try:
             js_code = """
-            (function() {
+            return (function() {
                 try {
                     return typeof Ext !== 'undefined' && typeof Ext.ComponentQuery !== 'undefined';
                 } catch (e) {
@@ -193,6 +193,99 @@ class ExtJSHelper:
             print(f"[ERROR] Failed to set combo value: {error}")
             return False
     
+    def select_combo_by_text(self, keyword: str, text: str) -> bool:
+        """
+        Select a combobox entry by its display text using the store record and select()
+        No dropdown rendering, no <li> scanning - one JavaScript call
+        
+        Args:
+            keyword: Keyword contained in the combobox name, id or inputId (e.g., "month")
+            text: Display text of the entry (case-insensitive, e.g., "September")
+            
+        Returns:
+            True if the entry was selected, False if the combobox or entry was not found
+        """
+        js_code = """
+        return (function(keyword, text) {
+            try {
+                if (typeof Ext === 'undefined') {
+                    return {success: false, error: 'ExtJS not available'};
+                }
+                
+                // Find combobox whose name, id or inputId contains the keyword
+                var combos = Ext.ComponentQuery.query("combobox");
+                var combo = null;
+                for (var i = 0; i < combos.length; i++) {
+                    var ids = ((combos[i].name || '') + ' ' + (combos[i].id || '') + ' ' + (combos[i].inputId || '')).toLowerCase();
+                    if (ids.indexOf(keyword) !== -1) {
+                        combo = combos[i];
+                        break;
+                    }
+                }
+                if (!combo) {
+                    return {success: false, error: 'Combobox not found: ' + keyword};
+                }
+                
+                // Find the store record by display text
+                var store = combo.getStore();
+                var displayField = combo.displayField || 'text';
+                var index = store.findBy(function(record) {
+                    return String(record.get(displayField)).trim().toLowerCase() === text;
+                });
+                if (index === -1) {
+                    return {success: false, error: 'Entry not found: ' + text};
+                }
+                var record = store.getAt(index);
+                
+                // Select it and fire select event to trigger PostBack
+                combo.select(record);
+                combo.fireEvent('select', combo, record);
+                return {success: true, comboId: combo.id || 'unknown'};
+            } catch (e) {
+                return {success: false, error: 'Exception: ' + e.toString()};
+            }
+        })(arguments[0], arguments[1]);
+        """
+        
+        try:
+            result = self.driver.execute_script(js_code, keyword.lower(), text.strip().lower())
+        except Exception as e:
+            result = {'success': False, 'error': str(e)}
+        
+        if result and result.get('success'):
+            return True
+        error = result.get('error', 'Unknown error') if result else 'No result returned'
+        print(f"[INFO] ExtJS combo selection not available ({error})")
+        return False
+    
+    def set_field_value(self, component_id: str, value: str) -> bool:
+        """
+        Set an ExtJS form field value with setValue() (fires the change event) and fire blur
+        
+        Args:
+            component_id: ExtJS component id (e.g., "Year" for input Year-inputEl)
+            value: Value to set
+            
+        Returns:
+            True if the field exists and now holds the value
+        """
+        js_code = """
+        var field = (typeof Ext !== 'undefined') ? Ext.getCmp(arguments[0]) : null;
+        if (!field || !field.setValue) {
+            return false;
+        }
+        field.setValue(arguments[1]);
+        // Same as tabbing out of the field in the browser
+        field.fireEvent('blur', field);
+        return String(field.getRawValue()) === String(arguments[1]);
+        """
+        
+        try:
+            return bool(self.driver.execute_script(js_code, component_id, value))
+        except Exception as e:
+            print(f"[INFO] ExtJS field '{component_id}' not available ({e})")
+            return False
+    
     def click_tampilkan(self) -> bool:
         """
         Click "Tampilkan" button using ExtJS API
@@ -5,15 +5,27 @@ No DOM clicking, pure ExtJS ComponentQuery
 """
 
 import time
+import logging
 import csv
+import json
 import re
 import shutil
+import sys
+import hashlib
+import queue
+import random
+import threading
+from functools import lru_cache
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib.parse import urlencode
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+from bs4 import BeautifulSoup, SoupStrainer
 try:
     from openpyxl import Workbook
     from openpyxl.styles import Font, Alignment
@@ -21,6 +33,12 @@ except ImportError:
     print("[WARNING] openpyxl not installed. Excel export will not work. Install with: pip install openpyxl")
     Workbook = None
 
+try:
+    import requests
+except ImportError:
+    print("[WARNING] requests not installed. Direct URL retry will always use the browser. Install with: pip install requests")
+    requests = None
+
 # Handle imports for both package and direct execution
 try:
     from .helper import ExtJSHelper
@@ -37,6 +55,32 @@ except ImportError:
 
 from config.settings import OJKConfig, Settings
 
+logger = logging.getLogger(__name__)
+
+# Only build table/div nodes when parsing report pages; <head>, <script>, <style>
+# and friends are never inspected by the extractors
+DIV_STRAINER = SoupStrainer(['div', 'td', 'tr', 'table'])
+
+# Report page patterns, compiled once instead of inside the per-<td>/poll loops
+_NUMERIC_RE = re.compile(r'^\(?[\d,]+\.?\d*\)?$')  # e.g. "(677,555,231)", "1,223", "123.45"
+_BAD_REQUEST_RE = re.compile(r'bad request', re.IGNORECASE)
+_SPLIT_RE = re.compile(r',(\d{3})(\d)(?=,|\d|$)')  # Start of the previous-year number in "23,122,1223,112,122"
+_NONDIGIT_RE = re.compile(r'\D')
+_FAST_STRIP = str.maketrans('', '', ', \xa0')  # Thousands separators/spaces in "1,234,567"
+# Texts that belong to another identifier/label rather than a value (case-insensitive)
+_SKIP_RE = re.compile(r'kepada|pihak|bank|bpr|report viewer|configuration error|piutang|aset|dpk|laba|rasio', re.IGNORECASE)
+# ASCII characters that serialized HTML may entity-escape in text (raw page source checks cannot see them)
+_HTML_ESCAPED_CHARS = frozenset('&<>"\'')
+
+# Excel cell text that is effectively zero: "", "0", "0,00", "0.000", "-", ...
+_ZERO_STR_RE = re.compile(r'^[\s\-0.,]*$')
+
+
+@lru_cache(maxsize=None)
+def _identifier_pattern(identifiers_lower: tuple) -> re.Pattern:
+    """Alternation of a fixed identifier set (lowercase), compiled once per set"""
+    return re.compile('|'.join(re.escape(identifier) for identifier in identifiers_lower))
+
 
 class OJKExtJSScraper:
     """Main scraper class using ExtJS API exclusively"""
@@ -44,6 +88,61 @@ class OJKExtJSScraper:
     # Direct URL to BPR Konvensional report page
     REPORT_URL = "https://cfs.ojk.go.id/cfs/Report.aspx?BankTypeCode=BPK&BankTypeName=BPR%20Konvensional"
     
+    # Maximum number of report pages whose extracted Laba Kotor/Rasio values are kept
+    REPORT_CACHE_SIZE = 64
+    
+    # Maximum number of (page hash, identifier) values kept for the direct URL form parsers
+    IDENT_CACHE_SIZE = 256
+    
+    # Number of browsers used concurrently when retrying zero value banks
+    RETRY_WORKERS = 3
+    
+    # Upper bound (seconds) for one exponential backoff sleep in the direct URL retry
+    RETRY_BACKOFF_CAP = 30.0
+    
+    # Failed page loads (server error / no data / browser error) allowed per bank in the direct URL retry
+    MAX_RETRY_ATTEMPTS = 5
+    
+    # Retried banks between two writes of the retry checkpoint file
+    RETRY_CHECKPOINT_EVERY = 5
+    
+    # Month name (lowercase) -> zero-padded month number used in filenames and sheet names
+    MONTH_NUMBERS = {
+        'januari': '01', 'februari': '02', 'maret': '03', 'april': '04',
+        'mei': '05', 'juni': '06', 'juli': '07', 'agustus': '08',
+        'september': '09', 'oktober': '10', 'november': '11', 'desember': '12'
+    }
+    
+    # Quarter-end month name -> month number used in direct report URLs
+    REPORT_MONTH_NUMBERS = {
+        "Maret": 3,
+        "Juni": 6,
+        "September": 9,
+        "Desember": 12
+    }
+    
+    # Tree node texts in the bank dropdown that are report labels, not bank names
+    BANK_SKIP_LABELS = ["Laporan Posisi Keuangan", "Laporan Laba Rugi", "Laporan", "Posisi", "Keuangan", "Laba", "Rugi"]
+    # Same labels as one alternation pattern, tested once per span (case-insensitive)
+    BANK_SKIP_PATTERN = '|'.join(re.escape(label) for label in BANK_SKIP_LABELS)
+    
+    # Page text returned by the report viewer when the bank code/form does not exist
+    SERVER_ERROR_TEXT = "Server Error in '/cfs' Application"
+    
+    # Text that must be present before a plain HTTP response is treated as a rendered form
+    DIRECT_URL_MARKERS = {
+        1: "Total Aset",
+        2: "LABA (RUGI) TAHUN BERJALAN",
+        3: "KPMM"
+    }
+    
+    # Browser-like headers for plain HTTP requests to the report viewer
+    HTTP_HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7"
+    }
+    
     def __init__(self, headless: bool = None):
         """
         Initialize the scraper
@@ -64,11 +163,23 @@ class OJKExtJSScraper:
         self.all_data = []  # Store all extracted data for final Excel generation
         self.sheets_1_3_data = []  # Store data for Sheets 1-3 (ASET, Kredit, DPK)
         self.sheets_4_5_data = []  # Store data for Sheets 4-5 (Laba Kotor, Rasio)
+        self._report_cache = OrderedDict()  # (year, page hash) -> extracted Laba Kotor/Rasio values (LRU)
+        self._session = None  # requests.Session for direct URL retries (created lazily)
+        self._ident_cache = OrderedDict()  # (page hash, identifier) -> direct URL form values (LRU)
+        self._retry_done = {}  # (bank_name, month, year, form_num) -> parsed direct URL form data
+        self._retry_failed_loads = {}  # bank_name -> failed page loads in the last direct URL retry
+        self._retry_skipped = []  # Banks whose direct URL retry hit MAX_RETRY_ATTEMPTS
+        self._element_cache = {}  # (by, value) -> WebElement located on the current page load
+        self._open_bank_spans = None  # [(span, text)] of a bank dropdown left open by _get_all_bank_names
+        self._last_bank_texts = None  # Bank names of the last settled bank dropdown
+        self._stale_bank_texts = None  # Previous city's bank names, until the new city's list has replaced them
     
     def initialize(self):
         """Initialize WebDriver and ExtJS helper"""
         if self.driver is None:
-            self.driver = SeleniumSetup.create_driver(headless=self.headless)
+            # No implicit wait: optional probes (iframes, status checks) return immediately;
+            # required elements go through _wait_for_element / _find_tampilkan_button
+            self.driver = SeleniumSetup.create_driver(headless=self.headless, implicit_wait=0)
             self.wait = SeleniumSetup.create_wait(self.driver)
             self.extjs = ExtJSHelper(self.driver, self.wait)
             
@@ -80,6 +191,81 @@ class OJKExtJSScraper:
                 except Exception as e:
                     print(f"[WARNING] Could not minimize Chrome window: {e}")
     
+    def _wait_for_element(self, by: str, value: str, timeout: float = 5):
+        """
+        Find a required element, waiting for it explicitly (the driver has no implicit wait)
+        
+        Args:
+            by: Locator strategy (e.g. By.ID)
+            value: Locator value
+            timeout: Maximum seconds to wait (same as the former implicit wait)
+            
+        Returns:
+            WebElement (raises TimeoutException if it never appears)
+        """
+        return WebDriverWait(self.driver, timeout).until(EC.presence_of_element_located((by, value)))
+    
+    def _find_tampilkan_button(self, timeout: float = 5):
+        """
+        Find the 'Tampilkan' button, falling back to its label text when the button id is missing
+        
+        Args:
+            timeout: Maximum seconds to wait for either locator
+            
+        Returns:
+            WebElement (raises TimeoutException if neither appears)
+        """
+        return WebDriverWait(self.driver, timeout).until(EC.any_of(
+            EC.presence_of_element_located((By.ID, "ShowReportButton-btnInnerEl")),
+            EC.presence_of_element_located((By.XPATH, "//span[contains(text(), 'Tampilkan')]"))
+        ))
+    
+    def _get_cached_element(self, by: str, value: str, timeout: float = 5):
+        """
+        Get a page control (dropdown trigger, year input), reusing the element located earlier
+        on the same page load. The element is scrolled into view, which every caller needs
+        anyway and which doubles as the staleness check: a re-rendered element is located again once
+        
+        Args:
+            by: Locator strategy (e.g. By.ID)
+            value: Locator value
+            timeout: Maximum seconds to wait when (re)locating
+            
+        Returns:
+            WebElement (raises TimeoutException if it never appears)
+        """
+        key = (by, value)
+        element = self._element_cache.get(key)
+        if element is not None:
+            try:
+                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+                return element
+            except StaleElementReferenceException:
+                pass
+        
+        element = self._wait_for_element(by, value, timeout)
+        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+        self._element_cache[key] = element
+        return element
+    
+    def _wait_until(self, condition, timeout: float = 5, poll: float = 0.1) -> bool:
+        """
+        Wait for a DOM condition instead of sleeping a fixed time
+        
+        Args:
+            condition: Expected condition / callable taking the driver
+            timeout: Maximum seconds to wait
+            poll: Polling interval in seconds (WebDriverWait's default 0.5s is too coarse here)
+            
+        Returns:
+            True if the condition was met, False on timeout
+        """
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=poll).until(condition)
+            return True
+        except TimeoutException:
+            return False
+    
     def navigate_to_page(self):
         """Navigate directly to BPR Konvensional report page"""
         if self.driver is None:
@@ -87,6 +273,7 @@ class OJKExtJSScraper:
         
         print(f"[INFO] Navigating directly to report page: {self.base_url}")
         self.driver.get(self.base_url)
+        self._element_cache.clear()
         
         # Wait for page to load
         print("[INFO] Waiting for page to fully load...")
@@ -225,9 +412,6 @@ class OJKExtJSScraper:
             If no error, returns (False, current_month, current_year)
         """
         try:
-            # Wait a bit for any error messages to appear
-            time.sleep(1.5)
-            
             # Check for span with id="ReportStatus"
             self.driver.switch_to.default_content()
             
@@ -238,7 +422,8 @@ class OJKExtJSScraper:
             for retry_attempt in range(max_retries + 1):
                 try:
                     # Just check if ReportStatus span exists - if it exists, automatically skip
-                    report_status_span = self.driver.find_element(By.ID, "ReportStatus")
+                    # (explicit wait: the driver has no implicit wait and the span renders after the click)
+                    report_status_span = self._wait_for_element(By.ID, "ReportStatus")
                     
                     # ReportStatus span exists - this means there's an error
                     if retry_attempt == 0:
@@ -254,11 +439,7 @@ class OJKExtJSScraper:
                     if retry_attempt < max_retries:
                         print(f"[INFO] Re-clicking Tampilkan button (percobaan {retry_attempt + 1}/{max_retries})...")
                         try:
-                            tampilkan_button = None
-                            try:
-                                tampilkan_button = self.driver.find_element(By.ID, "ShowReportButton-btnInnerEl")
-                            except:
-                                tampilkan_button = self.driver.find_element(By.XPATH, "//span[contains(text(), 'Tampilkan')]")
+                            tampilkan_button = self._find_tampilkan_button()
                             
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tampilkan_button)
                             time.sleep(1.125)
@@ -303,13 +484,11 @@ class OJKExtJSScraper:
         
         # Step 1: Select month
         print(f"[Step 1] Selecting month: {month}")
-        self._select_month(month)
-        time.sleep(0.75)
+        self._select_month(month)  # returns once the month list has closed
         
         # Step 2: Select year
         print(f"[Step 2] Selecting year: {year}")
-        self._select_year(year)
-        time.sleep(0.75)
+        self._select_year(year)  # returns once the year field has lost focus
         
         # Step 3: Select province
         print("[Step 3] Selecting province...")
@@ -322,27 +501,28 @@ class OJKExtJSScraper:
     def _select_month(self, month: str):
         """Select month in the dropdown"""
         try:
+            # ExtJS API first: select the store record directly, without opening the dropdown
+            if self.extjs is not None and self.extjs.select_combo_by_text("month", month):
+                print(f"[OK] Selected month: {month}")
+                return
+            
             # Click month dropdown trigger
-            trigger = self.driver.find_element(By.ID, "ext-gen1050")
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", trigger)
-            time.sleep(0.75)
+            trigger = self._get_cached_element(By.ID, "ext-gen1050")
             self.driver.execute_script("arguments[0].click();", trigger)
-            time.sleep(0.75)
             
-            # Wait for dropdown and find month
-            from selenium.webdriver.support.ui import WebDriverWait
-            from selenium.webdriver.support import expected_conditions as EC
-            wait = WebDriverWait(self.driver, 5)
-            wait.until(EC.presence_of_element_located((By.XPATH, "//ul[contains(@class, 'x-list-plain')]")))
+            # Wait until the dropdown items are shown, then find month
+            if not self._wait_until(EC.visibility_of_element_located((By.CSS_SELECTOR, "ul[class*='x-list-plain'] li"))):
+                print(f"[WARNING] Month dropdown did not open")
             
-            li_elements = self.driver.find_elements(By.XPATH, "//li[@role='option' or contains(@class, 'x-boundlist-item')]")
+            li_elements = self.driver.find_elements(By.CSS_SELECTOR, "li[role='option'], li[class*='x-boundlist-item']")
             if not li_elements:
-                li_elements = self.driver.find_elements(By.XPATH, "//ul[contains(@class, 'x-list-plain')]//li")
+                li_elements = self.driver.find_elements(By.CSS_SELECTOR, "ul[class*='x-list-plain'] li")
             
             for li in li_elements:
                 if li.text.strip().lower() == month.lower():
                     self.driver.execute_script("arguments[0].click();", li)
-                    time.sleep(1.125)
+                    # The list closes once ExtJS has applied the selection
+                    self._wait_until(EC.invisibility_of_element(li))
                     print(f"[OK] Selected month: {month}")
                     return
         except Exception as e:
@@ -351,12 +531,18 @@ class OJKExtJSScraper:
     def _select_year(self, year: str):
         """Select year in the input field"""
         try:
-            year_input = self.driver.find_element(By.ID, "Year-inputEl")
+            # ExtJS API first: setValue() on the Year field (input Year-inputEl) fires its change event
+            if self.extjs is not None and self.extjs.set_field_value("Year", year):
+                print(f"[OK] Selected year: {year}")
+                return
+            
+            year_input = self._get_cached_element(By.ID, "Year-inputEl")
             year_input.clear()
             year_input.send_keys(year)
             from selenium.webdriver.common.keys import Keys
             year_input.send_keys(Keys.TAB)
-            time.sleep(0.75)
+            # ExtJS commits the value on blur - wait until focus has left the field
+            self._wait_until(lambda d: d.execute_script("return document.activeElement !== arguments[0];", year_input))
             print(f"[OK] Selected year: {year}")
         except Exception as e:
             print(f"[WARNING] Error selecting year {year}: {e}")
@@ -367,29 +553,21 @@ class OJKExtJSScraper:
             # Try to find and click the trigger arrow with ID ext-gen1059 (static ID for province dropdown)
             print(f"  [INFO] Looking for province trigger arrow (id='ext-gen1059')...")
             province_trigger_found = False
-            max_attempts = 10
-            wait_interval = 0.75
             
-            for attempt in range(max_attempts):
-                try:
-                    # Try to find by ID
-                    province_trigger = self.driver.find_element(By.ID, "ext-gen1059")
-                    print(f"  [OK] Found province trigger arrow (attempt {attempt + 1})")
-                    
-                    # Click the trigger to open dropdown
-                    print("  [INFO] Clicking province trigger arrow to open dropdown...")
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", province_trigger)
-                    time.sleep(1.125)
-                    self.driver.execute_script("arguments[0].click();", province_trigger)
-                    print("  [OK] Province trigger arrow clicked")
-                    province_trigger_found = True
-                    break
-                except:
-                    if attempt < max_attempts - 1:
-                        print(f"  [DEBUG] Province trigger not found, waiting {wait_interval} seconds...")
-                        time.sleep(wait_interval)
-                    else:
-                        print("  [WARNING] Could not find province trigger arrow")
+            try:
+                # Same 7.5s budget as the former 10 x 0.75s polling loop
+                province_trigger = self._wait_for_element(By.ID, "ext-gen1059", timeout=7.5)
+                print("  [OK] Found province trigger arrow")
+                
+                # Click the trigger to open dropdown
+                print("  [INFO] Clicking province trigger arrow to open dropdown...")
+                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", province_trigger)
+                time.sleep(1.125)
+                self.driver.execute_script("arguments[0].click();", province_trigger)
+                print("  [OK] Province trigger arrow clicked")
+                province_trigger_found = True
+            except Exception:
+                print("  [WARNING] Could not find province trigger arrow")
             
             # Wait for dropdown to appear and find <li> element
             if province_trigger_found:
@@ -403,14 +581,14 @@ class OJKExtJSScraper:
                     
                     wait = WebDriverWait(self.driver, 5)
                     dropdown_list = wait.until(
-                        EC.presence_of_element_located((By.XPATH, "//ul[contains(@class, 'x-list-plain')]"))
+                        EC.presence_of_element_located((By.CSS_SELECTOR, "ul[class*='x-list-plain']"))
                     )
                     print("  [OK] Province dropdown menu appeared")
                     
                     # Find all <li> elements
-                    li_elements = self.driver.find_elements(By.XPATH, "//li[@role='option' or contains(@class, 'x-boundlist-item')]")
+                    li_elements = self.driver.find_elements(By.CSS_SELECTOR, "li[role='option'], li[class*='x-boundlist-item']")
                     if not li_elements:
-                        li_elements = self.driver.find_elements(By.XPATH, "//ul[contains(@class, 'x-list-plain')]//li")
+                        li_elements = self.driver.find_elements(By.CSS_SELECTOR, "ul[class*='x-list-plain'] li")
                     
                     print(f"  [DEBUG] Found {len(li_elements)} <li> elements in province dropdown")
                     
@@ -499,7 +677,7 @@ class OJKExtJSScraper:
         # Store the year from input field for Excel labeling
         excel_year = year  # Default to provided year
         try:
-            year_input = self.driver.find_element(By.ID, "Year-inputEl")
+            year_input = self._get_cached_element(By.ID, "Year-inputEl")
             excel_year = year_input.get_attribute('value') or year_input.get_property('value') or year
             if excel_year:
                 print(f"[OK] Read year from input field for Excel: {excel_year}")
@@ -548,13 +726,13 @@ class OJKExtJSScraper:
                 is_first_bank_in_city = True
                 time.sleep(0.75)
                 print(f"\n[INFO] Processing: {current_city}")
-                bank_names = self._get_all_bank_names(city_index, city_already_selected=True)
+                bank_names = self._get_all_bank_names(city_index, city_already_selected=True, keep_open=True)
                 print(f"  [INFO] Found {len(bank_names)} banks in {current_city}")
                 
                 if not bank_names:
                     print(f"  [WARNING] No banks found on first attempt, waiting and retrying...")
                     time.sleep(1.125)
-                    bank_names = self._get_all_bank_names(city_index, city_already_selected=True)
+                    bank_names = self._get_all_bank_names(city_index, city_already_selected=True, keep_open=True)
                     print(f"  [INFO] Found {len(bank_names)} banks in {current_city} (retry)")
                 
                 if not bank_names:
@@ -669,6 +847,7 @@ class OJKExtJSScraper:
                 # Refresh the page to get a clean state
                 print("\n[INFO] Refreshing page to get clean state for Sheets 4-5...")
                 self.driver.refresh()
+                self._element_cache.clear()
                 time.sleep(3.0)
                 
                 print("[INFO] Waiting for page to fully load after refresh...")
@@ -702,13 +881,13 @@ class OJKExtJSScraper:
                 is_first_bank_in_city = True
                 time.sleep(0.75)
                 print(f"\n[INFO] Processing: {current_city}")
-                bank_names = self._get_all_bank_names(city_index, city_already_selected=True)
+                bank_names = self._get_all_bank_names(city_index, city_already_selected=True, keep_open=True)
                 print(f"  [INFO] Found {len(bank_names)} banks in {current_city}")
                 
                 if not bank_names:
                     print(f"  [WARNING] No banks found on first attempt, waiting and retrying...")
                     time.sleep(1.125)
-                    bank_names = self._get_all_bank_names(city_index, city_already_selected=True)
+                    bank_names = self._get_all_bank_names(city_index, city_already_selected=True, keep_open=True)
                     print(f"  [INFO] Found {len(bank_names)} banks in {current_city} (retry)")
                 
                 if not bank_names:
@@ -810,13 +989,13 @@ class OJKExtJSScraper:
                 is_first_bank_in_city = True
                 time.sleep(0.75)
                 print(f"\n[INFO] Processing: {current_city}")
-                bank_names = self._get_all_bank_names(city_index, city_already_selected=True)
+                bank_names = self._get_all_bank_names(city_index, city_already_selected=True, keep_open=True)
                 print(f"  [INFO] Found {len(bank_names)} banks in {current_city}")
                 
                 if not bank_names:
                     print(f"  [WARNING] No banks found on first attempt, waiting and retrying...")
                     time.sleep(1.125)
-                    bank_names = self._get_all_bank_names(city_index, city_already_selected=True)
+                    bank_names = self._get_all_bank_names(city_index, city_already_selected=True, keep_open=True)
                     print(f"  [INFO] Found {len(bank_names)} banks in {current_city} (retry)")
                 
                 if not bank_names:
@@ -1010,36 +1189,36 @@ class OJKExtJSScraper:
             print(f"    [OK] Found treeview element: {treeview_id}")
             
             # Find nested divs with role="checkbox" inside this treeview element
-            # Try multiple XPath patterns to find checkboxes
+            # Try multiple selector patterns to find checkboxes
             checkboxes = []
             
             # Pattern 1: div with role="checkbox"
-            checkboxes = treeview_element.find_elements(By.XPATH, ".//div[@role='checkbox']")
+            checkboxes = treeview_element.find_elements(By.CSS_SELECTOR, "div[role='checkbox']")
             if checkboxes:
                 print(f"    [DEBUG] Found {len(checkboxes)} checkbox(es) using pattern: div[@role='checkbox']")
             else:
                 # Pattern 2: input type="checkbox"
-                checkboxes = treeview_element.find_elements(By.XPATH, ".//input[@type='checkbox']")
+                checkboxes = treeview_element.find_elements(By.CSS_SELECTOR, "input[type='checkbox']")
                 if checkboxes:
                     print(f"    [DEBUG] Found {len(checkboxes)} checkbox(es) using pattern: input[@type='checkbox']")
                 else:
                     # Pattern 3: elements with checkbox in class
-                    checkboxes = treeview_element.find_elements(By.XPATH, ".//div[contains(@class, 'checkbox')]")
+                    checkboxes = treeview_element.find_elements(By.CSS_SELECTOR, "div[class*='checkbox']")
                     if checkboxes:
                         print(f"    [DEBUG] Found {len(checkboxes)} checkbox(es) using pattern: div[contains(@class, 'checkbox')]")
                     else:
                         # Pattern 4: any element with aria-checked attribute
-                        checkboxes = treeview_element.find_elements(By.XPATH, ".//*[@aria-checked]")
+                        checkboxes = treeview_element.find_elements(By.CSS_SELECTOR, "[aria-checked]")
                         if checkboxes:
                             print(f"    [DEBUG] Found {len(checkboxes)} checkbox(es) using pattern: *[@aria-checked]")
                         else:
                             # Pattern 5: look for elements with checkbox-related attributes
-                            checkboxes = treeview_element.find_elements(By.XPATH, ".//*[contains(@class, 'x-tree-checkbox') or contains(@class, 'tree-checkbox')]")
+                            checkboxes = treeview_element.find_elements(By.CSS_SELECTOR, "[class*='tree-checkbox']")
                             if checkboxes:
                                 print(f"    [DEBUG] Found {len(checkboxes)} checkbox(es) using pattern: *[contains(@class, 'tree-checkbox')]")
                             else:
                                 # Pattern 6: look for any clickable element that might be a checkbox
-                                checkboxes = treeview_element.find_elements(By.XPATH, ".//*[@role='checkbox' or @type='checkbox' or contains(@class, 'checkbox')]")
+                                checkboxes = treeview_element.find_elements(By.CSS_SELECTOR, "[role='checkbox'], [type='checkbox'], [class*='checkbox']")
                                 if checkboxes:
                                     print(f"    [DEBUG] Found {len(checkboxes)} checkbox(es) using pattern: *[@role='checkbox' or @type='checkbox' or contains(@class, 'checkbox')]")
             
@@ -1124,9 +1303,9 @@ class OJKExtJSScraper:
             )
             
             # Find checkboxes
-            checkboxes = treeview_element.find_elements(By.XPATH, ".//*[contains(@class, 'x-tree-checkbox') or contains(@class, 'tree-checkbox') or @role='checkbox' or @type='checkbox']")
+            checkboxes = treeview_element.find_elements(By.CSS_SELECTOR, "[class*='tree-checkbox'], [role='checkbox'], [type='checkbox']")
             if not checkboxes:
-                checkboxes = treeview_element.find_elements(By.XPATH, ".//*[@aria-checked]")
+                checkboxes = treeview_element.find_elements(By.CSS_SELECTOR, "[aria-checked]")
             
             if checkboxes:
                 checkbox = checkboxes[0]
@@ -1155,9 +1334,9 @@ class OJKExtJSScraper:
                 )
                 
                 # Find checkboxes
-                checkboxes = treeview_element.find_elements(By.XPATH, ".//*[contains(@class, 'x-tree-checkbox') or contains(@class, 'tree-checkbox') or @role='checkbox' or @type='checkbox']")
+                checkboxes = treeview_element.find_elements(By.CSS_SELECTOR, "[class*='tree-checkbox'], [role='checkbox'], [type='checkbox']")
                 if not checkboxes:
-                    checkboxes = treeview_element.find_elements(By.XPATH, ".//*[@aria-checked]")
+                    checkboxes = treeview_element.find_elements(By.CSS_SELECTOR, "[aria-checked]")
                 
                 if checkboxes:
                     checkbox = checkboxes[0]
@@ -1204,9 +1383,9 @@ class OJKExtJSScraper:
                 )
                 
                 # Find checkboxes
-                checkboxes = treeview_element.find_elements(By.XPATH, ".//*[contains(@class, 'x-tree-checkbox') or contains(@class, 'tree-checkbox') or @role='checkbox' or @type='checkbox']")
+                checkboxes = treeview_element.find_elements(By.CSS_SELECTOR, "[class*='tree-checkbox'], [role='checkbox'], [type='checkbox']")
                 if not checkboxes:
-                    checkboxes = treeview_element.find_elements(By.XPATH, ".//*[@aria-checked]")
+                    checkboxes = treeview_element.find_elements(By.CSS_SELECTOR, "[aria-checked]")
                 
                 if checkboxes:
                     checkbox = checkboxes[0]
@@ -1266,9 +1445,9 @@ class OJKExtJSScraper:
                 )
                 
                 # Find checkboxes
-                checkboxes = treeview_element.find_elements(By.XPATH, ".//*[contains(@class, 'x-tree-checkbox') or contains(@class, 'tree-checkbox') or @role='checkbox' or @type='checkbox']")
+                checkboxes = treeview_element.find_elements(By.CSS_SELECTOR, "[class*='tree-checkbox'], [role='checkbox'], [type='checkbox']")
                 if not checkboxes:
-                    checkboxes = treeview_element.find_elements(By.XPATH, ".//*[@aria-checked]")
+                    checkboxes = treeview_element.find_elements(By.CSS_SELECTOR, "[aria-checked]")
                 
                 if checkboxes:
                     checkbox = checkboxes[0]
@@ -1299,24 +1478,39 @@ class OJKExtJSScraper:
         
         print("  [OK] Checkbox 003 only setup completed")
     
+    def _close_open_dropdowns(self):
+        """
+        Close any open ExtJS dropdown (picker) and blur the focused field in one script call
+        Collapsing is synchronous, so no sleep is needed afterwards (unlike pressing ESC on body)
+        """
+        try:
+            self.driver.execute_script("""
+                if (window.Ext && Ext.ComponentQuery) {
+                    Ext.ComponentQuery.query('pickerfield').forEach(f => { if (f.isExpanded) f.collapse(); });
+                }
+                if (document.activeElement && document.activeElement !== document.body) {
+                    document.activeElement.blur();
+                }
+            """)
+        except Exception:
+            # Fallback: press ESC on body
+            try:
+                from selenium.webdriver.common.keys import Keys
+                self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
+            except:
+                pass
+    
     def _get_city_by_index(self, index: int) -> str:
         """Get city name by index from dropdown ext-gen1064. Returns city name or None if not found."""
         try:
             print(f"    [DEBUG] Attempting to get city at index {index}...")
             
             # First, close any open dropdowns to avoid confusion
-            try:
-                from selenium.webdriver.common.keys import Keys
-                self.driver.switch_to.default_content()
-                body = self.driver.find_element(By.TAG_NAME, "body")
-                body.send_keys(Keys.ESCAPE)
-                time.sleep(1.125)  # MAX(0.5, 50% of 0.3) = 0.5
-            except:
-                pass
+            self.driver.switch_to.default_content()
+            self._close_open_dropdowns()
             
             # Click dropdown trigger to open
-            dropdown_trigger = self.driver.find_element(By.ID, "ext-gen1064")
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", dropdown_trigger)
+            dropdown_trigger = self._get_cached_element(By.ID, "ext-gen1064")
             time.sleep(0.75)  # MAX(0.5, 50% of 0.5) = 0.5
             self.driver.execute_script("arguments[0].click();", dropdown_trigger)
             print(f"    [DEBUG] Clicked city dropdown trigger")
@@ -1325,12 +1519,12 @@ class OJKExtJSScraper:
             time.sleep(0.75)  # MAX(0.5, 50% of 0.5) = 0.5
             wait = WebDriverWait(self.driver, 10)
             # Wait for the boundlist to appear (city dropdown should have a specific boundlist)
-            wait.until(EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'x-boundlist') and contains(@class, 'x-boundlist-floating')]")))
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div[class*='x-boundlist'][class*='x-boundlist-floating']")))
             print(f"    [DEBUG] City dropdown appeared")
             
             # Find all visible boundlists and use the one that's visible (not hidden)
             # Get all boundlists and filter for visible ones
-            all_boundlists = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'x-boundlist') and contains(@class, 'x-boundlist-floating')]")
+            all_boundlists = self.driver.find_elements(By.CSS_SELECTOR, "div[class*='x-boundlist'][class*='x-boundlist-floating']")
             boundlist = None
             for bl in all_boundlists:
                 try:
@@ -1347,14 +1541,14 @@ class OJKExtJSScraper:
             
             # Get all city options from within this specific boundlist only
             if boundlist:
-                li_elements = boundlist.find_elements(By.XPATH, ".//li[@role='option' or contains(@class, 'x-boundlist-item')]")
+                li_elements = boundlist.find_elements(By.CSS_SELECTOR, "li[role='option'], li[class*='x-boundlist-item']")
                 if not li_elements:
-                    li_elements = boundlist.find_elements(By.XPATH, ".//ul[contains(@class, 'x-list-plain')]//li")
+                    li_elements = boundlist.find_elements(By.CSS_SELECTOR, "ul[class*='x-list-plain'] li")
             else:
                 # Fallback to global search if boundlist not found
-                li_elements = self.driver.find_elements(By.XPATH, "//li[@role='option' or contains(@class, 'x-boundlist-item')]")
+                li_elements = self.driver.find_elements(By.CSS_SELECTOR, "li[role='option'], li[class*='x-boundlist-item']")
                 if not li_elements:
-                    li_elements = self.driver.find_elements(By.XPATH, "//ul[contains(@class, 'x-list-plain')]//li")
+                    li_elements = self.driver.find_elements(By.CSS_SELECTOR, "ul[class*='x-list-plain'] li")
             
             print(f"    [DEBUG] Found {len(li_elements)} <li> elements in city dropdown")
             
@@ -1388,7 +1582,7 @@ class OJKExtJSScraper:
                     time.sleep(1.125 if retry == 0 else 0.75)  # MAX(0.5, 50% of 1.5) = 0.75, MAX(0.5, 50% of 1.0) = 0.5
                     # Re-fetch li_elements from the city dropdown boundlist
                     try:
-                        all_boundlists = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'x-boundlist') and contains(@class, 'x-boundlist-floating')]")
+                        all_boundlists = self.driver.find_elements(By.CSS_SELECTOR, "div[class*='x-boundlist'][class*='x-boundlist-floating']")
                         boundlist = None
                         for bl in all_boundlists:
                             try:
@@ -1399,19 +1593,19 @@ class OJKExtJSScraper:
                                 continue
                         
                         if boundlist:
-                            li_elements = boundlist.find_elements(By.XPATH, ".//li[@role='option' or contains(@class, 'x-boundlist-item')]")
+                            li_elements = boundlist.find_elements(By.CSS_SELECTOR, "li[role='option'], li[class*='x-boundlist-item']")
                             if not li_elements:
-                                li_elements = boundlist.find_elements(By.XPATH, ".//ul[contains(@class, 'x-list-plain')]//li")
+                                li_elements = boundlist.find_elements(By.CSS_SELECTOR, "ul[class*='x-list-plain'] li")
                         else:
                             # Fallback to global search if boundlist not found
-                            li_elements = self.driver.find_elements(By.XPATH, "//li[@role='option' or contains(@class, 'x-boundlist-item')]")
+                            li_elements = self.driver.find_elements(By.CSS_SELECTOR, "li[role='option'], li[class*='x-boundlist-item']")
                             if not li_elements:
-                                li_elements = self.driver.find_elements(By.XPATH, "//ul[contains(@class, 'x-list-plain')]//li")
+                                li_elements = self.driver.find_elements(By.CSS_SELECTOR, "ul[class*='x-list-plain'] li")
                     except:
                         # Fallback to global search if boundlist not found
-                        li_elements = self.driver.find_elements(By.XPATH, "//li[@role='option' or contains(@class, 'x-boundlist-item')]")
+                        li_elements = self.driver.find_elements(By.CSS_SELECTOR, "li[role='option'], li[class*='x-boundlist-item']")
                         if not li_elements:
-                            li_elements = self.driver.find_elements(By.XPATH, "//ul[contains(@class, 'x-list-plain')]//li")
+                            li_elements = self.driver.find_elements(By.CSS_SELECTOR, "ul[class*='x-list-plain'] li")
             
             print(f"    [DEBUG] Found {len(valid_cities)} valid cities (non-empty)")
             
@@ -1426,6 +1620,9 @@ class OJKExtJSScraper:
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", city_li)
                 time.sleep(1.125)  # MAX(0.5, 50% of 0.5) = 0.5
                 self.driver.execute_script("arguments[0].click();", city_li)
+                # Until the bank list changes, it still shows the previous city's banks
+                self._stale_bank_texts = self._last_bank_texts
+                self._open_bank_spans = None
                 time.sleep(1.125)  # MAX(0.5, 50% of 1.0) = 0.5 - Wait for PostBack and dropdown to update
                 print(f"    [OK] Selected city: '{city_name}'")
                 return city_name
@@ -1442,13 +1639,97 @@ class OJKExtJSScraper:
             print(f"    [ERROR] Could not get city by index {index}: {e}")
             return None
     
-    def _get_all_bank_names(self, city_index: int, city_already_selected: bool = False) -> list:
+    def _get_bank_dropdown_spans(self) -> list:
+        """
+        Get the bank entries of the open bank dropdown (tbody treeview-1022-body) in one round-trip
+        Visibility, text and label filtering run in the browser instead of one
+        is_displayed()/text WebDriver call per span
+        
+        Returns:
+            List of (span WebElement, bank name) tuples in dropdown order
+        """
+        spans = self.driver.execute_script("""
+            const skip = new RegExp(arguments[0], 'i');
+            const result = [];
+            document.querySelectorAll("tbody#treeview-1022-body span.x-tree-node-text").forEach(s => {
+                if (s.offsetParent === null && s.getClientRects().length === 0) return;  // not displayed
+                const text = (s.innerText || '').trim();
+                if (!text) return;
+                if (skip.test(text)) return;  // known label, not a bank name
+                result.push([s, text]);
+            });
+            return result;
+        """, self.BANK_SKIP_PATTERN) or []
+        
+        # Bank names typically contain numbers (bank codes); otherwise they are reasonably long
+        return [
+            (span, span_text) for span, span_text in spans
+            if any(char.isdigit() for char in span_text) or len(span_text) > 15
+        ]
+    
+    def _wait_for_bank_spans(self, timeout: float = 4) -> list:
+        """
+        Wait until the opened bank dropdown has rendered its bank entries
+        Polls _get_bank_dropdown_spans() until two consecutive polls return the same non-empty
+        number of entries (the tree is populated, not still rendering) instead of fixed sleeps.
+        Right after a city change the previous city's list is just as stable, so a list equal to
+        it is not accepted, nor is any list while the tree store is still loading.
+        
+        Args:
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            Last _get_bank_dropdown_spans() result (empty if no bank - or only the previous
+            city's banks - showed up in time)
+        """
+        last = {'spans': []}
+        
+        def spans_settled(driver) -> bool:
+            previous_count = len(last['spans'])
+            last['spans'] = self._get_bank_dropdown_spans()
+            if not last['spans'] or len(last['spans']) != previous_count:
+                return False
+            if self._stale_bank_texts is not None and [text for _, text in last['spans']] == self._stale_bank_texts:
+                return False
+            return not self._is_bank_store_loading()
+        
+        if self._wait_until(spans_settled, timeout=timeout, poll=0.15):
+            self._last_bank_texts = [text for _, text in last['spans']]
+            self._stale_bank_texts = None
+            return last['spans']
+        
+        print(f"    [DEBUG] Bank dropdown did not settle within {timeout}s ({len(last['spans'])} entries)")
+        if self._stale_bank_texts is not None and [text for _, text in last['spans']] == self._stale_bank_texts:
+            # Never hand out the previous city's banks - selecting by index would pick the wrong bank
+            print(f"    [DEBUG] Bank dropdown still shows the previous city's banks")
+            return []
+        return last['spans']
+    
+    def _is_bank_store_loading(self) -> bool:
+        """Whether the bank tree's (treeview-1022) ExtJS store is loading; False if it cannot be checked"""
+        try:
+            return bool(self.driver.execute_script("""
+                try {
+                    var view = window.Ext && Ext.getCmp('treeview-1022');
+                    var store = view && view.getStore && view.getStore();
+                    return !!(store && store.isLoading && store.isLoading());
+                } catch (e) {
+                    return false;
+                }
+            """))
+        except Exception:
+            return False
+    
+    def _get_all_bank_names(self, city_index: int, city_already_selected: bool = False, keep_open: bool = False) -> list:
         """Get all bank names from dropdown ext-gen1069. Returns list of bank names.
         
         Args:
             city_index: Index of the city (used to ensure correct city is selected)
             city_already_selected: If True, skip city selection (city was already selected)
+            keep_open: If True, leave the dropdown open so the next _select_bank_by_index
+                       can click its spans without re-opening the trigger
         """
+        self._open_bank_spans = None
         try:
             # Make sure we're on the correct city first (unless already selected)
             if not city_already_selected:
@@ -1460,55 +1741,26 @@ class OJKExtJSScraper:
                 time.sleep(1.125)  # MAX(0.5, 50% of 1.0) = 0.5 - Wait a bit even if city already selected
             
             # Click dropdown trigger to open
-            dropdown_trigger = self.driver.find_element(By.ID, "ext-gen1069")
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", dropdown_trigger)
+            dropdown_trigger = self._get_cached_element(By.ID, "ext-gen1069")
             time.sleep(0.75)  # MAX(0.5, 50% of 0.5) = 0.5 - Wait before clicking
             self.driver.execute_script("arguments[0].click();", dropdown_trigger)
             
             # Wait for dropdown to appear
-            time.sleep(0.75)  # MAX(0.5, 50% of 0.5) = 0.5
             wait = WebDriverWait(self.driver, 10)
-            wait.until(EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'x-boundlist')] | //table")))
-            
-            # Wait for tbody to be present and populated
-            try:
-                wait.until(EC.presence_of_element_located((By.XPATH, "//tbody[@id='treeview-1022-body']")))
-                time.sleep(1.125)  # MAX(0.5, 50% of 1.0) = 0.5 - Wait for spans to be rendered
-            except:
-                pass
-            
-            # Get all spans with class="x-tree-node-text" within tbody id="treeview-1022-body"
-            # This is the bank dropdown, not the checkbox area
-            # THE FIX: Only use visible spans for indexing - filter immediately
-            # Ensure we ONLY check spans inside treeview-1022-body tbody
-            all_spans = self.driver.find_elements(By.XPATH, "//tbody[@id='treeview-1022-body']//span[@class='x-tree-node-text' or contains(@class, 'x-tree-node-text')]")
-            
-            # Filter to only visible, non-empty spans immediately
-            # The XPath already ensures we're only getting spans from treeview-1022-body
-            span_elements = [
-                s for s in all_spans
-                if s.is_displayed() and s.text.strip()
-            ]
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div[class*='x-boundlist'], table")))
             
+            # Visible bank spans inside tbody id="treeview-1022-body" (the bank dropdown, not the checkbox area),
+            # read as soon as the list is populated
             bank_names = []
-            skip_labels = ["Laporan Posisi Keuangan", "Laporan Laba Rugi", "Laporan", "Posisi", "Keuangan", "Laba", "Rugi"]
+            bank_spans = self._wait_for_bank_spans()
+            for _, span_text in bank_spans:
+                bank_names.append(span_text)
+                print(f"    [DEBUG] Found bank: '{span_text[:50]}...'")
             
-            if span_elements:
-                for span in span_elements:
-                    span_text = span.text.strip()
-                    
-                    # Skip if it's a known label (not a bank name)
-                    is_label = any(label.lower() in span_text.lower() for label in skip_labels)
-                    if is_label:
-                        continue
-                    
-                    # Bank names typically contain numbers (bank codes)
-                    has_number = any(char.isdigit() for char in span_text)
-                    
-                    # Only add if it looks like a bank name (has number or is reasonably long)
-                    if has_number or len(span_text) > 15:
-                        bank_names.append(span_text)
-                        print(f"    [DEBUG] Found bank: '{span_text[:50]}...'")
+            # Leave the list open for the first selection instead of closing and re-opening it
+            if keep_open and bank_spans:
+                self._open_bank_spans = bank_spans
+                return bank_names
             
             # Close dropdown
             try:
@@ -1533,6 +1785,20 @@ class OJKExtJSScraper:
         Returns:
             Bank name if successful, empty string if failed.
         """
+        # Dropdown left open by _get_all_bank_names(keep_open=True): click its span directly
+        open_spans, self._open_bank_spans = self._open_bank_spans, None
+        if open_spans and city_already_selected and bank_index < len(open_spans):
+            selected_span, bank_name = open_spans[bank_index]
+            try:
+                if selected_span.is_displayed():
+                    self._click_bank_span(selected_span)
+                    print(f"    [DEBUG] Selected bank at index {bank_index} from open dropdown: '{bank_name[:50]}...'")
+                    return bank_name
+            except StaleElementReferenceException:
+                print(f"    [DEBUG] Open bank dropdown went stale, re-opening it")
+            except Exception as e:
+                print(f"    [DEBUG] Could not select bank from open dropdown: {e}")
+        
         try:
             # Make sure we're on the correct city first (unless already selected)
             if not city_already_selected:
@@ -1548,91 +1814,27 @@ class OJKExtJSScraper:
                     time.sleep(1.125)  # MAX(0.5, 50% of 1.0) = 0.5 - Wait between bank selections
             
             # Click dropdown trigger to open
-            dropdown_trigger = self.driver.find_element(By.ID, "ext-gen1069")
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", dropdown_trigger)
+            dropdown_trigger = self._get_cached_element(By.ID, "ext-gen1069")
             time.sleep(0.75)  # MAX(0.5, 50% of 0.3) = 0.5
             self.driver.execute_script("arguments[0].click();", dropdown_trigger)
             
             # Wait for dropdown to appear
-            time.sleep(0.75)  # MAX(0.5, 50% of 0.5) = 0.5
             wait = WebDriverWait(self.driver, 10)
-            wait.until(EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'x-boundlist')] | //table")))
-            
-            # Wait for tbody to be present and populated
-            # For index 0 (first bank), wait longer to ensure dropdown is fully loaded
-            wait_time = 1.125 if bank_index == 0 else 0.75  # Increased by 50%
-            try:
-                wait.until(EC.presence_of_element_located((By.XPATH, "//tbody[@id='treeview-1022-body']")))
-                time.sleep(wait_time)  # Longer wait for first bank, shorter for others
-            except:
-                pass
-            
-            # Additional wait for spans to be rendered, especially for index 0
-            if bank_index == 0:
-                time.sleep(1.125)  # MAX(0.5, 50% of 1.0) = 0.5
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div[class*='x-boundlist'], table")))
             
-            # Get all spans with class="x-tree-node-text" within tbody id="treeview-1022-body"
+            # Visible bank spans inside tbody id="treeview-1022-body", filtered the same way as _get_all_bank_names,
+            # read as soon as the list is populated (also covers the slower first load at index 0)
             # This ensures we're clicking the dropdown tr, not the checkbox tr
-            # THE FIX: Only use visible spans for indexing - filter immediately
-            # Ensure we ONLY check spans inside treeview-1022-body tbody
-            all_spans = self.driver.find_elements(By.XPATH, "//tbody[@id='treeview-1022-body']//span[@class='x-tree-node-text' or contains(@class, 'x-tree-node-text')]")
-            
-            # Filter to only visible, non-empty spans immediately
-            # The XPath already ensures we're only getting spans from treeview-1022-body
-            span_elements = [
-                s for s in all_spans
-                if s.is_displayed() and s.text.strip()
-            ]
-            
-            print(f"    [DEBUG] Found {len(span_elements)} visible, non-empty span elements in dropdown (from treeview-1022-body)")
-            
-            # Filter spans the same way as _get_all_bank_names
-            skip_labels = ["Laporan Posisi Keuangan", "Laporan Laba Rugi", "Laporan", "Posisi", "Keuangan", "Laba", "Rugi"]
-            valid_bank_spans = []
-            
-            for span in span_elements:
-                try:
-                    span_text = span.text.strip()
-                    
-                    # Skip if it's a known label (not a bank name)
-                    is_label = any(label.lower() in span_text.lower() for label in skip_labels)
-                    if is_label:
-                        continue
-                    
-                    # Bank names typically contain numbers (bank codes)
-                    has_number = any(char.isdigit() for char in span_text)
-                    
-                    # Only add if it looks like a bank name (has number or is reasonably long)
-                    if has_number or len(span_text) > 15:
-                        valid_bank_spans.append((span, span_text))
-                        print(f"    [DEBUG] Valid bank span {len(valid_bank_spans)-1}: '{span_text[:50]}...'")
-                except:
-                    # Element might be stale, skip it
-                    continue
+            valid_bank_spans = self._wait_for_bank_spans()
+            for span_num, (_, span_text) in enumerate(valid_bank_spans):
+                print(f"    [DEBUG] Valid bank span {span_num}: '{span_text[:50]}...'")
             
             print(f"    [DEBUG] Total valid bank spans: {len(valid_bank_spans)}")
             
             # Select by index
             if bank_index < len(valid_bank_spans):
                 selected_span, bank_name = valid_bank_spans[bank_index]
-                
-                # Find the parent tr within the tbody (this is the dropdown row, not checkbox)
-                try:
-                    # Find the closest tr ancestor (should be within treeview-1022-body)
-                    parent_tr = selected_span.find_element(By.XPATH, "./ancestor::tr[1]")
-                    clickable_elem = parent_tr
-                except:
-                    # Fallback: try to find any clickable ancestor
-                    try:
-                        clickable_elem = selected_span.find_element(By.XPATH, "./ancestor::*[@role='row' or contains(@class, 'x-boundlist-item')][1]")
-                    except:
-                        clickable_elem = selected_span
-                
-                # Select it
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", clickable_elem)
-                time.sleep(1.125)  # MAX(0.5, 50% of 0.3) = 0.5
-                self.driver.execute_script("arguments[0].click();", clickable_elem)
-                time.sleep(1.125)  # MAX(0.5, 50% of 0.5) = 0.5 - Wait for PostBack
+                self._click_bank_span(selected_span)
                 print(f"    [DEBUG] Selected bank at index {bank_index}: '{bank_name[:50]}...'")
                 return bank_name
             else:
@@ -1648,6 +1850,30 @@ class OJKExtJSScraper:
             print(f"    [DEBUG] Could not select bank by index {bank_index}: {e}")
             return ""
     
+    def _click_bank_span(self, selected_span):
+        """Click the dropdown row that holds a bank span and wait for the PostBack."""
+        # Find the parent tr within the tbody (this is the dropdown row, not checkbox)
+        try:
+            # Find the closest tr ancestor (should be within treeview-1022-body)
+            parent_tr = selected_span.find_element(By.XPATH, "./ancestor::tr[1]")
+            clickable_elem = parent_tr
+        except StaleElementReferenceException:
+            raise
+        except:
+            # Fallback: try to find any clickable ancestor
+            try:
+                clickable_elem = selected_span.find_element(By.XPATH, "./ancestor::*[@role='row' or contains(@class, 'x-boundlist-item')][1]")
+            except StaleElementReferenceException:
+                raise
+            except:
+                clickable_elem = selected_span
+        
+        # Select it
+        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", clickable_elem)
+        time.sleep(1.125)  # MAX(0.5, 50% of 0.3) = 0.5
+        self.driver.execute_script("arguments[0].click();", clickable_elem)
+        time.sleep(1.125)  # MAX(0.5, 50% of 0.5) = 0.5 - Wait for PostBack
+    
     def _get_bank_by_index(self, city_index: int, bank_index: int, city_already_selected: bool = False) -> str:
         """Get bank name by index from dropdown ext-gen1069. Returns bank name or None if not found.
         
@@ -1684,21 +1910,11 @@ class OJKExtJSScraper:
             self.driver.switch_to.default_content()
             time.sleep(0.75)  # MAX(0.5, 50% of 0.3) = 0.5
             
-            # Close any open dropdowns by pressing ESC
-            try:
-                from selenium.webdriver.common.keys import Keys
-                body = self.driver.find_element(By.TAG_NAME, "body")
-                body.send_keys(Keys.ESCAPE)
-                time.sleep(1.125)  # MAX(0.5, 50% of 0.3) = 0.5
-            except:
-                pass
+            # Close any open dropdowns
+            self._close_open_dropdowns()
             
             # Click Tampilkan button
-            tampilkan_button = None
-            try:
-                tampilkan_button = self.driver.find_element(By.ID, "ShowReportButton-btnInnerEl")
-            except:
-                tampilkan_button = self.driver.find_element(By.XPATH, "//span[contains(text(), 'Tampilkan')]")
+            tampilkan_button = self._find_tampilkan_button()
             
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tampilkan_button)
             time.sleep(0.75)
@@ -1734,11 +1950,7 @@ class OJKExtJSScraper:
                         print(f"  [WARNING] Bad Request terdeteksi, mencoba klik Tampilkan lagi (percobaan {retry_attempt + 1}/{max_retries})...")
                         # Re-click Tampilkan button
                         try:
-                            tampilkan_button = None
-                            try:
-                                tampilkan_button = self.driver.find_element(By.ID, "ShowReportButton-btnInnerEl")
-                            except:
-                                tampilkan_button = self.driver.find_element(By.XPATH, "//span[contains(text(), 'Tampilkan')]")
+                            tampilkan_button = self._find_tampilkan_button()
                             
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tampilkan_button)
                             time.sleep(1.125)
@@ -1839,12 +2051,7 @@ class OJKExtJSScraper:
         - 09 is September
         - 12 is Desember
         """
-        month_map = {
-            'januari': '01', 'februari': '02', 'maret': '03', 'april': '04',
-            'mei': '05', 'juni': '06', 'juli': '07', 'agustus': '08',
-            'september': '09', 'oktober': '10', 'november': '11', 'desember': '12'
-        }
-        return month_map.get(month_name.lower(), '12')
+        return self.MONTH_NUMBERS.get(month_name.lower(), '12')
     
     def _get_excel_filename(self, month: str, year: str) -> str:
         """
@@ -2689,6 +2896,16 @@ class OJKExtJSScraper:
         print(f"    [DEBUG] Wait completed. Found identifiers: {found_identifiers}")
         return True
     
+    def _get_report_html(self) -> str:
+        """
+        Get the report HTML of the current frame (document.body.innerHTML, like
+        _get_page_source_with_iframe), instead of serializing the whole page_source
+        
+        Returns:
+            body innerHTML of the current frame (empty string if there is no body yet)
+        """
+        return self.driver.execute_script("return document.body ? document.body.innerHTML : '';") or ""
+    
     def _extract_report_data(self, selected_year: str, city: str = None, bank: str = None, extract_mode: str = 'sheets_1_3', skip_wait_attempts: bool = False, skip_laba_kotor: bool = False, skip_rasio: bool = False) -> dict:
         """
         Extract financial data from the generated report
@@ -2707,7 +2924,7 @@ class OJKExtJSScraper:
         """
         try:
             # Try to find report in iframe first, then main page
-            print("    [DEBUG] Checking for report in iframes...")
+            logger.debug("Checking for report in iframes...")
             iframes = self.driver.find_elements(By.TAG_NAME, "iframe")
             page_source = None
             
@@ -2719,7 +2936,7 @@ class OJKExtJSScraper:
                     iframe_source = self.driver.page_source
                     if ("Kredit" in iframe_source or "Aset" in iframe_source or "DPK" in iframe_source or
                         "LABA" in iframe_source or "Rasio" in iframe_source or "KPMM" in iframe_source):
-                        print("    [DEBUG] Found report content in iframe")
+                        logger.debug("Found report content in iframe")
                         page_source = iframe_source
                         report_iframe = iframe  # Keep reference to the iframe
                         # Stay in iframe context for XPath searches
@@ -2731,7 +2948,7 @@ class OJKExtJSScraper:
 
             # If not in iframe, use main page
             if page_source is None:
-                print("    [DEBUG] Using main page source")
+                logger.debug("Using main page source")
                 self.driver.switch_to.default_content()
                 page_source = self.driver.page_source
             # else: Stay in iframe context - don't switch back yet
@@ -2752,21 +2969,23 @@ class OJKExtJSScraper:
                 "Non Performing Loan"
             ]
             
-            def check_identifiers_in_soup(soup: BeautifulSoup, identifiers: list, extract_mode: str = 'sheets_1_3') -> tuple[bool, str]:
+            def check_identifiers_in_source(page_source: str, identifiers: list, extract_mode: str = 'sheets_1_3') -> tuple[bool, str]:
                 """
-                Check if identifiers exist in BeautifulSoup and have valid data records
-                Simplified: just check if identifier exists and has next divs (data)
+                Check if identifiers exist in the raw page source (case-insensitive substring search)
+                BeautifulSoup is only needed once the page is ready, so the wait loop never parses
                 
                 For sheets_4_5 mode: Must find BOTH Laba Kotor and Rasio identifiers
                 
                 Args:
-                    soup: BeautifulSoup object to check
+                    page_source: Raw HTML of the report
                     identifiers: List of identifier strings to check for
                     extract_mode: 'sheets_1_3' or 'sheets_4_5'
                     
                 Returns:
                     Tuple of (found: bool, identifier_name: str)
                 """
+                page_source_upper = page_source.upper()
+                
                 if extract_mode == 'sheets_4_5':
                     # For sheets_4_5, we need BOTH Laba Kotor and Rasio identifiers
                     laba_kotor_identifier = "LABA (RUGI) TAHUN BERJALAN SEBELUM PAJAK PENGHASILAN"
@@ -2776,53 +2995,9 @@ class OJKExtJSScraper:
                         "Non Performing Loan"
                     ]
                     
-                    laba_kotor_found = False
-                    rasio_found = False
-                    found_rasio_identifier = ""
-                    
-                    # Check for Laba Kotor identifier
-                    for div in soup.find_all('div'):
-                        text = div.get_text(strip=True)
-                        if not text or len(text) > 5000:
-                            continue
-                        
-                        if laba_kotor_identifier.lower() in text.lower():
-                            text_lower = text.lower()
-                            identifier_lower = laba_kotor_identifier.lower()
-                            
-                            if len(text) < 200 or text_lower.startswith(identifier_lower) or text_lower.endswith(identifier_lower):
-                                all_divs = soup.find_all('div')
-                                try:
-                                    div_index = all_divs.index(div)
-                                    if div_index < len(all_divs) - 1:
-                                        laba_kotor_found = True
-                                        break
-                                except ValueError:
-                                    pass
-                    
-                    # Check for Rasio identifier
-                    for rasio_id in rasio_identifiers:
-                        for div in soup.find_all('div'):
-                            text = div.get_text(strip=True)
-                            if not text or len(text) > 5000:
-                                continue
-                            
-                            if rasio_id.lower() in text.lower():
-                                text_lower = text.lower()
-                                identifier_lower = rasio_id.lower()
-                                
-                                if len(text) < 200 or text_lower.startswith(identifier_lower) or text_lower.endswith(identifier_lower):
-                                    all_divs = soup.find_all('div')
-                                    try:
-                                        div_index = all_divs.index(div)
-                                        if div_index < len(all_divs) - 1:
-                                            rasio_found = True
-                                            found_rasio_identifier = rasio_id
-                                            break
-                                    except ValueError:
-                                        pass
-                        if rasio_found:
-                            break
+                    laba_kotor_found = laba_kotor_identifier.upper() in page_source_upper
+                    found_rasio_identifier = next((rasio_id for rasio_id in rasio_identifiers if rasio_id.upper() in page_source_upper), "")
+                    rasio_found = bool(found_rasio_identifier)
                     
                     # Both must be found for sheets_4_5
                     if laba_kotor_found and rasio_found:
@@ -2836,35 +3011,8 @@ class OJKExtJSScraper:
                 else:
                     # For sheets_1_3, check any identifier
                     for identifier in identifiers:
-                        # Find the <div> whose text contains our identifier
-                        # Be more specific: skip very long divs (entire page content)
-                        for div in soup.find_all('div'):
-                            text = div.get_text(strip=True)
-                            if not text:
-                                continue
-                            
-                            # Skip divs that are too long (likely contain entire page content)
-                            if len(text) > 5000:
-                                continue
-                            
-                            if identifier.lower() in text.lower():
-                                # Prefer divs where identifier is a significant part of the text
-                                text_lower = text.lower()
-                                identifier_lower = identifier.lower()
-                                
-                                # If text is short or identifier is at the start/end, it's likely the right div
-                                if len(text) < 200 or text_lower.startswith(identifier_lower) or text_lower.endswith(identifier_lower):
-                                    # Check if there are divs after this one (indicating data is present)
-                                    all_divs = soup.find_all('div')
-                                    try:
-                                        div_index = all_divs.index(div)
-                                        # If there are more divs after this identifier div, data is likely present
-                                        if div_index < len(all_divs) - 1:
-                                            return True, identifier
-                                    except ValueError:
-                                        # div not in all_divs (shouldn't happen, but handle it)
-                                        pass
-                                    break  # Found identifier, no need to continue searching
+                        if identifier.upper() in page_source_upper:
+                            return True, identifier
                     return False, ""
             
             def refresh_page_source(report_iframe_ref) -> tuple[str, object]:
@@ -2881,7 +3029,7 @@ class OJKExtJSScraper:
                     # We're in iframe context, refresh iframe source
                     try:
                         self.driver.switch_to.frame(report_iframe_ref)
-                        new_page_source = self.driver.page_source
+                        new_page_source = self._get_report_html()
                         return new_page_source, report_iframe_ref
                     except:
                         # Iframe might have changed, find it again
@@ -2893,18 +3041,18 @@ class OJKExtJSScraper:
                                 iframe_source = self.driver.page_source
                                 if ("Kredit" in iframe_source or "Aset" in iframe_source or "DPK" in iframe_source or
                                     "LABA" in iframe_source or "Rasio" in iframe_source or "KPMM" in iframe_source):
-                                    return iframe_source, iframe
+                                    return self._get_report_html(), iframe
                                 self.driver.switch_to.default_content()
                             except:
                                 self.driver.switch_to.default_content()
                                 continue
                         # Fallback to main page if iframe not found
                         self.driver.switch_to.default_content()
-                        return self.driver.page_source, None
+                        return self._get_report_html(), None
                 else:
                     # Using main page, refresh main page source
                     self.driver.switch_to.default_content()
-                    return self.driver.page_source, None
+                    return self._get_report_html(), None
             
             # Validation: Wait for page to fully load by checking if records are found by identifiers
             # Skip wait attempts if period error was found and handled
@@ -2921,26 +3069,20 @@ class OJKExtJSScraper:
                 max_wait_attempts = 30  # Maximum 30 attempts = 200 seconds (20 * 10s = 200s)
                 wait_interval = 10  # Wait 10 seconds between checks
             page_fully_loaded = False   
-            soup = None
             
             for attempt in range(max_wait_attempts):
-                # Always refresh page_source and re-parse BeautifulSoup to get latest content
-                print(f"    [INFO] Percobaan {attempt + 1}/{max_wait_attempts}: Memperbarui page_source dan mem-parse ulang BeautifulSoup...")
+                # Always refresh page_source to get latest content
+                print(f"    [INFO] Percobaan {attempt + 1}/{max_wait_attempts}: Memperbarui page_source...")
                 page_source, report_iframe = refresh_page_source(report_iframe)
                 
-                # Re-parse BeautifulSoup with fresh page_source
-                soup = BeautifulSoup(page_source, 'html.parser')
-                print(f"    [DEBUG] BeautifulSoup telah di-parse ulang (ukuran: {len(page_source)} karakter)")
-                
                 # Check for "Bad Request" error
                 bad_request_found = False
-                page_source_lower = page_source.lower()
-                if 'bad request' in page_source_lower:
+                if _BAD_REQUEST_RE.search(page_source):
                     bad_request_found = True
                     print(f"    [WARNING] 'Bad Request' ditemukan dalam halaman (percobaan {attempt + 1})")
                 
-                # Check if identifiers exist in the parsed BeautifulSoup
-                record_found, found_identifier = check_identifiers_in_soup(soup, identifiers_to_check, extract_mode)
+                # Check if identifiers exist in the raw page source (no BeautifulSoup parse per attempt)
+                record_found, found_identifier = check_identifiers_in_source(page_source, identifiers_to_check, extract_mode)
                 
                 if bad_request_found:
                     # Bad Request found, will be handled by retry logic
@@ -2968,7 +3110,7 @@ class OJKExtJSScraper:
             if not page_fully_loaded and not bad_request_found:
                 # Final check for Bad Request
                 page_source, report_iframe = refresh_page_source(report_iframe)
-                if 'bad request' in page_source.lower():
+                if _BAD_REQUEST_RE.search(page_source):
                     bad_request_found = True
                     print(f"    [WARNING] 'Bad Request' ditemukan setelah menunggu")
             
@@ -2979,10 +3121,10 @@ class OJKExtJSScraper:
             if not page_fully_loaded:
                 print("    [WARNING] Halaman mungkin belum sepenuhnya dimuat - Identifier tidak ditemukan setelah waktu tunggu maksimum")
                 print("    [WARNING] Melanjutkan ekstraksi dengan data yang tersedia...")
-                # Ensure soup is parsed with latest page_source
-                if soup is None:
-                    page_source, report_iframe = refresh_page_source(report_iframe)
-                soup = BeautifulSoup(page_source, 'html.parser')
+            
+            # Parse once, with the page_source that passed the check (or the latest one after the wait)
+            soup = BeautifulSoup(page_source, 'html.parser')
+            logger.debug("BeautifulSoup di-parse (ukuran: %s karakter)", len(page_source))
             
             # Helper function to split concatenated numbers (current year + previous year)
             def split_concatenated_numbers(text: str) -> tuple[str, str]:
@@ -2998,14 +3140,11 @@ class OJKExtJSScraper:
                 if not text or ',' not in text:
                     return text, ""
                 
-                import re
-                
                 # Find the split point: look for pattern where after comma, we have 3 digits, then a digit (not comma)
                 # Pattern: comma, then exactly 3 digits, then a digit (not comma)
                 # This indicates the start of the next year
                 # Example: "23,122,1223" -> split after "122" (3 digits), before "3" (digit)
-                pattern = r',(\d{3})(\d)(?=,|\d|$)'
-                match = re.search(pattern, text)
+                match = _SPLIT_RE.search(text)
                 
                 if match:
                     # Found split point: the digit after the 3-digit group starts the next year
@@ -3017,7 +3156,7 @@ class OJKExtJSScraper:
                     # Remove leading comma from previous year if any
                     previous_year_text = previous_year_text.lstrip(',')
                     
-                    print(f"      [DEBUG] Split '{text}' -> Current: '{current_year_text}', Previous: '{previous_year_text}'")
+                    logger.debug("Split '%s' -> Current: '%s', Previous: '%s'", text, current_year_text, previous_year_text)
                     return current_year_text, previous_year_text
                 
                 # No split found, return original text as current year
@@ -3034,14 +3173,14 @@ class OJKExtJSScraper:
                 text = text.replace('\xa0', ' ').replace('&nbsp;', ' ').strip()
                 
                 # Keep digits only (we just need whole numbers)
-                digits_only = re.sub(r'\D', '', text)
+                digits_only = _NONDIGIT_RE.sub('', text)
                 if not digits_only:
-                    print(f"      [DEBUG]     Failed to extract number from: '{original_text}'")
+                    logger.debug("    Failed to extract number from: '%s'", original_text)
                     return 0.0
                 
                 value = float(digits_only)
                 if original_text.strip() != digits_only:
-                    print(f"      [DEBUG]     Raw: '{original_text}' -> Digits: '{digits_only}' -> Number: {value}")
+                    logger.debug("    Raw: '%s' -> Digits: '%s' -> Number: %s", original_text, digits_only, value)
                 return value
             
             # Helper function to find identifier and get next 2 div values using BeautifulSoup
@@ -3054,129 +3193,126 @@ class OJKExtJSScraper:
                 
                 # 1. Find the <div> whose text contains our identifier
                 # Be more specific: look for divs where identifier is the main/only text, not in huge text blocks
+                # Only a text node containing the identifier can make a div match, so just the <div>
+                # ancestors of matching text nodes are checked (outermost first = document order)
+                # instead of calling get_text() on every div in the page
                 label_div = None
-                all_divs = soup.find_all('div')
+                identifier_lower = identifier.lower()
+                checked_divs = set()
                 
-                for div in all_divs:
-                    text = div.get_text(strip=True)
-                    if not text:
-                        continue
-                    
-                    # Skip divs that are too long (likely contain entire page content)
-                    if len(text) > 5000:  # Skip very long divs (entire page content)
-                        continue
-                    
-                    # Check if identifier is in text
-                    if identifier.lower() in text.lower():
+                for string in soup.find_all(string=re.compile(re.escape(identifier), re.IGNORECASE)):
+                    div_ancestors = [parent for parent in string.parents if parent.name == 'div']
+                    for div in reversed(div_ancestors):
+                        if id(div) in checked_divs:
+                            continue
+                        checked_divs.add(id(div))
+                        
+                        text = div.get_text(strip=True)
+                        
+                        # Skip divs that are too long (likely contain entire page content)
+                        if len(text) > 5000:  # Skip very long divs (entire page content)
+                            continue
+                        
                         # Prefer divs where identifier is a significant part of the text
                         # or where text is relatively short (more specific match)
                         text_lower = text.lower()
-                        identifier_lower = identifier.lower()
                         
                         # If text is short or identifier is at the start/end, it's likely the right div
-                        if len(text) < 200 or text_lower.startswith(identifier_lower) or text_lower.endswith(identifier_lower):
+                        if identifier_lower in text_lower and (len(text) < 200 or text_lower.startswith(identifier_lower) or text_lower.endswith(identifier_lower)):
                             label_div = div
-                            print(f"    [DEBUG] Found identifier '{identifier}' in <div>: '{text[:100]}...' (length: {len(text)})")
+                            logger.debug("Found identifier '%s' in <div>: '%s...' (length: %s)", identifier, text[:100], len(text))
                             break
                         # Otherwise, continue searching for a better match
+                    
+                    if label_div:
+                        break
                 
                 if not label_div:
-                    print(f"    [DEBUG] Identifier '{identifier}' NOT FOUND in page")
+                    logger.debug("Identifier '%s' NOT FOUND in page", identifier)
                     return values
                 
-                # 2. Find the index of this div and get the next divs that contain numeric values
-                try:
-                    div_index = all_divs.index(label_div)
-                    # Look through next divs to find numeric values (up to 10 divs ahead)
-                    numeric_count = 0
-                    for j in range(1, min(11, len(all_divs) - div_index)):  # Check up to 10 next divs
-                        if numeric_count >= 2:  # We need 2 values
-                            break
-                            
-                        if div_index + j < len(all_divs):
-                            next_div = all_divs[div_index + j]
-                            div_text = next_div.get_text(strip=True)
-                            
-                            if not div_text:
-                                continue
-                            
-                            # Skip very long divs (likely contain entire page content)
-                            if len(div_text) > 5000:
-                                continue
-                            
-                            # Skip if it's clearly another identifier (contains common identifier keywords)
-                            if any(keyword in div_text.lower() for keyword in ['kepada', 'pihak', 'bank', 'bpr', 'report viewer', 'configuration error']):
-                                # This is likely another identifier or error message, skip it
-                                continue
-                            
-                            # Check if this div contains numbers (might be formatted like "1.234.567" or "1,234,567")
-                            # It might also contain concatenated numbers like "23,122,1223,112,122"
+                # 2. Get the next divs (in document order) that contain numeric values
+                # Look through next divs to find numeric values (up to 10 divs ahead)
+                numeric_count = 0
+                for j, next_div in enumerate(label_div.find_all_next('div', limit=10), start=1):  # Check up to 10 next divs
+                    if numeric_count >= 2:  # We need 2 values
+                        break
+                    
+                    div_text = next_div.get_text(strip=True)
+                    
+                    if not div_text:
+                        continue
+                    
+                    # Skip very long divs (likely contain entire page content)
+                    if len(div_text) > 5000:
+                        continue
+                    
+                    # Skip if it's clearly another identifier (contains common identifier keywords)
+                    if any(keyword in div_text.lower() for keyword in ['kepada', 'pihak', 'bank', 'bpr', 'report viewer', 'configuration error']):
+                        # This is likely another identifier or error message, skip it
+                        continue
+                    
+                    # Check if this div contains numbers (might be formatted like "1.234.567" or "1,234,567")
+                    # It might also contain concatenated numbers like "23,122,1223,112,122"
+                    
+                    # Check if it contains concatenated numbers (has comma and might have split pattern)
+                    if ',' in div_text and len(div_text) > 10:
+                        # Try to split concatenated numbers
+                        current_year_text, prev_year_text = split_concatenated_numbers(div_text)
+                        
+                        if prev_year_text:
+                            # Found concatenated numbers, extract both
+                            current_number = extract_number(current_year_text)
+                            prev_number = extract_number(prev_year_text)
                             
-                            # Check if it contains concatenated numbers (has comma and might have split pattern)
-                            if ',' in div_text and len(div_text) > 10:
-                                # Try to split concatenated numbers
-                                current_year_text, prev_year_text = split_concatenated_numbers(div_text)
+                            # Validate numbers are reasonable
+                            if (current_number > 0 and current_number < 1e15 and current_number != float('inf') and
+                                prev_number >= 0 and prev_number < 1e15 and prev_number != float('inf')):
                                 
-                                if prev_year_text:
-                                    # Found concatenated numbers, extract both
-                                    current_number = extract_number(current_year_text)
-                                    prev_number = extract_number(prev_year_text)
-                                    
-                                    # Validate numbers are reasonable
-                                    if (current_number > 0 and current_number < 1e15 and current_number != float('inf') and
-                                        prev_number >= 0 and prev_number < 1e15 and prev_number != float('inf')):
-                                        
-                                        if numeric_count == 0:
-                                            # Add current year first
-                                            print(f"    [DEBUG]   Next div[{j}] (Year {selected_year}): "
-                                                  f"'{div_text}' -> Split: '{current_year_text}' = {current_number}")
-                                            values.append(current_number)
-                                            numeric_count += 1
-                                        
-                                        if numeric_count == 1:
-                                            # Add previous year
-                                            print(f"    [DEBUG]   Next div[{j}] (Year {previous_year}): "
-                                                  f"'{div_text}' -> Split: '{prev_year_text}' = {prev_number}")
-                                            values.append(prev_number)
-                                            numeric_count += 1
-                                        
-                                        # Got both values, break
-                                        if numeric_count >= 2:
-                                            break
-                                        continue
-                            
-                            # Check if this div looks like it contains a single formatted number
-                            # It should be relatively short and contain digits with possible formatting
-                            if len(div_text) > 100:
-                                # Too long, probably not a single number (unless it's concatenated, which we handled above)
+                                if numeric_count == 0:
+                                    # Add current year first
+                                    logger.debug("  Next div[%s] (Year %s): '%s' -> Split: '%s' = %s", j, selected_year, div_text, current_year_text, current_number)
+                                    values.append(current_number)
+                                    numeric_count += 1
+                                
+                                if numeric_count == 1:
+                                    # Add previous year
+                                    logger.debug("  Next div[%s] (Year %s): '%s' -> Split: '%s' = %s", j, previous_year, div_text, prev_year_text, prev_number)
+                                    values.append(prev_number)
+                                    numeric_count += 1
+                                
+                                # Got both values, break
+                                if numeric_count >= 2:
+                                    break
                                 continue
-                            
-                            # Extract number from single number text
-                            number = extract_number(div_text)
-                            
-                            # Validate the number is reasonable (not infinity and not too large)
-                            # Indonesian Rupiah values are typically in millions/billions, so cap at 1e15
-                            if number > 0 and number < 1e15 and number != float('inf'):
-                                year_label = selected_year if numeric_count == 0 else previous_year
-                                print(f"    [DEBUG]   Next div[{j}] (Year {year_label}): "
-                                      f"'{div_text}' -> {number}")
-                                values.append(number)
-                                numeric_count += 1
-                            elif number == 0 and any(char.isdigit() for char in div_text) and len(div_text) < 50:
-                                # Zero value is valid if it's a short text with digits
-                                year_label = selected_year if numeric_count == 0 else previous_year
-                                print(f"    [DEBUG]   Next div[{j}] (Year {year_label}): "
-                                      f"'{div_text}' -> {number}")
-                                values.append(number)
-                                numeric_count += 1
-                except ValueError:
-                    print(f"    [DEBUG] Identifier '{identifier}' found but couldn't find its index")
-                    return values
+                    
+                    # Check if this div looks like it contains a single formatted number
+                    # It should be relatively short and contain digits with possible formatting
+                    if len(div_text) > 100:
+                        # Too long, probably not a single number (unless it's concatenated, which we handled above)
+                        continue
+                    
+                    # Extract number from single number text
+                    number = extract_number(div_text)
+                    
+                    # Validate the number is reasonable (not infinity and not too large)
+                    # Indonesian Rupiah values are typically in millions/billions, so cap at 1e15
+                    if number > 0 and number < 1e15 and number != float('inf'):
+                        year_label = selected_year if numeric_count == 0 else previous_year
+                        logger.debug("  Next div[%s] (Year %s): '%s' -> %s", j, year_label, div_text, number)
+                        values.append(number)
+                        numeric_count += 1
+                    elif number == 0 and any(char.isdigit() for char in div_text) and len(div_text) < 50:
+                        # Zero value is valid if it's a short text with digits
+                        year_label = selected_year if numeric_count == 0 else previous_year
+                        logger.debug("  Next div[%s] (Year %s): '%s' -> %s", j, year_label, div_text, number)
+                        values.append(number)
+                        numeric_count += 1
                 
                 if not values:
-                    print(f"    [DEBUG] Identifier '{identifier}' found but no numeric values extracted from next divs")
+                    logger.debug("Identifier '%s' found but no numeric values extracted from next divs", identifier)
                 elif len(values) == 1:
-                    print(f"    [DEBUG] Identifier '{identifier}' found but only 1 value extracted")
+                    logger.debug("Identifier '%s' found but only 1 value extracted", identifier)
                 
                 return values
             
@@ -3204,8 +3340,8 @@ class OJKExtJSScraper:
                         try:
                             # Look for city input field
                             city_inputs = [
-                                self.driver.find_elements(By.XPATH, "//input[contains(@id, 'City') or contains(@id, 'Kota') or contains(@id, 'Kabupaten')]"),
-                                self.driver.find_elements(By.XPATH, "//input[contains(@name, 'City') or contains(@name, 'Kota') or contains(@name, 'Kabupaten')]")
+                                self.driver.find_elements(By.CSS_SELECTOR, "input[id*='City'], input[id*='Kota'], input[id*='Kabupaten']"),
+                                self.driver.find_elements(By.CSS_SELECTOR, "input[name*='City'], input[name*='Kota'], input[name*='Kabupaten']")
                             ]
                             for inputs in city_inputs:
                                 for inp in inputs:
@@ -3218,24 +3354,24 @@ class OJKExtJSScraper:
                                             value_lower = value.strip().lower()
                                             # Reject if it's a month name
                                             if value_lower in month_names:
-                                                print(f"    [DEBUG] Rejected month name as city: '{value}'")
+                                                logger.debug("Rejected month name as city: '%s'", value)
                                                 continue
                                             extracted_city = value.strip()
-                                            print(f"    [DEBUG] Found city from input field: '{extracted_city}'")
+                                            logger.debug("Found city from input field: '%s'", extracted_city)
                                             break
                                     except:
                                         continue
                                 if extracted_city:
                                     break
                         except Exception as e:
-                            print(f"    [DEBUG] Could not find city input: {e}")
+                            logger.debug("Could not find city input: %s", e)
                     
                     if not extracted_bank:
                         try:
                             # Look for bank input field
                             bank_inputs = [
-                                self.driver.find_elements(By.XPATH, "//input[contains(@id, 'Bank')]"),
-                                self.driver.find_elements(By.XPATH, "//input[contains(@name, 'Bank')]")
+                                self.driver.find_elements(By.CSS_SELECTOR, "input[id*='Bank']"),
+                                self.driver.find_elements(By.CSS_SELECTOR, "input[name*='Bank']")
                             ]
                             for inputs in bank_inputs:
                                 for inp in inputs:
@@ -3243,14 +3379,14 @@ class OJKExtJSScraper:
                                         value = inp.get_attribute('value')
                                         if value and value.strip():
                                             extracted_bank = value.strip()
-                                            print(f"    [DEBUG] Found bank from input field: '{extracted_bank}'")
+                                            logger.debug("Found bank from input field: '%s'", extracted_bank)
                                             break
                                     except:
                                         continue
                                 if extracted_bank:
                                     break
                         except Exception as e:
-                            print(f"    [DEBUG] Could not find bank input: {e}")
+                            logger.debug("Could not find bank input: %s", e)
                     
                     # Fallback: Try to find from BeautifulSoup parsed page
                     if not extracted_city or not extracted_bank:
@@ -3267,10 +3403,10 @@ class OJKExtJSScraper:
                                     value_lower = value.strip().lower()
                                     # Reject if it's a month name
                                     if value_lower in month_names:
-                                        print(f"    [DEBUG] Rejected month name as city: '{value}'")
+                                        logger.debug("Rejected month name as city: '%s'", value)
                                         continue
                                     extracted_city = value.strip()
-                                    print(f"    [DEBUG] Found city from soup: '{extracted_city}'")
+                                    logger.debug("Found city from soup: '%s'", extracted_city)
                                     break
                         
                         if not extracted_bank:
@@ -3278,7 +3414,7 @@ class OJKExtJSScraper:
                                 value = inp.get('value', '')
                                 if value and value.strip():
                                     extracted_bank = value.strip()
-                                    print(f"    [DEBUG] Found bank from soup: '{extracted_bank}'")
+                                    logger.debug("Found bank from soup: '%s'", extracted_bank)
                                     break
                 
                 except Exception as e:
@@ -3312,13 +3448,13 @@ class OJKExtJSScraper:
                             kredit_selected_year += values[0]  # First div (current year)
                             kredit_previous_year += values[1]  # Second div (previous year)
                             found_identifiers.add(identifier_key)
-                            print(f"    [DEBUG] Added Kredit from '{identifier}': {values[0]} (2024) + {values[1]} (2023)")
+                            logger.debug("Added Kredit from '%s': %s (2024) + %s (2023)", identifier, values[0], values[1])
                     elif len(values) == 1:
                         identifier_key = identifier.strip().lower()
                         if identifier_key not in found_identifiers:
                             kredit_selected_year += values[0]  # Only current year available
                             found_identifiers.add(identifier_key)
-                            print(f"    [DEBUG] Added Kredit from '{identifier}': {values[0]} (2024 only)")
+                            logger.debug("Added Kredit from '%s': %s (2024 only)", identifier, values[0])
                 
                 result[f'Kredit {selected_year}'] = kredit_selected_year
                 result[f'Kredit {previous_year}'] = kredit_previous_year
@@ -3362,13 +3498,13 @@ class OJKExtJSScraper:
                             dpk_selected_year += values[0]  # First div (current year)
                             dpk_previous_year += values[1]  # Second div (previous year)
                             found_dpk_identifiers.add(identifier_key)
-                            print(f"    [DEBUG] Added DPK from '{identifier}': {values[0]} (2024) + {values[1]} (2023)")
+                            logger.debug("Added DPK from '%s': %s (2024) + %s (2023)", identifier, values[0], values[1])
                     elif len(values) == 1:
                         identifier_key = identifier.strip().lower()
                         if identifier_key not in found_dpk_identifiers:
                             dpk_selected_year += values[0]  # Only current year available
                             found_dpk_identifiers.add(identifier_key)
-                            print(f"    [DEBUG] Added DPK from '{identifier}': {values[0]} (2024 only)")
+                            logger.debug("Added DPK from '%s': %s (2024 only)", identifier, values[0])
                 
                 result[f'DPK {selected_year}'] = dpk_selected_year
                 result[f'DPK {previous_year}'] = dpk_previous_year
@@ -3420,18 +3556,17 @@ class OJKExtJSScraper:
                         Values can be negative in parentheses like (677,555,231).
                         Returns tuple of (current_year_value, previous_year_value)
                         """
-                        import re
+                        needle = identifier_text.upper()
                         
                         for div in soup.find_all('div'):
                             text = div.get_text(strip=True)
-                            if identifier_text.upper() in text.upper() and len(text) < 5000:
-                                # Find the parent <td> or <tr> (table row)
-                                parent_td = div.find_parent('td')
+                            # Cheap length check first, so oversized divs never get upper-cased
+                            if len(text) < 5000 and needle in text.upper():
+                                # Find the parent <td> and <tr> (table row) in one upward walk
+                                parent_td, parent_tr = self._find_parent_td_tr(div)
                                 if not parent_td:
                                     continue
                                 
-                                # Find the parent <tr> (table row) to get all <td> elements in the row
-                                parent_tr = parent_td.find_parent('tr')
                                 if not parent_tr:
                                     # If no <tr>, try to find subsequent <td> elements from the same parent
                                     parent_td_siblings = parent_td.find_next_siblings('td')
@@ -3451,7 +3586,6 @@ class OJKExtJSScraper:
                                 # Extract values from subsequent <td> elements (skip the identifier <td>)
                                 # Look for numeric values in <td> elements (may have multiple <td> elements to check)
                                 values = []
-                                import re
                                 for td in tds[identifier_td_index + 1:identifier_td_index + 10]:  # Check more <td> elements to find numeric values
                                     # Look for <div> inside the <td>
                                     td_div = td.find('div')
@@ -3461,8 +3595,7 @@ class OJKExtJSScraper:
                                             # Check if this looks like a number (contains digits, possibly with parentheses and commas)
                                             # Pattern: optional parentheses, digits with commas, optional decimal part
                                             # Examples: "(677,555,231)", "1,223", "123.45"
-                                            numeric_pattern = r'^\(?[\d,]+\.?\d*\)?$'
-                                            if re.match(numeric_pattern, td_text.replace(' ', '')):
+                                            if _NUMERIC_RE.match(td_text.replace(' ', '')):
                                                 values.append(td_text)
                                                 if len(values) >= 2:  # Stop after finding 2 numeric values
                                                     break
@@ -3471,145 +3604,142 @@ class OJKExtJSScraper:
                                 if len(values) >= 2:
                                     # Two values: first is previous year, second is current year
                                     try:
-                                        # Parse first value (previous year)
-                                        val1_text = values[0].strip()
-                                        is_negative1 = val1_text.startswith('(') and val1_text.endswith(')')
-                                        if is_negative1:
-                                            val1_text = val1_text[1:-1].strip()  # Remove parentheses
-                                        # Remove commas (thousands separators) and convert to float
-                                        val1_text = val1_text.replace(',', '')
-                                        val1 = float(val1_text)
-                                        if is_negative1:
-                                            val1 = -val1
-                                        
-                                        # Parse second value (current year)
-                                        val2_text = values[1].strip()
-                                        is_negative2 = val2_text.startswith('(') and val2_text.endswith(')')
-                                        if is_negative2:
-                                            val2_text = val2_text[1:-1].strip()  # Remove parentheses
-                                        # Remove commas (thousands separators) and convert to float
-                                        val2_text = val2_text.replace(',', '')
-                                        val2 = float(val2_text)
-                                        if is_negative2:
-                                            val2 = -val2
+                                        # Parse first value (previous year) and second value (current year)
+                                        val1 = self._parse_signed_value(values[0])
+                                        val2 = self._parse_signed_value(values[1])
                                         
                                         # Return as (current_year, previous_year)
                                         return (val2, val1)
                                     except Exception as e:
-                                        print(f"    [DEBUG] Error parsing two values: {e}, values: {values}")
+                                        logger.debug("Error parsing two values: %s, values: %s", e, values)
                                         pass
                                 elif len(values) == 1:
                                     # Single value: use for both years
                                     try:
-                                        val_text = values[0].strip()
-                                        is_negative = val_text.startswith('(') and val_text.endswith(')')
-                                        if is_negative:
-                                            val_text = val_text[1:-1].strip()  # Remove parentheses
-                                        # Remove commas (thousands separators) and convert to float
-                                        val_text = val_text.replace(',', '')
-                                        val = float(val_text)
-                                        if is_negative:
-                                            val = -val
+                                        val = self._parse_signed_value(values[0])
                                         # Use same value for both years
                                         return (val, val)
                                     except Exception as e:
-                                        print(f"    [DEBUG] Error parsing single value: {e}, value: {values[0]}")
+                                        logger.debug("Error parsing single value: %s, value: %s", e, values[0])
                                         pass
                         
                         return (0.0, 0.0)
                     
-                    def extract_ratio_value(identifier_text: str) -> float:
+                    def extract_ratio_value_from_div(identifier_text: str, div) -> float:
                         """
-                        Extract Rasio value from table structure.
+                        Extract Rasio value from the table row of an identifier <div>.
                         After finding identifier in <td>, check each sibling <td>:
                         - If <td> has no <div> child, skip to next <td>
                         - If <td> has <div> child, extract text and check if it's a number with decimal point
+                        Returns None if no value is found in the row.
                         """
-                        import re
-                        print(f"    [DEBUG] Searching for ratio identifier: '{identifier_text}'")
-                        found_identifier = False
-                        for div in soup.find_all('div'):
+                        # Find the parent <td> and <tr> (table row) in one upward walk
+                        parent_td, parent_tr = self._find_parent_td_tr(div)
+                        if not parent_td:
+                            return None
+                        
+                        if not parent_tr:
+                            return None
+                        
+                        # Get all <td> elements in the row
+                        tds = parent_tr.find_all('td')
+                        
+                        # Find the index of the identifier <td>
+                        try:
+                            identifier_td_index = tds.index(parent_td)
+                        except:
+                            return None
+                        
+                        logger.debug("Found identifier '%s' at td index %s, checking next tds...", identifier_text, identifier_td_index)
+                        
+                        # Check each sibling <td> after the identifier
+                        for td_idx, td in enumerate(tds[identifier_td_index + 1:identifier_td_index + 30], start=identifier_td_index + 1):  # Check up to 30 <td> elements
+                            # Check if this <td> has a <div> child
+                            td_div = td.find('div', recursive=False)  # Only direct child, not nested
+                            if not td_div:
+                                # Try to find any div (including nested)
+                                td_div = td.find('div')
+                            
+                            if not td_div:
+                                # No div found in this td, skip to next
+                                logger.debug("  td[%s]: no div child, skipping", td_idx)
+                                continue
+                            
+                            # Get text from the <div> (bs4 already decodes &nbsp; to \xa0)
+                            div_text_clean = td_div.get_text(strip=True).replace('\xa0', ' ').strip()
+                            
+                            logger.debug("  td[%s]: found div with text='%s'", td_idx, div_text_clean[:50])
+                            
+                            # Skip if empty or only whitespace
+                            if not div_text_clean or div_text_clean == '':
+                                logger.debug("  td[%s]: div text is empty, skipping", td_idx)
+                                continue
+                            
+                            # Try to extract number - check if it's a valid numeric text
+                            # Remove spaces and try to parse
+                            cleaned_text = div_text_clean.replace(' ', '').replace(',', '.')
+                            
+                            # Check for negative (in parentheses)
+                            is_negative = False
+                            if cleaned_text.startswith('(') and cleaned_text.endswith(')'):
+                                is_negative = True
+                                cleaned_text = cleaned_text[1:-1].strip()
+                            elif cleaned_text.startswith('-'):
+                                is_negative = True
+                                cleaned_text = cleaned_text[1:].strip()
+                            
+                            # Try to parse as float - if it's a valid number like 0.33 or 3.25
+                            try:
+                                number = float(cleaned_text)
+                                if is_negative:
+                                    number = -number
+                                # Reasonable range check
+                                if abs(number) < 1e15:
+                                    logger.debug("Found %s ratio value at td index %s: %s", identifier_text, td_idx, number)
+                                    return number
+                            except ValueError:
+                                # Not a valid number, skip to next td
+                                logger.debug("  td[%s]: '%s' is not a valid number, skipping", td_idx, cleaned_text[:30])
+                                pass
+                        
+                        logger.debug("No ratio value found for '%s' after checking %s tds", identifier_text, min(30, len(tds) - identifier_td_index - 1))
+                        return None
+                    
+                    def extract_all_ratios(soup_to_use: BeautifulSoup, wanted: dict) -> dict:
+                        """
+                        Extract all Rasio values with a single traversal of the <div> elements.
+                        First pass records every <div> containing each identifier, then each identifier's
+                        hits are checked in page order until one yields a value (0.0 if none does).
+                        
+                        Args:
+                            soup_to_use: Parsed report page (ratio iframe)
+                            wanted: identifier text -> ratio name
+                        
+                        Returns:
+                            dict of ratio name -> value
+                        """
+                        needles = [(identifier_text, identifier_text.upper()) for identifier_text in wanted]
+                        hits = {identifier_text: [] for identifier_text in wanted}
+                        for div in soup_to_use.find_all('div'):
                             text = div.get_text(strip=True)
-                            if identifier_text.upper() in text.upper() and len(text) < 5000:
-                                found_identifier = True
-                                # Find the parent <td> element
-                                parent_td = div.find_parent('td')
-                                if not parent_td:
-                                    continue
-                                
-                                # Find the parent <tr> (table row) to get all <td> elements
-                                parent_tr = parent_td.find_parent('tr')
-                                if not parent_tr:
-                                    continue
-                                
-                                # Get all <td> elements in the row
-                                tds = parent_tr.find_all('td')
-                                
-                                # Find the index of the identifier <td>
-                                try:
-                                    identifier_td_index = tds.index(parent_td)
-                                except:
-                                    continue
-                                
-                                print(f"    [DEBUG] Found identifier '{identifier_text}' at td index {identifier_td_index}, checking next tds...")
-                                
-                                # Check each sibling <td> after the identifier
-                                for td_idx, td in enumerate(tds[identifier_td_index + 1:identifier_td_index + 30], start=identifier_td_index + 1):  # Check up to 30 <td> elements
-                                    # Check if this <td> has a <div> child
-                                    td_div = td.find('div', recursive=False)  # Only direct child, not nested
-                                    if not td_div:
-                                        # Try to find any div (including nested)
-                                        td_div = td.find('div')
-                                    
-                                    if not td_div:
-                                        # No div found in this td, skip to next
-                                        print(f"    [DEBUG]   td[{td_idx}]: no div child, skipping")
-                                        continue
-                                    
-                                    # Get text from the <div>
-                                    div_text = td_div.get_text(strip=True)
-                                    
-                                    # Remove &nbsp; entities and check if empty
-                                    div_text_clean = div_text.replace('\xa0', ' ').replace('&nbsp;', ' ').strip()
-                                    
-                                    print(f"    [DEBUG]   td[{td_idx}]: found div with text='{div_text_clean[:50]}'")
-                                    
-                                    # Skip if empty or only whitespace
-                                    if not div_text_clean or div_text_clean == '':
-                                        print(f"    [DEBUG]   td[{td_idx}]: div text is empty, skipping")
-                                        continue
-                                    
-                                    # Try to extract number - check if it's a valid numeric text
-                                    # Remove spaces and try to parse
-                                    cleaned_text = div_text_clean.replace(' ', '').replace(',', '.')
-                                    
-                                    # Check for negative (in parentheses)
-                                    is_negative = False
-                                    if cleaned_text.startswith('(') and cleaned_text.endswith(')'):
-                                        is_negative = True
-                                        cleaned_text = cleaned_text[1:-1].strip()
-                                    elif cleaned_text.startswith('-'):
-                                        is_negative = True
-                                        cleaned_text = cleaned_text[1:].strip()
-                                    
-                                    # Try to parse as float - if it's a valid number like 0.33 or 3.25
-                                    try:
-                                        number = float(cleaned_text)
-                                        if is_negative:
-                                            number = -number
-                                        # Reasonable range check
-                                        if abs(number) < 1e15:
-                                            print(f"    [DEBUG] Found {identifier_text} ratio value at td index {td_idx}: {number}")
-                                            return number
-                                    except ValueError:
-                                        # Not a valid number, skip to next td
-                                        print(f"    [DEBUG]   td[{td_idx}]: '{cleaned_text[:30]}' is not a valid number, skipping")
-                                        pass
-                                
-                                print(f"    [DEBUG] No ratio value found for '{identifier_text}' after checking {min(30, len(tds) - identifier_td_index - 1)} tds")
-                        if not found_identifier:
-                            print(f"    [DEBUG] Identifier '{identifier_text}' not found in any div element")
-                        return 0.0
+                            if len(text) >= 5000:
+                                continue
+                            text_upper = text.upper()
+                            for identifier_text, needle in needles:
+                                if needle in text_upper:
+                                    hits[identifier_text].append(div)
+                        
+                        values = {}
+                        for identifier_text, ratio_name in wanted.items():
+                            value = None
+                            for div in hits[identifier_text]:
+                                value = extract_ratio_value_from_div(identifier_text, div)
+                                if value is not None:
+                                    break
+                            if not hits[identifier_text]:
+                                logger.debug("Identifier '%s' not found in any div element", identifier_text)
+                            values[ratio_name] = value if value is not None else 0.0
+                        return values
                     
                     # Extract Laba Kotor (for Sheet 4) - skip if skip_laba_kotor is True
                     if not skip_laba_kotor:
@@ -3635,7 +3765,7 @@ class OJKExtJSScraper:
                             # Use the first (and only) iframe for ratios (1 iframe per checkbox)
                             try:
                                 self.driver.switch_to.frame(iframes[0])
-                                ratio_page_source = self.driver.page_source
+                                ratio_page_source = self._get_report_html()
                                 ratio_soup = BeautifulSoup(ratio_page_source, 'html.parser')
                                 ratio_iframe = iframes[0]
                                 print(f"    [OK] Switched to iframe for ratio extraction")
@@ -3648,100 +3778,6 @@ class OJKExtJSScraper:
                             print(f"    [WARNING] No iframes found, using current page source for ratios.")
                             ratio_soup = soup
                         
-                        # Update extract_ratio_value to use ratio_soup instead of soup
-                        def extract_ratio_value_from_soup(identifier_text: str, soup_to_use: BeautifulSoup) -> float:
-                            """
-                            Extract Rasio value from table structure using provided soup.
-                            After finding identifier in <td>, check each sibling <td>:
-                            - If <td> has no <div> child, skip to next <td>
-                            - If <td> has <div> child, extract text and check if it's a number with decimal point
-                            """
-                            import re
-                            print(f"    [DEBUG] Searching for ratio identifier: '{identifier_text}'")
-                            found_identifier = False
-                            for div in soup_to_use.find_all('div'):
-                                text = div.get_text(strip=True)
-                                if identifier_text.upper() in text.upper() and len(text) < 5000:
-                                    found_identifier = True
-                                    # Find the parent <td> element
-                                    parent_td = div.find_parent('td')
-                                    if not parent_td:
-                                        continue
-                                    
-                                    # Find the parent <tr> (table row) to get all <td> elements
-                                    parent_tr = parent_td.find_parent('tr')
-                                    if not parent_tr:
-                                        continue
-                                    
-                                    # Get all <td> elements in the row
-                                    tds = parent_tr.find_all('td')
-                                    
-                                    # Find the index of the identifier <td>
-                                    try:
-                                        identifier_td_index = tds.index(parent_td)
-                                    except:
-                                        continue
-                                    
-                                    print(f"    [DEBUG] Found identifier '{identifier_text}' at td index {identifier_td_index}, checking next tds...")
-                                    
-                                    # Check each sibling <td> after the identifier
-                                    for td_idx, td in enumerate(tds[identifier_td_index + 1:identifier_td_index + 30], start=identifier_td_index + 1):  # Check up to 30 <td> elements
-                                        # Check if this <td> has a <div> child
-                                        td_div = td.find('div', recursive=False)  # Only direct child, not nested
-                                        if not td_div:
-                                            # Try to find any div (including nested)
-                                            td_div = td.find('div')
-                                        
-                                        if not td_div:
-                                            # No div found in this td, skip to next
-                                            print(f"    [DEBUG]   td[{td_idx}]: no div child, skipping")
-                                            continue
-                                        
-                                        # Get text from the <div>
-                                        div_text = td_div.get_text(strip=True)
-                                        
-                                        # Remove &nbsp; entities and check if empty
-                                        div_text_clean = div_text.replace('\xa0', ' ').replace('&nbsp;', ' ').strip()
-                                        
-                                        print(f"    [DEBUG]   td[{td_idx}]: found div with text='{div_text_clean[:50]}'")
-                                        
-                                        # Skip if empty or only whitespace
-                                        if not div_text_clean or div_text_clean == '':
-                                            print(f"    [DEBUG]   td[{td_idx}]: div text is empty, skipping")
-                                            continue
-                                        
-                                        # Try to extract number - check if it's a valid numeric text
-                                        # Remove spaces and try to parse
-                                        cleaned_text = div_text_clean.replace(' ', '').replace(',', '.')
-                                        
-                                        # Check for negative (in parentheses)
-                                        is_negative = False
-                                        if cleaned_text.startswith('(') and cleaned_text.endswith(')'):
-                                            is_negative = True
-                                            cleaned_text = cleaned_text[1:-1].strip()
-                                        elif cleaned_text.startswith('-'):
-                                            is_negative = True
-                                            cleaned_text = cleaned_text[1:].strip()
-                                        
-                                        # Try to parse as float - if it's a valid number like 0.33 or 3.25
-                                        try:
-                                            number = float(cleaned_text)
-                                            if is_negative:
-                                                number = -number
-                                            # Reasonable range check
-                                            if abs(number) < 1e15:
-                                                print(f"    [DEBUG] Found {identifier_text} ratio value at td index {td_idx}: {number}")
-                                                return number
-                                        except ValueError:
-                                            # Not a valid number, skip to next td
-                                            print(f"    [DEBUG]   td[{td_idx}]: '{cleaned_text[:30]}' is not a valid number, skipping")
-                                            pass
-                                    
-                                    print(f"    [DEBUG] No ratio value found for '{identifier_text}' after checking {min(30, len(tds) - identifier_td_index - 1)} tds")
-                            if not found_identifier:
-                                print(f"    [DEBUG] Identifier '{identifier_text}' not found in any div element")
-                            return 0.0
-                        
                         ratio_identifiers = [
                             ("Kewajiban Penyediaan Modal Minimum (KPMM)", "KPMM"),
                             ("Rasio Cadangan terhadap PPKA", "PPKA"),
@@ -3754,10 +3790,11 @@ class OJKExtJSScraper:
                             ("Cash Ratio", "CR")
                         ]
                         
-                        for identifier, ratio_name in ratio_identifiers:
-                            value = extract_ratio_value_from_soup(identifier, ratio_soup)
-                            result[ratio_name] = value
-                            print(f"    [DEBUG] Extracted {ratio_name}: {value}")
+                        ratio_values = extract_all_ratios(ratio_soup, dict(ratio_identifiers))
+                        result.update(ratio_values)
+                        if logger.isEnabledFor(logging.DEBUG):
+                            for ratio_name, value in ratio_values.items():
+                                logger.debug("Extracted %s: %s", ratio_name, value)
                         
                         # Switch back to first iframe (or default content) after ratio extraction
                         if ratio_iframe:
@@ -3765,7 +3802,7 @@ class OJKExtJSScraper:
                                 self.driver.switch_to.default_content()
                                 if report_iframe:
                                     self.driver.switch_to.frame(report_iframe)
-                                print("    [DEBUG] Switched back to first iframe after ratio extraction")
+                                logger.debug("Switched back to first iframe after ratio extraction")
                             except:
                                 self.driver.switch_to.default_content()
                     else:
@@ -3788,7 +3825,7 @@ class OJKExtJSScraper:
             # Switch back to default content after extraction
             try:
                 self.driver.switch_to.default_content()
-                print("    [DEBUG] Switched back to default content")
+                logger.debug("Switched back to default content")
             except:
                 pass
             
@@ -3802,9 +3839,6 @@ class OJKExtJSScraper:
     
     def _extract_laba_kotor_data(self, selected_year: str, city: str = None, bank: str = None) -> dict:
         """Extract Laba Kotor and all 9 Rasio data from the report. Returns dict with all ratio values."""
-        from bs4 import BeautifulSoup
-        import re
-        
         try:
             # Always use provided city and bank - don't extract from page to avoid getting month name
             result = {
@@ -3819,60 +3853,77 @@ class OJKExtJSScraper:
                 iframes = self.driver.find_elements(By.TAG_NAME, "iframe")
                 if iframes:
                     self.driver.switch_to.frame(iframes[0])
-                    print("    [DEBUG] Switched to iframe for data extraction")
+                    logger.debug("Switched to iframe for data extraction")
             except:
                 pass
             
-            # Get page source and parse with BeautifulSoup
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-            
             # Wait for page to fully load by checking for identifier
-            print("    [INFO] Memvalidasi halaman telah dimuat sepenuhnya (memeriksa identifier setiap 10 detik)...")
+            print("    [INFO] Memvalidasi halaman telah dimuat sepenuhnya (memeriksa identifier setiap 2 detik)...")
             max_attempts = 20
-            check_interval = 15  # Check every 15 seconds
+            check_interval = 15  # Total budget: max_attempts * check_interval seconds
             
-            identifier_found = False
-            bad_request_found = False
-            for attempt in range(max_attempts):
-                # Check for "Bad Request" error
-                page_source_lower = page_source.lower()
-                if 'bad request' in page_source_lower:
-                    bad_request_found = True
-                    print(f"    [WARNING] 'Bad Request' ditemukan dalam halaman (percobaan {attempt + 1})")
-                    break  # Exit loop if Bad Request found
-                
-                # Check if identifier exists (check for any ratio identifier)
-                identifiers_to_check = [
-                    "LABA (RUGI) TAHUN BERJALAN SEBELUM PAJAK PENGHASILAN",
-                    "Kewajiban Penyediaan Modal Minimum",
-                    "Rasio Cadangan terhadap PPKA",
-                    "Non Performing Loan"
-                ]
-                for identifier in identifiers_to_check:
-                    for div in soup.find_all('div'):
-                        text = div.get_text(strip=True)
-                        if identifier.upper() in text.upper():
-                            identifier_found = True
-                            print(f"    [OK] Halaman telah dimuat sepenuhnya - Identifier ditemukan (percobaan {attempt + 1})")
-                            break
-                    if identifier_found:
-                        break
-                
-                if identifier_found:
-                    break
-                
-                if attempt < max_attempts - 1:
-                    print(f"    [INFO] Percobaan {attempt + 1}/{max_attempts}: Memperbarui page_source dan mem-parse ulang BeautifulSoup...")
-                    time.sleep(check_interval)
-                    page_source = self.driver.page_source
-                    soup = BeautifulSoup(page_source, 'html.parser')
-                    print(f"    [DEBUG] BeautifulSoup telah di-parse ulang (ukuran: {len(page_source)} karakter)")
+            # Check for any ratio identifier
+            identifiers_to_check = [
+                "LABA (RUGI) TAHUN BERJALAN SEBELUM PAJAK PENGHASILAN",
+                "Kewajiban Penyediaan Modal Minimum",
+                "Rasio Cadangan terhadap PPKA",
+                "Non Performing Loan"
+            ]
+            
+            # Run the substring checks inside the browser so each poll returns a short
+            # status string instead of transferring and re-parsing the whole page_source
+            page_state_js = """
+                var text = (document.documentElement.textContent || '').toUpperCase();
+                if (text.indexOf('BAD REQUEST') >= 0) { return 'bad_request'; }
+                var identifiers = arguments[0];
+                for (var i = 0; i < identifiers.length; i++) {
+                    if (text.indexOf(identifiers[i]) >= 0) { return 'ready'; }
+                }
+                return null;
+            """
+            identifiers_upper = [identifier.upper() for identifier in identifiers_to_check]
+            try:
+                page_state = WebDriverWait(self.driver, max_attempts * check_interval, poll_frequency=2).until(
+                    lambda d: d.execute_script(page_state_js, identifiers_upper)
+                )
+            except TimeoutException:
+                page_state = None
+                print(f"    [WARNING] Identifier tidak ditemukan setelah {max_attempts * check_interval} detik, melanjutkan dengan data yang tersedia...")
+            
+            bad_request_found = page_state == 'bad_request'
+            if bad_request_found:
+                print("    [WARNING] 'Bad Request' ditemukan dalam halaman")
+            elif page_state == 'ready':
+                print("    [OK] Halaman telah dimuat sepenuhnya - Identifier ditemukan")
             
             # If Bad Request found, return None to signal retry needed
             if bad_request_found:
                 return None
             
+            # Page is ready (or the wait budget ran out): fetch the report table and parse it once
+            page_source = self._get_report_html()
+            
+            # A retry that lands on an identical report page reuses the earlier extraction
+            cache_key = (selected_year, hashlib.blake2b(page_source.encode(), digest_size=16).digest())
+            cached_values = self._report_cache.get(cache_key)
+            if cached_values is not None:
+                self._report_cache.move_to_end(cache_key)
+                result.update(cached_values)
+                print(f"    [OK] Halaman identik dengan ekstraksi sebelumnya, menggunakan {len(cached_values)} nilai tersimpan")
+                try:
+                    self.driver.switch_to.default_content()
+                except:
+                    pass
+                return result
+            
+            soup = BeautifulSoup(page_source, 'lxml', parse_only=DIV_STRAINER)
+            
+            # Collect div nodes and their texts once; get_text walks the whole subtree,
+            # so both extractors below index these lists instead of re-extracting
+            all_divs = soup.find_all('div')
+            div_texts = [div.get_text(strip=True) for div in all_divs]
+            div_texts_upper = [text.upper() for text in div_texts]
+            
             def extract_laba_kotor_value(identifier_text: str) -> tuple[float, float]:
                 """
                 Extract Laba Kotor value from table structure.
@@ -3880,18 +3931,15 @@ class OJKExtJSScraper:
                 Values can be negative in parentheses like (677,555,231).
                 Returns tuple of (current_year_value, previous_year_value)
                 """
-                import re
+                needle = identifier_text.upper()
                 
-                for div in soup.find_all('div'):
-                    text = div.get_text(strip=True)
-                    if identifier_text.upper() in text.upper() and len(text) < 5000:
-                        # Find the parent <td> or <tr> (table row)
-                        parent_td = div.find_parent('td')
+                for div, text, text_upper in zip(all_divs, div_texts, div_texts_upper):
+                    if len(text) < 5000 and needle in text_upper:
+                        # Find the parent <td> and <tr> (table row) in one upward walk
+                        parent_td, parent_tr = self._find_parent_td_tr(div)
                         if not parent_td:
                             continue
                         
-                        # Find the parent <tr> (table row) to get all <td> elements in the row
-                        parent_tr = parent_td.find_parent('tr')
                         if not parent_tr:
                             # If no <tr>, try to find subsequent <td> elements from the same parent
                             parent_td_siblings = parent_td.find_next_siblings('td')
@@ -3911,7 +3959,6 @@ class OJKExtJSScraper:
                         # Extract values from subsequent <td> elements (skip the identifier <td>)
                         # Look for numeric values in <td> elements (may have multiple <td> elements to check)
                         values = []
-                        import re
                         for td in tds[identifier_td_index + 1:identifier_td_index + 10]:  # Check more <td> elements to find numeric values
                             # Look for <div> inside the <td>
                             td_div = td.find('div')
@@ -3921,8 +3968,7 @@ class OJKExtJSScraper:
                                     # Check if this looks like a number (contains digits, possibly with parentheses and commas)
                                     # Pattern: optional parentheses, digits with commas, optional decimal part
                                     # Examples: "(677,555,231)", "1,223", "123.45"
-                                    numeric_pattern = r'^\(?[\d,]+\.?\d*\)?$'
-                                    if re.match(numeric_pattern, td_text.replace(' ', '')):
+                                    if _NUMERIC_RE.match(td_text.replace(' ', '')):
                                         values.append(td_text)
                                         if len(values) >= 2:  # Stop after finding 2 numeric values
                                             break
@@ -3931,106 +3977,101 @@ class OJKExtJSScraper:
                         if len(values) >= 2:
                             # Two values: first is previous year, second is current year
                             try:
-                                # Parse first value (previous year)
-                                val1_text = values[0].strip()
-                                is_negative1 = val1_text.startswith('(') and val1_text.endswith(')')
-                                if is_negative1:
-                                    val1_text = val1_text[1:-1].strip()  # Remove parentheses
-                                # Remove commas (thousands separators) and convert to float
-                                val1_text = val1_text.replace(',', '')
-                                val1 = float(val1_text)
-                                if is_negative1:
-                                    val1 = -val1
-                                
-                                # Parse second value (current year)
-                                val2_text = values[1].strip()
-                                is_negative2 = val2_text.startswith('(') and val2_text.endswith(')')
-                                if is_negative2:
-                                    val2_text = val2_text[1:-1].strip()  # Remove parentheses
-                                # Remove commas (thousands separators) and convert to float
-                                val2_text = val2_text.replace(',', '')
-                                val2 = float(val2_text)
-                                if is_negative2:
-                                    val2 = -val2
+                                # Parse first value (previous year) and second value (current year)
+                                val1 = self._parse_signed_value(values[0])
+                                val2 = self._parse_signed_value(values[1])
                                 
                                 # Return as (current_year, previous_year)
                                 return (val2, val1)
                             except Exception as e:
-                                print(f"    [DEBUG] Error parsing two values: {e}, values: {values}")
+                                logger.debug("Error parsing two values: %s, values: %s", e, values)
                                 pass
                         elif len(values) == 1:
                             # Single value: use for both years
                             try:
-                                val_text = values[0].strip()
-                                is_negative = val_text.startswith('(') and val_text.endswith(')')
-                                if is_negative:
-                                    val_text = val_text[1:-1].strip()  # Remove parentheses
-                                # Remove commas (thousands separators) and convert to float
-                                val_text = val_text.replace(',', '')
-                                val = float(val_text)
-                                if is_negative:
-                                    val = -val
+                                val = self._parse_signed_value(values[0])
                                 # Use same value for both years
                                 return (val, val)
                             except Exception as e:
-                                print(f"    [DEBUG] Error parsing single value: {e}, value: {values[0]}")
+                                logger.debug("Error parsing single value: %s, value: %s", e, values[0])
                                 pass
                 
                 return (0.0, 0.0)
             
+            # Define 9 ratio identifiers (for Sheet 5 only)
+            ratio_identifiers = [
+                ("Kewajiban Penyediaan Modal Minimum", "KPMM"),
+                ("Rasio Cadangan terhadap PPKA", "PPKA"),
+                ("Non Performing Loan (NPL) Neto", "NPL Neto"),
+                ("Non Performing Loan (NPL) Gross", "NPL Gross"),
+                ("Return on Assets (ROA)", "ROA"),
+                ("Biaya Operasional terhadap Pendapatan Operasional (BOPO)", "BOPO"),
+                ("Net Interest Margin (NIM)", "NIM"),
+                ("Loan to Deposit Ratio (LDR)", "LDR"),
+                ("Cash Ratio", "CR")
+            ]
+            
+            # Locate all 9 ratio identifiers in a single pass over the cached div texts,
+            # instead of one full div scan per identifier
+            ratio_needles = [identifier.upper() for identifier, _ in ratio_identifiers]
+            ratio_hits = {needle: [] for needle in ratio_needles}
+            for div_index, text_upper in enumerate(div_texts_upper):
+                if len(div_texts[div_index]) >= 5000:
+                    continue
+                for needle in ratio_needles:
+                    if needle in text_upper:
+                        ratio_hits[needle].append(div_index)
+            
             def extract_ratio_value(identifier_text: str) -> float:
                 """
                 Extract Rasio value - just take the integer that has '.' in it
                 If there is bracket, meaning it's negative, parse it as is
                 """
-                for div in soup.find_all('div'):
-                    text = div.get_text(strip=True)
-                    if identifier_text.upper() in text.upper() and len(text) < 5000:
-                        # Find the next div with numeric value
-                        all_divs = soup.find_all('div')
-                        try:
-                            div_index = all_divs.index(div)
-                            # Look at next divs for the value
-                            for i in range(div_index + 1, min(div_index + 10, len(all_divs))):
-                                next_div = all_divs[i]
-                                next_text = next_div.get_text(strip=True)
-                                
-                                # Skip if too long or contains identifier keywords
-                                if len(next_text) > 100:
-                                    continue
-                                
-                                # Extract number - must have '.' in it (decimal point)
-                                cleaned_text = next_text.strip()
-                                
-                                # Check if it has a decimal point (dot)
-                                if '.' not in cleaned_text:
-                                    continue
-                                
-                                # Check for negative (in parentheses)
-                                is_negative = False
-                                if cleaned_text.startswith('(') and cleaned_text.endswith(')'):
-                                    is_negative = True
-                                    cleaned_text = cleaned_text[1:-1].strip()
-                                elif cleaned_text.startswith('-'):
-                                    is_negative = True
-                                    cleaned_text = cleaned_text[1:].strip()
-                                
-                                # Replace comma with dot for decimal separator (if comma is used)
-                                # But keep the dot that's already there
-                                cleaned_text = cleaned_text.replace(',', '.')
-                                
-                                # Try to extract number
-                                try:
-                                    number = float(cleaned_text)
-                                    if is_negative:
-                                        number = -number
-                                    # Reasonable range check
-                                    if abs(number) < 1e15:
-                                        return number
-                                except:
-                                    pass
-                        except:
-                            pass
+                # Visit the divs matched by the single pass above; the position in the
+                # list replaces a second find_all('div') plus all_divs.index(div)
+                for div_index in ratio_hits[identifier_text.upper()]:
+                    # Find the next div with numeric value
+                    try:
+                        # Look at next divs for the value
+                        for i in range(div_index + 1, min(div_index + 10, len(div_texts))):
+                            next_text = div_texts[i]
+                            
+                            # Skip if too long or contains identifier keywords
+                            if len(next_text) > 100:
+                                continue
+                            
+                            # Extract number - must have '.' in it (decimal point)
+                            cleaned_text = next_text.strip()
+                            
+                            # Check if it has a decimal point (dot)
+                            if '.' not in cleaned_text:
+                                continue
+                            
+                            # Check for negative (in parentheses)
+                            is_negative = False
+                            if cleaned_text.startswith('(') and cleaned_text.endswith(')'):
+                                is_negative = True
+                                cleaned_text = cleaned_text[1:-1].strip()
+                            elif cleaned_text.startswith('-'):
+                                is_negative = True
+                                cleaned_text = cleaned_text[1:].strip()
+                            
+                            # Replace comma with dot for decimal separator (if comma is used)
+                            # But keep the dot that's already there
+                            cleaned_text = cleaned_text.replace(',', '.')
+                            
+                            # Try to extract number
+                            try:
+                                number = float(cleaned_text)
+                                if is_negative:
+                                    number = -number
+                                # Reasonable range check
+                                if abs(number) < 1e15:
+                                    return number
+                            except:
+                                pass
+                    except:
+                        pass
                 return 0.0
             
             # Extract Laba Kotor (for Sheet 4)
@@ -4040,33 +4081,25 @@ class OJKExtJSScraper:
             result[f'Laba Kotor {previous_year}'] = laba_kotor_previous
             print(f"    [OK] Extracted Laba Kotor: {selected_year}={laba_kotor_current}, {previous_year}={laba_kotor_previous}")
             
-            # Define 9 ratio identifiers (for Sheet 5 only)
-            ratio_identifiers = [
-                ("Kewajiban Penyediaan Modal Minimum", "KPMM"),
-                ("Rasio Cadangan terhadap PPKA", "PPKA"),
-                ("Non Performing Loan (NPL) Neto", "NPL Neto"),
-                ("Non Performing Loan (NPL) Gross", "NPL Gross"),
-                ("Return on Assets (ROA)", "ROA"),
-                ("Biaya Operasional terhadap Pendapatan Operasional (BOPO)", "BOPO"),
-                ("Net Interest Margin (NIM)", "NIM"),
-                ("Loan to Deposit Ratio (LDR)", "LDR"),
-                ("Cash Ratio", "CR")
-            ]
-            
             # Extract all 9 ratios (for Sheet 5)
             print("    [INFO] Extracting all 9 Rasio data (Sheet 5)...")
-            for identifier, ratio_name in ratio_identifiers:
-                value = extract_ratio_value(identifier)
-                result[ratio_name] = value
-                print(f"    [DEBUG] Extracted {ratio_name}: {value}")
+            result.update({ratio_name: extract_ratio_value(identifier) for identifier, ratio_name in ratio_identifiers})
+            if logger.isEnabledFor(logging.DEBUG):
+                for _, ratio_name in ratio_identifiers:
+                    logger.debug("Extracted %s: %s", ratio_name, result[ratio_name])
             
             print(f"    [OK] Extracted Laba Kotor and all 9 Rasio data")
             print(f"    [OK] Total extracted data points: {len(result)}")
             
+            # Remember extracted values (not city/bank) for this page, evicting the oldest entry
+            self._report_cache[cache_key] = {k: v for k, v in result.items() if k not in ('city', 'bank')}
+            if len(self._report_cache) > self.REPORT_CACHE_SIZE:
+                self._report_cache.popitem(last=False)
+            
             # Switch back to default content
             try:
                 self.driver.switch_to.default_content()
-                print("    [DEBUG] Switched back to default content")
+                logger.debug("Switched back to default content")
             except:
                 pass
             
@@ -4101,6 +4134,17 @@ class OJKExtJSScraper:
             except:
                 pass
         
+        # Elements located on the old browser's pages
+        self._element_cache.clear()
+        
+        # Cleanup HTTP session used by direct URL retries
+        if self._session:
+            try:
+                self._session.close()
+            except:
+                pass
+            self._session = None
+        
         # Cleanup WebDriver - this is the most important
         if self.driver:
             try:
@@ -4174,45 +4218,31 @@ class OJKExtJSScraper:
             words[0] = "Perumda"
         
         # Step 5: Create original format (keep Bpr/Bprs as-is)
-        # PT should always be uppercase, other words capitalized
-        original_words = []
-        for w in words:
-            if w.upper() == "PT":
-                original_words.append("PT")
-            else:
-                original_words.append(w.capitalize())
-        original_format = "+".join(original_words)
+        # PT should always be uppercase, other words capitalized (single pass, shared with Step 6)
+        def cap(w):
+            return "PT" if w.upper() == "PT" else w.capitalize()
+        
+        capped_words = [cap(w) for w in words]
+        formats = [" ".join(capped_words).replace(" ", "+")]
         
         # Step 6: Check if we need expanded format
         has_bpr = False
-        has_bprs = False
         expanded_words = []
         
-        for word in words:
+        for word in capped_words:
             word_upper = word.upper()
-            if word_upper in ["BPR", "BPRS"]:
-                if word_upper == "BPRS":
-                    has_bprs = True
-                    expanded_words.extend(["Bank", "Perekonomian", "Rakyat", "Syariah"])
-                else:
-                    has_bpr = True
-                    expanded_words.extend(["Bank", "Perekonomian", "Rakyat"])
+            if word_upper == "BPRS":
+                has_bpr = True
+                expanded_words.extend(("Bank", "Perekonomian", "Rakyat", "Syariah"))
+            elif word_upper == "BPR":
+                has_bpr = True
+                expanded_words.extend(("Bank", "Perekonomian", "Rakyat"))
             else:
                 expanded_words.append(word)
         
-        # Step 7: Create expanded format if needed
-        formats = [original_format]
-        
-        if has_bpr or has_bprs:
-            # Capitalize expanded words, but keep PT uppercase
-            expanded_formatted = []
-            for w in expanded_words:
-                if w.upper() == "PT":
-                    expanded_formatted.append("PT")
-                else:
-                    expanded_formatted.append(w.capitalize())
-            expanded_format = "+".join(expanded_formatted)
-            formats.append(expanded_format)
+        # Step 7: Create expanded format if needed (words are already capitalized)
+        if has_bpr:
+            formats.append(" ".join(expanded_words).replace(" ", "+"))
         
         return formats
     
@@ -4226,13 +4256,7 @@ class OJKExtJSScraper:
         Returns:
             Month number (3, 6, 9, or 12)
         """
-        month_map = {
-            "Maret": 3,
-            "Juni": 6,
-            "September": 9,
-            "Desember": 12
-        }
-        return month_map.get(month_name, 3)  # Default to 3 if not found
+        return self.REPORT_MONTH_NUMBERS.get(month_name, 3)  # Default to 3 if not found
     
     def _build_report_url(self, bank_code: str, month: int, year: str, form_number: int) -> str:
         """
@@ -4262,8 +4286,8 @@ class OJKExtJSScraper:
             "FinancialReportTypeCode": form_code
         }
         
-        # Build query string
-        query_string = "&".join([f"{k}={v}" for k, v in params.items()])
+        # Build query string (keep "+" as-is: bank_code already uses it as the space separator)
+        query_string = urlencode(params, safe="+")
         url = f"{base_url}?{query_string}"
         
         return url
@@ -4277,9 +4301,8 @@ class OJKExtJSScraper:
         """
         try:
             page_source = self.driver.page_source
-            error_text = "Server Error in '/cfs' Application"
             
-            if error_text in page_source:
+            if self.SERVER_ERROR_TEXT in page_source:
                 print(f"  [WARNING] Server error detected in page source")
                 return True
             
@@ -4288,9 +4311,99 @@ class OJKExtJSScraper:
             print(f"  [WARNING] Error checking for server error: {e}")
             return False
     
+    def _get_http_session(self):
+        """
+        Get (or create) the requests.Session used for direct URL retries
+        The connection pool is sized so all retry workers can share one session
+        
+        Returns:
+            requests.Session object
+        """
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.headers.update(self.HTTP_HEADERS)
+            adapter = requests.adapters.HTTPAdapter(pool_connections=self.RETRY_WORKERS + 1, pool_maxsize=self.RETRY_WORKERS * 2)
+            self._session.mount('https://', adapter)
+            self._session.mount('http://', adapter)
+            # Reuse the browser's cookies (ASP.NET session) when a browser is open
+            if self.driver:
+                for cookie in self.driver.get_cookies():
+                    self._session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'))
+        return self._session
+    
+    def _fetch_report_html(self, url: str) -> str:
+        """
+        Fetch a direct report URL over plain HTTP (no browser)
+        
+        Args:
+            url: Report viewer URL from _build_report_url
+            
+        Returns:
+            Response HTML, or None if requests is not installed or the request failed
+        """
+        if requests is None:
+            return None
+        
+        try:
+            response = self._get_http_session().get(url, timeout=30)
+            return response.text
+        except Exception as e:
+            print(f"    [WARNING] HTTP request failed: {e}")
+            return None
+    
+    def _wait_for_direct_url_report(self, form_num: int, timeout: float = 10) -> bool:
+        """
+        Wait until a direct-URL report page is ready to parse
+        Returns as soon as the form's marker text (or the server error page) is rendered, checked
+        in the main document and inside each report iframe - an iframe that merely exists is not
+        ready yet (the ReportViewer frame is there before the report has rendered)
+        
+        Args:
+            form_num: Form number (1, 2, or 3) - selects the marker from DIRECT_URL_MARKERS
+            timeout: Maximum seconds to wait
+        
+        Returns:
+            True if the page signalled ready, False on timeout (caller parses whatever is there)
+        """
+        marker = self.DIRECT_URL_MARKERS[form_num]
+        # Text of the current document only (no full page_source serialization per poll)
+        has_text_js = """
+            const text = document.body ? document.body.textContent : '';
+            return text.includes(arguments[0]) || text.includes(arguments[1]);
+        """
+        
+        def page_ready(driver):
+            driver.switch_to.default_content()
+            if driver.execute_script(has_text_js, marker, self.SERVER_ERROR_TEXT):
+                return True
+            
+            # Look inside each report iframe, back to the outer document afterwards
+            for iframe in driver.find_elements(By.TAG_NAME, "iframe"):
+                try:
+                    driver.switch_to.frame(iframe)
+                    if driver.execute_script(has_text_js, marker, self.SERVER_ERROR_TEXT):
+                        return True
+                except Exception:
+                    # Frame detached/reloaded while polling - try again on the next poll
+                    pass
+                finally:
+                    driver.switch_to.default_content()
+            return False
+        
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.25).until(page_ready)
+            return True
+        except TimeoutException:
+            print(f"  [WARNING] Form {form_num} report not ready after {timeout}s, parsing current page")
+            return False
+        finally:
+            self.driver.switch_to.default_content()
+    
     def _get_page_source_with_iframe(self) -> tuple[str, object]:
         """
         Get page source, checking iframes first (similar to Sindikasi)
+        For an iframe only the report body (document.body.innerHTML) is returned, so the
+        outer page chrome is never serialized or parsed
         
         Returns:
             Tuple of (page_source: str, report_iframe: object or None)
@@ -4304,7 +4417,7 @@ class OJKExtJSScraper:
         for iframe in iframes:
             try:
                 self.driver.switch_to.frame(iframe)
-                iframe_source = self.driver.page_source
+                iframe_source = self.driver.execute_script("return document.body ? document.body.innerHTML : '';") or ""
                 if ("Piutang" in iframe_source or "Aset" in iframe_source or "DPK" in iframe_source or
                     "LABA" in iframe_source or "Rasio" in iframe_source or "KPMM" in iframe_source or
                     "Kredit" in iframe_source):
@@ -4325,100 +4438,198 @@ class OJKExtJSScraper:
         
         return page_source, report_iframe
     
-    def _clean_numeric_text(self, text: str) -> float:
+    def _find_parent_td_tr(self, node) -> tuple:
         """
-        Clean numeric text by reversing . and , then parse as float
+        Find the enclosing <td> of a node and the <tr> enclosing that <td>
+        Walks .parent directly (same result as find_parent('td') / find_parent('tr'))
         
         Args:
-            text: Text containing numeric value (e.g., "230,115,190" becomes "230.115.190")
-            
+            node: BeautifulSoup element (usually the identifier <div>)
+        
         Returns:
-            Parsed float value, or 0.0 if parsing fails
+            Tuple of (parent_td, parent_tr); parent_td is None if there is no <td> ancestor,
+            parent_tr is None if the <td> has no <tr> ancestor
         """
-        try:
-            import re
-            
-            # Remove whitespace
-            cleaned = text.strip()
-            
-            # Reverse . and , (swap all occurrences)
-            # "230,115,190" → "230.115.190"
-            # "230.115.190" → "230,115,190"
-            cleaned = cleaned.replace('.', 'TEMP_DOT')
-            cleaned = cleaned.replace(',', '.')
-            cleaned = cleaned.replace('TEMP_DOT', ',')
-            
-            # After swapping, parse the number
-            # Determine which separator is decimal and which is thousands
-            # Pattern: if there are multiple separators, the last one is usually decimal
-            # If only one separator, it could be either
-            
-            dot_count = cleaned.count('.')
-            comma_count = cleaned.count(',')
-            
-            if dot_count > 0 and comma_count > 0:
-                # Both present - last separator is decimal
-                last_dot_pos = cleaned.rfind('.')
-                last_comma_pos = cleaned.rfind(',')
-                
-                if last_dot_pos > last_comma_pos:
-                    # Last separator is dot, so dots are thousands, comma is decimal
-                    # Remove all dots (thousands), replace comma with dot for parsing
-                    cleaned = cleaned.replace('.', '')
-                    cleaned = cleaned.replace(',', '.')
-                else:
-                    # Last separator is comma, so commas are thousands, dot is decimal
-                    # Remove all commas (thousands), keep dot as decimal
-                    cleaned = cleaned.replace(',', '')
-            elif dot_count > 1:
-                # Multiple dots - all are thousands separators, remove all
-                cleaned = cleaned.replace('.', '')
-            elif comma_count > 1:
-                # Multiple commas - all are thousands separators, remove all
-                cleaned = cleaned.replace(',', '')
-            elif dot_count == 1:
-                # Single dot - could be decimal or thousands
-                # Check position: if near end (last 3 chars), likely decimal, otherwise thousands
-                dot_pos = cleaned.find('.')
-                if dot_pos >= len(cleaned) - 3:
-                    # Near end, likely decimal separator
-                    pass  # Keep it
-                else:
-                    # Likely thousands separator, remove it
-                    cleaned = cleaned.replace('.', '')
-            elif comma_count == 1:
-                # Single comma - could be decimal or thousands
-                # Check position: if near end (last 3 chars), likely decimal, otherwise thousands
-                comma_pos = cleaned.find(',')
-                if comma_pos >= len(cleaned) - 3:
-                    # Near end, likely decimal separator, convert to dot
-                    cleaned = cleaned.replace(',', '.')
-                else:
-                    # Likely thousands separator, remove it
-                    cleaned = cleaned.replace(',', '')
-            
-            # Remove any remaining non-numeric characters except decimal point and minus
-            cleaned = re.sub(r'[^\d.\-]', '', cleaned)
-            
-            if not cleaned or cleaned == '-':
-                return 0.0
-            
-            return float(cleaned)
-        except Exception as e:
-            print(f"  [DEBUG] Error parsing numeric text '{text}': {e}")
-            return 0.0
+        parent_td = node.parent
+        while parent_td is not None and parent_td.name != 'td':
+            parent_td = parent_td.parent
+        if parent_td is None:
+            return None, None
+        
+        parent_tr = parent_td.parent
+        while parent_tr is not None and parent_tr.name != 'tr':
+            parent_tr = parent_tr.parent
+        return parent_td, parent_tr
     
-    def _extract_identifier_value(self, soup: BeautifulSoup, identifier: str) -> dict:
+    def _parse_signed_value(self, text: str) -> float:
         """
-        Extract values for a single identifier from the page
-        Uses the same approach as Sindikasi scraper:
-        - Find div containing identifier text
+        Parse a report value where negatives are written in parentheses, e.g. "(677,555,231)"
+        
+        Args:
+            text: Value text with comma thousands separators
+        
+        Returns:
+            Parsed float (negative if wrapped in parentheses)
+        """
+        sign = -1.0 if text.startswith('(') and text.endswith(')') else 1.0
+        core = text[1:-1] if sign < 0 else text
+        return sign * float(core.replace(',', ''))
+    
+    def _clean_numeric_text(self, text: str) -> float:
+        """
+        Parse Indonesian/English formatted numeric text in a single pass
+        
+        Digits are collected while scanning; the last '.' or ',' is treated as the
+        decimal separator when at most 2 digits follow it, every other separator
+        is a thousands separator. Signs are ignored: extract_number callers only keep
+        values >= 0, so "(1,234)" must stay 1234 to keep the year columns aligned
+        (signed table values go through _parse_signed_value).
+        
+        Args:
+            text: Text containing numeric value (e.g., "230,115,190" → 230115190, "3,25" → 3.25)
+            
+        Returns:
+            Parsed float value (unsigned), or 0.0 if no digits found
+        """
+        digits = []
+        last_sep = -1
+        for ch in text:
+            if ch.isdecimal():
+                digits.append(ch)
+            elif ch == '.' or ch == ',':
+                last_sep = len(digits)
+        
+        if not digits:
+            return 0.0
+        
+        if last_sep >= 0 and len(digits) - last_sep <= 2:
+            # Near end, decimal separator
+            digits.insert(last_sep, '.')
+        
+        try:
+            return float(''.join(digits))
+        except ValueError:
+            return 0.0
+    
+    def _collect_div_texts(self, soup: BeautifulSoup) -> list:
+        """
+        Get the stripped text of every <div> once, for reuse across identifier lookups
+        
+        Args:
+            soup: BeautifulSoup parsed page
+            
+        Returns:
+            List of (div, text, text_lower) tuples in document order
+            (text_lower is "" for empty divs and divs over 5000 chars, which no lookup uses)
+        """
+        div_texts = []
+        for div in soup.find_all('div'):
+            text = div.get_text(strip=True)
+            text_lower = text.lower() if text and len(text) <= 5000 else ""
+            div_texts.append((div, text, text_lower))
+        return div_texts
+    
+    def _find_label_divs(self, identifiers: list, div_texts: list) -> dict:
+        """
+        Find the label <div> of several identifiers in a single pass over the page
+        (first div whose text contains the identifier and is short, or starts/ends with it)
+        
+        Args:
+            identifiers: Identifier texts to find
+            div_texts: _collect_div_texts(soup) output
+            
+        Returns:
+            dict of identifier -> label <div> (identifiers not found are absent)
+        """
+        pending = {identifier: identifier.lower() for identifier in identifiers}
+        label_divs = {}
+        # The identifier sets are fixed literals, so one compiled alternation rejects
+        # most divs in a single C-level search before the per-identifier checks
+        any_identifier = _identifier_pattern(tuple(pending.values()))
+        
+        for div, text, text_lower in div_texts:
+            if not pending:
+                break
+            
+            # Skip empty divs and divs that are too long (likely contain entire page content)
+            if not text or len(text) > 5000:
+                continue
+            
+            if not any_identifier.search(text_lower):
+                continue
+            
+            for identifier, identifier_lower in list(pending.items()):
+                # If text is short or identifier is at the start/end, it's likely the right div
+                if identifier_lower in text_lower and (len(text) < 200 or text_lower.startswith(identifier_lower) or text_lower.endswith(identifier_lower)):
+                    label_divs[identifier] = div
+                    del pending[identifier]
+                    logger.debug("Found identifier '%s' in <div>: '%s...'", identifier, text[:100])
+        
+        return label_divs
+    
+    def _extract_many_identifiers(self, page_source: str, identifiers: list) -> dict:
+        """
+        Extract values for several identifiers, locating all their label divs in one traversal
+        Results are memoized per (page hash, identifier), so re-reading an unchanged page
+        (e.g. a retry after a Chrome timeout) skips both the parse and the extraction
+        
+        Args:
+            page_source: Report HTML
+            identifiers: Identifier texts to find
+            
+        Returns:
+            dict of identifier -> {'2025': value, '2024': value}
+        """
+        page_hash = hashlib.blake2b(page_source.encode(), digest_size=16).digest()
+        missing = [identifier for identifier in identifiers if (page_hash, identifier) not in self._ident_cache]
+        absent = []
+        
+        if missing:
+            # Raw-HTML pre-check: report labels render as one text node per <div>, so an identifier
+            # that is not in page_source cannot be in any div text and needs no DOM work. Only
+            # identifiers the serializer writes verbatim qualify: non-ASCII ones may be entity-encoded
+            # (e.g. "&ndash;"), and so may '&', '<', '>' and quotes
+            page_lower = page_source.lower()
+            absent = [
+                identifier for identifier in missing
+                if identifier.isascii() and not _HTML_ESCAPED_CHARS.intersection(identifier)
+                and identifier.lower() not in page_lower
+            ]
+            for identifier in absent:
+                logger.debug("Identifier '%s' NOT FOUND in page", identifier)
+                self._ident_cache[(page_hash, identifier)] = {'2025': 0.0, '2024': 0.0}
+            missing = [identifier for identifier in missing if identifier not in absent]
+        
+        if missing:
+            soup = BeautifulSoup(page_source, 'lxml', parse_only=DIV_STRAINER)
+            div_texts = self._collect_div_texts(soup)
+            label_divs = self._find_label_divs(missing, div_texts)
+            for identifier in missing:
+                self._ident_cache[(page_hash, identifier)] = self._extract_identifier_value(soup, identifier, div_texts, label_divs)
+        elif not absent:
+            print(f"    [OK] Halaman identik dengan percobaan sebelumnya, menggunakan {len(identifiers)} nilai tersimpan")
+        
+        values = {}
+        for identifier in identifiers:
+            self._ident_cache.move_to_end((page_hash, identifier))
+            values[identifier] = dict(self._ident_cache[(page_hash, identifier)])
+        while len(self._ident_cache) > self.IDENT_CACHE_SIZE:
+            self._ident_cache.popitem(last=False)
+        return values
+    
+    def _extract_identifier_value(self, soup: BeautifulSoup, identifier: str, div_texts: list = None, label_divs: dict = None) -> dict:
+        """
+        Extract values for a single identifier from the page
+        Uses the same approach as Sindikasi scraper:
+        - Find div containing identifier text
         - Look at next divs to find numeric values
         - First numeric = current year, second = previous year
         
         Args:
             soup: BeautifulSoup parsed page
             identifier: Identifier text to find
+            div_texts: _collect_div_texts(soup) computed once by the caller (optional, built from soup if None)
+            label_divs: _find_label_divs() result computed by the caller (optional, searched if None)
             
         Returns:
             dict with {'2025': value, '2024': value} or {'2025': 0.0, '2024': 0.0} if not found
@@ -4435,6 +4646,12 @@ class OJKExtJSScraper:
                 # Normalize spaces
                 text = text.replace('\xa0', ' ').replace('&nbsp;', ' ').strip()
                 
+                # Fast path: plain digits with comma thousands separators ("1,234,567") -
+                # a trailing ",dd" would be a decimal, so the last comma needs 3+ digits after it
+                stripped = text.translate(_FAST_STRIP)
+                if stripped.isdecimal() and (',' not in text or len(text.rpartition(',')[2].translate(_FAST_STRIP)) > 2):
+                    return float(stripped)
+                
                 # Use _clean_numeric_text to properly handle Indonesian format (handles both whole numbers and decimals)
                 return self._clean_numeric_text(text)
             
@@ -4448,8 +4665,7 @@ class OJKExtJSScraper:
                     return text, ""
                 
                 # Find the split point: look for pattern where after comma, we have 3 digits, then a digit (not comma)
-                pattern = r',(\d{3})(\d)(?=,|\d|$)'
-                match = re.search(pattern, text)
+                match = _SPLIT_RE.search(text)
                 
                 if match:
                     split_pos = match.end(1)  # Position after the 3 digits (before the next digit)
@@ -4460,124 +4676,97 @@ class OJKExtJSScraper:
                 return text, ""
             
             # Find the <div> whose text contains our identifier
-            label_div = None
-            all_divs = soup.find_all('div')
+            if label_divs is None:
+                if div_texts is None:
+                    div_texts = self._collect_div_texts(soup)
+                label_divs = self._find_label_divs([identifier], div_texts)
+            label_div = label_divs.get(identifier)
             
-            for div in all_divs:
-                text = div.get_text(strip=True)
-                if not text:
+            if not label_div:
+                logger.debug("Identifier '%s' NOT FOUND in page", identifier)
+                return result
+            
+            # Get the next divs (in document order) that contain numeric values
+            # Look through next divs to find numeric values (up to 10 divs ahead)
+            numeric_count = 0
+            for next_div in label_div.find_all_next('div', limit=10):  # Check up to 10 next divs
+                if numeric_count >= 2:  # We need 2 values
+                    break
+                
+                div_text = next_div.get_text(strip=True)
+                
+                if not div_text:
                     continue
                 
-                # Skip divs that are too long (likely contain entire page content)
-                if len(text) > 5000:
+                # Skip very long divs (likely contain entire page content)
+                if len(div_text) > 5000:
                     continue
                 
-                # Check if identifier is in text
-                if identifier.lower() in text.lower():
-                    # Prefer divs where identifier is a significant part of the text
-                    text_lower = text.lower()
-                    identifier_lower = identifier.lower()
-                    
-                    # If text is short or identifier is at the start/end, it's likely the right div
-                    if len(text) < 200 or text_lower.startswith(identifier_lower) or text_lower.endswith(identifier_lower):
-                        label_div = div
-                        print(f"  [DEBUG] Found identifier '{identifier}' in <div>: '{text[:100]}...'")
-                        break
-            
-            if not label_div:
-                print(f"  [DEBUG] Identifier '{identifier}' NOT FOUND in page")
-                return result
-            
-            # Find the index of this div and get the next divs that contain numeric values
-            try:
-                div_index = all_divs.index(label_div)
-                # Look through next divs to find numeric values (up to 10 divs ahead)
-                numeric_count = 0
-                for j in range(1, min(11, len(all_divs) - div_index)):  # Check up to 10 next divs
-                    if numeric_count >= 2:  # We need 2 values
-                        break
+                # Skip if it's clearly another identifier (contains common identifier keywords)
+                if _SKIP_RE.search(div_text):
+                    continue
+                
+                # Check if it contains concatenated numbers (has comma and might have split pattern)
+                if ',' in div_text and len(div_text) > 10:
+                    # Try to split concatenated numbers
+                    current_year_text, prev_year_text = split_concatenated_numbers(div_text)
                     
-                    if div_index + j < len(all_divs):
-                        next_div = all_divs[div_index + j]
-                        div_text = next_div.get_text(strip=True)
-                        
-                        if not div_text:
-                            continue
-                        
-                        # Skip very long divs (likely contain entire page content)
-                        if len(div_text) > 5000:
-                            continue
+                    if prev_year_text:
+                        # Found concatenated numbers, extract both
+                        current_number = extract_number(current_year_text)
+                        prev_number = extract_number(prev_year_text)
                         
-                        # Skip if it's clearly another identifier (contains common identifier keywords)
-                        if any(keyword in div_text.lower() for keyword in ['kepada', 'pihak', 'bank', 'bpr', 'report viewer', 'configuration error', 'piutang', 'aset', 'dpk', 'laba', 'rasio']):
-                            continue
-                        
-                        # Check if it contains concatenated numbers (has comma and might have split pattern)
-                        if ',' in div_text and len(div_text) > 10:
-                            # Try to split concatenated numbers
-                            current_year_text, prev_year_text = split_concatenated_numbers(div_text)
+                        # Validate numbers are reasonable
+                        if (current_number >= 0 and current_number < 1e15 and current_number != float('inf') and
+                            prev_number >= 0 and prev_number < 1e15 and prev_number != float('inf')):
                             
-                            if prev_year_text:
-                                # Found concatenated numbers, extract both
-                                current_number = extract_number(current_year_text)
-                                prev_number = extract_number(prev_year_text)
-                                
-                                # Validate numbers are reasonable
-                                if (current_number >= 0 and current_number < 1e15 and current_number != float('inf') and
-                                    prev_number >= 0 and prev_number < 1e15 and prev_number != float('inf')):
-                                    
-                                    if numeric_count == 0:
-                                        result['2025'] = current_number
-                                        numeric_count += 1
-                                    
-                                    if numeric_count == 1:
-                                        result['2024'] = prev_number
-                                        numeric_count += 1
-                                    
-                                    if numeric_count >= 2:
-                                        break
-                                    continue
-                        
-                        # Check if this div looks like it contains a single formatted number
-                        if len(div_text) > 100:
-                            continue
-                        
-                        # Extract number from single number text
-                        number = extract_number(div_text)
-                        
-                        # Validate the number is reasonable
-                        if number >= 0 and number < 1e15 and number != float('inf'):
-                            if numeric_count == 0:
-                                result['2025'] = number
-                                numeric_count += 1
-                            elif numeric_count == 1:
-                                result['2024'] = number
-                                numeric_count += 1
-                        elif number == 0 and any(char.isdigit() for char in div_text) and len(div_text) < 50:
-                            # Zero value is valid if it's a short text with digits
                             if numeric_count == 0:
-                                result['2025'] = number
+                                result['2025'] = current_number
                                 numeric_count += 1
-                            elif numeric_count == 1:
-                                result['2024'] = number
+                            
+                            if numeric_count == 1:
+                                result['2024'] = prev_number
                                 numeric_count += 1
-            except ValueError:
-                print(f"  [DEBUG] Identifier '{identifier}' found but couldn't find its index")
-                return result
+                            
+                            if numeric_count >= 2:
+                                break
+                            continue
+                
+                # Check if this div looks like it contains a single formatted number
+                if len(div_text) > 100:
+                    continue
+                
+                # Extract number from single number text
+                number = extract_number(div_text)
+                
+                # Validate the number is reasonable
+                if number >= 0 and number < 1e15 and number != float('inf'):
+                    if numeric_count == 0:
+                        result['2025'] = number
+                        numeric_count += 1
+                    elif numeric_count == 1:
+                        result['2024'] = number
+                        numeric_count += 1
+                elif number == 0 and any(char.isdigit() for char in div_text) and len(div_text) < 50:
+                    # Zero value is valid if it's a short text with digits
+                    if numeric_count == 0:
+                        result['2025'] = number
+                        numeric_count += 1
+                    elif numeric_count == 1:
+                        result['2024'] = number
+                        numeric_count += 1
             
             if result['2025'] == 0.0 and result['2024'] == 0.0:
-                print(f"  [DEBUG] Identifier '{identifier}' found but no numeric values extracted from next divs")
+                logger.debug("Identifier '%s' found but no numeric values extracted from next divs", identifier)
             elif result['2024'] == 0.0:
-                print(f"  [DEBUG] Identifier '{identifier}' found but only 1 value extracted")
+                logger.debug("Identifier '%s' found but only 1 value extracted", identifier)
             
         except Exception as e:
-            print(f"  [DEBUG] Error extracting identifier '{identifier}': {e}")
-            import traceback
-            print(traceback.format_exc())
+            logger.debug("Error extracting identifier '%s': %s", identifier, e, exc_info=True)
         
         return result
     
-    def _parse_form1_direct_url(self) -> dict:
+    def _parse_form1_direct_url(self, page_source: str = None) -> dict:
         """
         Parse BPK-901-000001 data using direct URL
         
@@ -4586,6 +4775,9 @@ class OJKExtJSScraper:
         - KREDIT: Sum of (a) Kepada BPR, (b) Kepada Bank Umum, (c) Kepada non bank – pihak terkait, (d) Kepada non bank – pihak tidak terkait
         - DPK: Sum of (a) Tabungan, (b) Deposito, (c) Simpanan dari Bank Lain
         
+        Args:
+            page_source: Report HTML already fetched over HTTP; if None, read from the browser
+            
         Returns:
             dict with structure:
             {
@@ -4601,19 +4793,13 @@ class OJKExtJSScraper:
         }
         
         try:
-            # Wait a bit for page to load
-            time.sleep(3.0)
-            
-            # Get page source (check iframes first)
-            page_source, report_iframe = self._get_page_source_with_iframe()
-            soup = BeautifulSoup(page_source, 'html.parser')
-            
-            # Extract ASET
-            aset_values = self._extract_identifier_value(soup, "Total Aset")
-            result['ASET'] = aset_values
-            print(f"    ASET (Total Aset): 2025={aset_values['2025']:,.2f}, 2024={aset_values['2024']:,.2f}")
-            
-            # Extract KREDIT components
+            if page_source is None:
+                # Wait until the report (or its iframe) is on the page instead of a fixed sleep
+                self._wait_for_direct_url_report(1)
+                
+                # Get page source (check iframes first)
+                page_source, report_iframe = self._get_page_source_with_iframe()
+            # KREDIT components
             kredit_identifiers = [
                 "Kepada BPR",
                 "Kepada Bank Umum",
@@ -4621,8 +4807,24 @@ class OJKExtJSScraper:
                 "Kepada non bank – pihak tidak terkait"
             ]
             
+            # DPK components
+            dpk_identifiers = [
+                "Tabungan",
+                "Deposito",
+                "Simpanan dari Bank Lain"
+            ]
+            
+            # Locate every identifier in a single pass over the page
+            identifier_values = self._extract_many_identifiers(page_source, ["Total Aset"] + kredit_identifiers + dpk_identifiers)
+            
+            # Extract ASET
+            aset_values = identifier_values["Total Aset"]
+            result['ASET'] = aset_values
+            print(f"    ASET (Total Aset): 2025={aset_values['2025']:,.2f}, 2024={aset_values['2024']:,.2f}")
+            
+            # Extract KREDIT components
             for identifier in kredit_identifiers:
-                values = self._extract_identifier_value(soup, identifier)
+                values = identifier_values[identifier]
                 result['KREDIT']['individual'][identifier] = values
                 result['KREDIT']['2025'] += values['2025']
                 result['KREDIT']['2024'] += values['2024']
@@ -4631,14 +4833,8 @@ class OJKExtJSScraper:
             print(f"    KREDIT Total: 2025={result['KREDIT']['2025']:,.2f}, 2024={result['KREDIT']['2024']:,.2f}")
             
             # Extract DPK components
-            dpk_identifiers = [
-                "Tabungan",
-                "Deposito",
-                "Simpanan dari Bank Lain"
-            ]
-            
             for identifier in dpk_identifiers:
-                values = self._extract_identifier_value(soup, identifier)
+                values = identifier_values[identifier]
                 result['DPK']['individual'][identifier] = values
                 result['DPK']['2025'] += values['2025']
                 result['DPK']['2024'] += values['2024']
@@ -4654,7 +4850,7 @@ class OJKExtJSScraper:
             print(traceback.format_exc())
             return result
     
-    def _parse_form2_direct_url(self) -> dict:
+    def _parse_form2_direct_url(self, page_source: str = None) -> dict:
         """
         Parse BPK-901-000002 data using direct URL
         
@@ -4662,6 +4858,9 @@ class OJKExtJSScraper:
         - LABA KOTOR: LABA (RUGI) TAHUN BERJALAN SEBELUM PAJAK PENGHASILAN
         - LABA BERSIH: JUMLAH LABA (RUGI) TAHUN BERJALAN
         
+        Args:
+            page_source: Report HTML already fetched over HTTP; if None, read from the browser
+            
         Returns:
             dict with structure:
             {
@@ -4675,20 +4874,24 @@ class OJKExtJSScraper:
         }
         
         try:
-            # Wait a bit for page to load
-            time.sleep(3.0)
-            
-            # Get page source (check iframes first)
-            page_source, report_iframe = self._get_page_source_with_iframe()
-            soup = BeautifulSoup(page_source, 'html.parser')
+            if page_source is None:
+                # Wait until the report (or its iframe) is on the page instead of a fixed sleep
+                self._wait_for_direct_url_report(2)
+                
+                # Get page source (check iframes first)
+                page_source, report_iframe = self._get_page_source_with_iframe()
+            # Locate both identifiers in a single pass over the page
+            laba_kotor_identifier = "LABA (RUGI) TAHUN BERJALAN SEBELUM PAJAK PENGHASILAN"
+            laba_bersih_identifier = "JUMLAH LABA (RUGI) TAHUN BERJALAN"
+            identifier_values = self._extract_many_identifiers(page_source, [laba_kotor_identifier, laba_bersih_identifier])
             
             # Extract LABA KOTOR
-            laba_kotor_values = self._extract_identifier_value(soup, "LABA (RUGI) TAHUN BERJALAN SEBELUM PAJAK PENGHASILAN")
+            laba_kotor_values = identifier_values[laba_kotor_identifier]
             result['LABA KOTOR'] = laba_kotor_values
             print(f"    LABA KOTOR: 2025={laba_kotor_values['2025']:,.2f}, 2024={laba_kotor_values['2024']:,.2f}")
             
             # Extract LABA BERSIH
-            laba_bersih_values = self._extract_identifier_value(soup, "JUMLAH LABA (RUGI) TAHUN BERJALAN")
+            laba_bersih_values = identifier_values[laba_bersih_identifier]
             result['LABA BERSIH'] = laba_bersih_values
             print(f"    LABA BERSIH: 2025={laba_bersih_values['2025']:,.2f}, 2024={laba_bersih_values['2024']:,.2f}")
             
@@ -4700,7 +4903,7 @@ class OJKExtJSScraper:
             print(traceback.format_exc())
             return result
     
-    def _parse_form3_direct_url(self) -> dict:
+    def _parse_form3_direct_url(self, page_source: str = None) -> dict:
         """
         Parse BPK-901-000003 data using direct URL
         
@@ -4713,6 +4916,9 @@ class OJKExtJSScraper:
         - LDR: Loan to Deposit Ratio (LDR)
         - Cash Ratio: Cash Ratio
         
+        Args:
+            page_source: Report HTML already fetched over HTTP; if None, read from the browser
+            
         Returns:
             dict with structure:
             {
@@ -4734,15 +4940,17 @@ class OJKExtJSScraper:
         ]
         
         try:
-            # Wait a bit for page to load
-            time.sleep(3.0)
-            
-            # Get page source (check iframes first)
-            page_source, report_iframe = self._get_page_source_with_iframe()
-            soup = BeautifulSoup(page_source, 'html.parser')
+            if page_source is None:
+                # Wait until the report (or its iframe) is on the page instead of a fixed sleep
+                self._wait_for_direct_url_report(3)
+                
+                # Get page source (check iframes first)
+                page_source, report_iframe = self._get_page_source_with_iframe()
+            # Locate every ratio identifier in a single pass over the page
+            identifier_values = self._extract_many_identifiers(page_source, [identifier for _, identifier in ratios])
             
             for ratio_name, identifier in ratios:
-                values = self._extract_identifier_value(soup, identifier)
+                values = identifier_values[identifier]
                 result[ratio_name] = values
                 # Format ratios without thousands separators (they're usually percentages)
                 print(f"    {ratio_name}: 2025={values['2025']:.2f}, 2024={values['2024']:.2f}")
@@ -4755,6 +4963,25 @@ class OJKExtJSScraper:
             print(traceback.format_exc())
             return result
     
+    def _is_zero_value(self, value) -> bool:
+        """
+        Check if an Excel cell value is 0, None, or "0,00"/"0.00" format
+        
+        Args:
+            value: Cell value (None, int, float or str)
+            
+        Returns:
+            True if the value is effectively zero
+        """
+        if value is None:
+            return True
+        if isinstance(value, (int, float)):
+            return value == 0
+        if isinstance(value, str):
+            # String formats like "", "0", "0,00", "0.000", "-", "  -  "
+            return bool(_ZERO_STR_RE.match(value))
+        return False
+    
     def _read_excel_for_zero_values(self, month: str, year: str) -> list:
         """
         Read Excel file and find banks with 0 or 0,00 values in KPMM (first ratio table in Rasio sheet)
@@ -4781,7 +5008,8 @@ class OJKExtJSScraper:
                 return banks_with_zero
             
             print(f"  [INFO] Reading Excel file for zero KPMM values: {filename}")
-            wb = load_workbook(filepath, data_only=True)
+            # Read-only: cells are streamed instead of materializing every sheet as cell objects
+            wb = load_workbook(filepath, data_only=True, read_only=True)
             
             month_num = self._get_month_number(month)
             sheet_name_prefix = f"{month_num}-{year[-2:]}"
@@ -4796,8 +5024,23 @@ class OJKExtJSScraper:
             ws = wb[rasio_sheet_name]
             print(f"    Checking sheet: {rasio_sheet_name} (KPMM only)")
             
+            # Stream columns A-D as plain tuples (No, Nama Bank, Lokasi, KPMM), only as far as needed:
+            # KPMM is the first ratio table, so the rest of the sheet is usually never parsed.
+            # rows[row_num - 1] is Excel row row_num
+            row_iter = ws.iter_rows(min_col=1, max_col=4, values_only=True)
+            rows = []
+            
+            def read_rows(count=None) -> None:
+                # Extend rows to at least count rows (None = to the end of the sheet)
+                for row in row_iter:
+                    rows.append(tuple(row) + (None,) * (4 - len(row)))
+                    if count is not None and len(rows) >= count:
+                        return
+            
+            read_rows(49)
+            
             # Track banks with zero KPMM values
-            bank_zero_map = {}  # {bank_key: {'bank_name': str, 'city': str, 'sheets_with_zero': set}}
+            bank_zero_map = {}  # {(bank_name, city): sheets_with_zero set}
             
             # Find KPMM table by looking for header row with "KPMM" as column header
             # Structure: Header row has columns: No, Nama Bank, Lokasi, KPMM
@@ -4805,24 +5048,17 @@ class OJKExtJSScraper:
             kpmm_data_start_row = None
             
             # Look for header row that contains "KPMM" as a column header
-            for row_num in range(1, min(50, ws.max_row + 1)):  # Check first 50 rows for header
+            for row_num, row in enumerate(rows[:49], start=1):  # Check first 49 rows for header
                 # Check if this row has "KPMM" in any cell (likely column D/4)
-                for col_num in range(1, 5):  # Check columns A-D
-                    cell_value = ws.cell(row=row_num, column=col_num).value
-                    if cell_value and "KPMM" in str(cell_value).upper():
-                        # Also check if this looks like a header row (has "No", "Nama Bank", "Lokasi")
-                        no_cell = ws.cell(row=row_num, column=1).value
-                        nama_bank_cell = ws.cell(row=row_num, column=2).value
-                        lokasi_cell = ws.cell(row=row_num, column=3).value
-                        
-                        if (no_cell and ("No" in str(no_cell) or str(no_cell).isdigit()) and
-                            nama_bank_cell and "Nama" in str(nama_bank_cell) and "Bank" in str(nama_bank_cell)):
-                            kpmm_header_row = row_num
-                            kpmm_data_start_row = row_num + 1  # Data starts after header
-                            print(f"    Found KPMM table header at row {row_num}")
-                            break
-                
-                if kpmm_header_row:
+                if not any(c and "KPMM" in str(c).upper() for c in row):
+                    continue
+                # Also check if this looks like a header row (has "No", "Nama Bank", "Lokasi")
+                no_cell, nama_bank_cell = row[0], row[1]
+                if (no_cell and ("No" in str(no_cell) or str(no_cell).isdigit()) and
+                    nama_bank_cell and "Nama" in str(nama_bank_cell) and "Bank" in str(nama_bank_cell)):
+                    kpmm_header_row = row_num
+                    kpmm_data_start_row = row_num + 1  # Data starts after header
+                    print(f"    Found KPMM table header at row {row_num}")
                     break
             
             if not kpmm_header_row:
@@ -4830,11 +5066,16 @@ class OJKExtJSScraper:
                 wb.close()
                 return banks_with_zero
             
+            # The end scan looks at up to 199 rows after the header, plus 2 rows of look-ahead
+            read_rows(kpmm_data_start_row + 202)
+            max_row = len(rows)
+            
             # Find where KPMM table ends (next header row or empty row)
-            kpmm_data_end_row = ws.max_row + 1
-            for row_num in range(kpmm_data_start_row + 1, min(kpmm_data_start_row + 200, ws.max_row + 1)):
+            kpmm_data_end_row = None
+            scan_rows = rows[kpmm_data_start_row:kpmm_data_start_row + 199]
+            for row_num, row in enumerate(scan_rows, start=kpmm_data_start_row + 1):
                 # Check if this row is a header for next table (has ratio name like "PPKA", "NPL", etc.)
-                cell_value = ws.cell(row=row_num, column=4).value  # Column D
+                cell_value = row[3]  # Column D
                 if cell_value:
                     cell_str = str(cell_value).upper()
                     # Check if it's another ratio header (not KPMM)
@@ -4843,78 +5084,41 @@ class OJKExtJSScraper:
                         print(f"    Found end of KPMM table at row {row_num} (next ratio: {cell_str})")
                         break
                 # Also check if row is empty (might indicate end of table)
-                bank_name = ws.cell(row=row_num, column=2).value
+                bank_name = row[1]
                 if not bank_name:
                     # Check a few more rows to see if table really ended
                     empty_count = 0
-                    for check_row in range(row_num, min(row_num + 3, ws.max_row + 1)):
-                        if not ws.cell(check_row, 2).value:
+                    for check_row in range(row_num, min(row_num + 3, max_row + 1)):
+                        if not rows[check_row - 1][1]:
                             empty_count += 1
                     if empty_count >= 2:
                         kpmm_data_end_row = row_num
                         print(f"    Found end of KPMM table at row {row_num} (empty rows)")
                         break
             
-            # Check KPMM data rows
-            for row_num in range(kpmm_data_start_row, kpmm_data_end_row):
-                bank_name_cell = ws.cell(row=row_num, column=2)  # Column B: Nama Bank
-                lokasi_cell = ws.cell(row=row_num, column=3)  # Column C: Lokasi
-                value_cell = ws.cell(row=row_num, column=4)  # Column D: KPMM value
-                
-                bank_name = bank_name_cell.value
-                lokasi = lokasi_cell.value if lokasi_cell.value else ""
-                value = value_cell.value
-                
-                if not bank_name:
-                    continue
-                
+            if kpmm_data_end_row is None:
+                # No end found - the table runs to the end of the sheet
+                read_rows()
+                kpmm_data_end_row = len(rows) + 1
+            
+            # Check KPMM data rows - keep only rows with a bank name and a zero KPMM value
+            # (Column B: Nama Bank, Column C: Lokasi, Column D: KPMM value)
+            zero_rows = [row for row in rows[kpmm_data_start_row - 1:kpmm_data_end_row - 1] if row[1] and self._is_zero_value(row[3])]
+            
+            for _, bank_name, lokasi, value in zero_rows:
                 bank_name = str(bank_name).strip()
                 city = str(lokasi).strip() if lokasi else ""
                 
-                # Check if value is 0, None, or "0,00"/"0.00" format
-                is_zero = False
-                if value is None:
-                    is_zero = True
-                elif isinstance(value, (int, float)):
-                    is_zero = (value == 0 or value == 0.0)
-                elif isinstance(value, str):
-                    # Check for string formats like "0,00", "0.00", "0"
-                    value_clean = value.strip()
-                    # Remove all commas, dots, and spaces to check if it's effectively zero
-                    cleaned = value_clean.replace(',', '').replace('.', '').replace(' ', '').replace('-', '')
-                    # Check if it's empty, just zeros, or matches common zero patterns
-                    if cleaned == '' or cleaned == '0' or cleaned == '00' or cleaned == '000':
-                        is_zero = True
-                    # Also check direct string matches for common zero formats
-                    elif value_clean.lower() in ['0', '0,00', '0.00', '0,0', '0.0', '0,000', '0.000', '-', '']:
-                        is_zero = True
-                    else:
-                        # Try to parse as float to check if it's zero
-                        try:
-                            # Replace comma with dot for parsing
-                            parsed = float(value_clean.replace(',', '.'))
-                            is_zero = (parsed == 0.0)
-                        except:
-                            pass
-                
-                # If KPMM is zero, add bank to retry list
-                if is_zero:
-                    bank_key = f"{bank_name}|{city}"
-                    if bank_key not in bank_zero_map:
-                        bank_zero_map[bank_key] = {
-                            'bank_name': bank_name,
-                            'city': city,
-                            'sheets_with_zero': set()
-                        }
-                    bank_zero_map[bank_key]['sheets_with_zero'].add(rasio_sheet_name)
-                    print(f"      Found zero KPMM: {bank_name} ({city}) - value: {value}")
+                # KPMM is zero, add bank to retry list
+                bank_zero_map.setdefault((bank_name, city), set()).add(rasio_sheet_name)
+                print(f"      Found zero KPMM: {bank_name} ({city}) - value: {value}")
             
             # Convert to list format
-            for bank_data in bank_zero_map.values():
+            for (bank_name, city), sheets_with_zero in bank_zero_map.items():
                 banks_with_zero.append({
-                    'bank_name': bank_data['bank_name'],
-                    'city': bank_data['city'],
-                    'sheets_with_zero': list(bank_data['sheets_with_zero'])
+                    'bank_name': bank_name,
+                    'city': city,
+                    'sheets_with_zero': list(sheets_with_zero)
                 })
             
             print(f"  [INFO] Found {len(banks_with_zero)} banks with zero KPMM values")
@@ -4930,6 +5134,91 @@ class OJKExtJSScraper:
             print(traceback.format_exc())
             return banks_with_zero
     
+    def _retry_sleep(self, attempt: int, base: float = 3.0) -> float:
+        """
+        Exponential backoff with jitter for direct URL retries
+        
+        Args:
+            attempt: Retry attempt number (1 = first retry)
+            base: Base delay in seconds (3.0 = the old fixed wait after a refresh, on average)
+            
+        Returns:
+            Delay in seconds: base * 2^(attempt-1) * (0.5..1.5), capped at RETRY_BACKOFF_CAP
+        """
+        return min(self.RETRY_BACKOFF_CAP, base * (2 ** max(attempt - 1, 0)) * (0.5 + random.random()))
+    
+    def _get_retry_checkpoint_path(self, month: str, year: str) -> Path:
+        """
+        Path of the retry checkpoint file for a period
+        e.g., publikasi/.retry_checkpoint_09_2025.json
+        
+        Args:
+            month: Month name (e.g., "September")
+            year: Year (e.g., "2025")
+            
+        Returns:
+            Path object
+        """
+        return self.output_dir / "publikasi" / f".retry_checkpoint_{self._get_month_number(month)}_{year}.json"
+    
+    def _load_retry_checkpoint(self, checkpoint_path: Path) -> dict:
+        """
+        Load the retry checkpoint left by an interrupted retry run
+        
+        Args:
+            checkpoint_path: Path from _get_retry_checkpoint_path
+            
+        Returns:
+            Dict with 'results' (same shape as retry_results) and 'processed' (bank names already retried),
+            empty if there is no usable checkpoint
+        """
+        if not checkpoint_path.exists():
+            return {}
+        
+        try:
+            with open(checkpoint_path, 'r', encoding='utf-8') as f:
+                checkpoint = json.load(f)
+            return {
+                'results': checkpoint.get('results', {}),
+                'processed': checkpoint.get('processed', [])
+            }
+        except Exception as e:
+            print(f"  [WARNING] Could not read retry checkpoint {checkpoint_path.name}: {e}")
+            return {}
+    
+    def _save_retry_checkpoint(self, checkpoint_path: Path, retry_results: dict, processed: list):
+        """
+        Write the retry checkpoint (temp file + rename, so a crash mid-write keeps the previous one)
+        
+        Args:
+            checkpoint_path: Path from _get_retry_checkpoint_path
+            retry_results: Retry data collected so far
+            processed: Bank names already retried
+        """
+        try:
+            checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = checkpoint_path.with_suffix('.tmp')
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'results': retry_results, 'processed': processed}, f, ensure_ascii=False)
+            temp_path.replace(checkpoint_path)
+            logger.debug(f"Retry checkpoint saved: {len(processed)} banks")
+        except Exception as e:
+            print(f"  [WARNING] Could not write retry checkpoint: {e}")
+    
+    def _has_nonzero_value(self, data) -> bool:
+        """
+        Check whether parsed form data contains at least one non-zero number
+        
+        Args:
+            data: Parsed form dict (nested dicts of numbers)
+            
+        Returns:
+            True if any nested numeric value is non-zero
+        """
+        if isinstance(data, dict):
+            return any(self._has_nonzero_value(value) for value in data.values())
+        return isinstance(data, (int, float)) and data != 0
+    
     def _retry_bank_with_direct_url(self, bank_name: str, month: str, year: str) -> dict:
         """
         Retry single bank using direct URL method
@@ -4947,14 +5236,33 @@ class OJKExtJSScraper:
             'form2': None,
             'form3': None
         }
+        failed_loads = 0
+        budget_exhausted = False
         
         try:
             # Get target month and year
             month_num = self._month_name_to_number(month)
             form_numbers = [1, 2, 3]
+            form_parsers = {
+                1: self._parse_form1_direct_url,
+                2: self._parse_form2_direct_url,
+                3: self._parse_form3_direct_url
+            }
             
             print(f"  [INFO] Retrying bank: {bank_name[:80]}...")
             
+            # Forms that already succeeded for this bank/period in this session are not fetched again
+            for form_num in form_numbers:
+                done = self._retry_done.get((bank_name, month, year, form_num))
+                if done:
+                    result[f'form{form_num}'] = done
+            form_numbers = [form_num for form_num in form_numbers if not result[f'form{form_num}']]
+            if not form_numbers:
+                print(f"  [OK] All forms already retrieved earlier in this session, skipping")
+                return result
+            if len(form_numbers) < 3:
+                print(f"  [INFO] Reusing earlier results, only fetching form(s): {form_numbers}")
+            
             # Get bank code formats (original + expanded if needed)
             bank_code_formats = self._format_bank_code_for_url(bank_name)
             print(f"  [DEBUG] Bank code formats to try: {bank_code_formats}")
@@ -4968,6 +5276,9 @@ class OJKExtJSScraper:
                 
                 # Process each form
                 for form_num in form_numbers:
+                    if failed_loads >= self.MAX_RETRY_ATTEMPTS:
+                        budget_exhausted = True
+                        break
                     print(f"    Processing form {form_num}...")
                     
                     # If form 1 had server error, skip forms 2 and 3 and try next bank code format
@@ -4979,68 +5290,92 @@ class OJKExtJSScraper:
                     url = self._build_report_url(bank_code, month_num, year, form_num)
                     print(f"    URL: {url}")
                     
-                    # Navigate to URL
+                    # Try a plain HTTP request first - no browser navigation or page-source round trip
                     max_retries = 2
                     parsed_data = None
+                    use_browser = True
                     
-                    for retry_attempt in range(max_retries + 1):
-                        try:
-                            if retry_attempt > 0:
-                                print(f"    Retrying form {form_num} (attempt {retry_attempt + 1}/{max_retries + 1})...")
-                                # Refresh the page on retry
-                                self.driver.refresh()
-                                time.sleep(3.0)
-                            else:
-                                self.driver.get(url)
-                                time.sleep(2.0)  # Wait for page to load
-                            
-                            # Check for server error
-                            if self._check_for_server_error():
-                                print(f"    [WARNING] Server error for form {form_num}")
-                                if form_num == 1:
-                                    server_error_on_form1 = True
-                                break  # Break from retry loop, try next form or next format
-                            
-                            # Parse form data
+                    html = self._fetch_report_html(url)
+                    if html is not None:
+                        if self.SERVER_ERROR_TEXT in html:
+                            print(f"    [WARNING] Server error for form {form_num}")
+                            failed_loads += 1
                             if form_num == 1:
-                                parsed_data = self._parse_form1_direct_url()
-                            elif form_num == 2:
-                                parsed_data = self._parse_form2_direct_url()
-                            elif form_num == 3:
-                                parsed_data = self._parse_form3_direct_url()
-                            
-                            # If we got data, break from retry loop
-                            if parsed_data:
-                                break
+                                server_error_on_form1 = True
+                            use_browser = False
+                        elif self.DIRECT_URL_MARKERS[form_num] in html:
+                            parsed_data = form_parsers[form_num](page_source=html)
+                            # The marker alone may sit in a script/parameter list of a client-rendered
+                            # page - only skip the browser when the HTTP response gave real values
+                            if self._has_nonzero_value(parsed_data):
+                                print(f"    [DEBUG] Form {form_num} fetched over HTTP")
+                                use_browser = False
                             else:
-                                print(f"    [WARNING] Form {form_num} - no data parsed")
+                                print(f"    [DEBUG] Form {form_num} HTTP response has no values, loading it in the browser")
+                                parsed_data = None
+                    
+                    if use_browser:
+                        # Report is rendered client-side (or HTTP failed) - navigate with the browser
+                        for retry_attempt in range(max_retries + 1):
+                            if failed_loads >= self.MAX_RETRY_ATTEMPTS:
+                                budget_exhausted = True
+                                break
+                            try:
+                                if retry_attempt > 0:
+                                    print(f"    Retrying form {form_num} (attempt {retry_attempt + 1}/{max_retries + 1})...")
+                                    # Refresh the page on retry (backoff grows with each attempt)
+                                    self.driver.refresh()
+                                    time.sleep(self._retry_sleep(retry_attempt))
+                                else:
+                                    self.driver.get(url)
+                                    self._element_cache.clear()
+                                    time.sleep(2.0)  # Wait for page to load
+                                
+                                # Check for server error
+                                if self._check_for_server_error():
+                                    print(f"    [WARNING] Server error for form {form_num}")
+                                    failed_loads += 1
+                                    if form_num == 1:
+                                        server_error_on_form1 = True
+                                    break  # Break from retry loop, try next form or next format
+                                
+                                # Parse form data
+                                parsed_data = form_parsers[form_num]()
+                                
+                                # If we got data, break from retry loop
+                                if parsed_data:
+                                    break
+                                else:
+                                    print(f"    [WARNING] Form {form_num} - no data parsed")
+                                    failed_loads += 1
+                                    if retry_attempt < max_retries:
+                                        continue  # Retry
+                                    else:
+                                        break  # No more retries
+                                    
+                            except Exception as e:
+                                failed_loads += 1
+                                error_msg = str(e)
+                                # Check if it's a Chrome timeout error
+                                is_timeout_error = "timeout" in error_msg.lower() or "Timed out receiving message from renderer" in error_msg
+                                
+                                if is_timeout_error and retry_attempt < max_retries:
+                                    print(f"    [WARNING] Chrome timeout error on form {form_num}, refreshing page and retrying...")
+                                    try:
+                                        self.driver.refresh()
+                                        time.sleep(self._retry_sleep(retry_attempt + 1))
+                                        continue  # Retry
+                                    except:
+                                        pass
+                                
+                                print(f"    [ERROR] Error processing form {form_num}: {e}")
+                                import traceback
+                                print(traceback.format_exc())
+                                
                                 if retry_attempt < max_retries:
                                     continue  # Retry
                                 else:
                                     break  # No more retries
-                                
-                        except Exception as e:
-                            error_msg = str(e)
-                            # Check if it's a Chrome timeout error
-                            is_timeout_error = "timeout" in error_msg.lower() or "Timed out receiving message from renderer" in error_msg
-                            
-                            if is_timeout_error and retry_attempt < max_retries:
-                                print(f"    [WARNING] Chrome timeout error on form {form_num}, refreshing page and retrying...")
-                                try:
-                                    self.driver.refresh()
-                                    time.sleep(3.0)
-                                    continue  # Retry
-                                except:
-                                    pass
-                            
-                            print(f"    [ERROR] Error processing form {form_num}: {e}")
-                            import traceback
-                            print(traceback.format_exc())
-                            
-                            if retry_attempt < max_retries:
-                                continue  # Retry
-                            else:
-                                break  # No more retries
                     
                     # Store parsed data if we got it
                     if parsed_data:
@@ -5050,18 +5385,26 @@ class OJKExtJSScraper:
                             result['form2'] = parsed_data
                         elif form_num == 3:
                             result['form3'] = parsed_data
+                        if self._has_nonzero_value(parsed_data):
+                            # All-zero forms are not remembered - a later retry should fetch them again
+                            self._retry_done[(bank_name, month, year, form_num)] = parsed_data
                         
                         format_success = True
                         print(f"    [OK] Form {form_num} - data parsed successfully!")
                     
                     # If form 1 had server error, break from form loop to try next bank code format
-                    if server_error_on_form1:
+                    if server_error_on_form1 or budget_exhausted:
                         break
                 
                 # If this format worked, we can break
                 if format_success:
                     print(f"  [OK] Bank code format {format_idx} succeeded")
                     break  # Break from format loop
+                
+                if budget_exhausted:
+                    print(f"  [WARNING] {bank_name}: {failed_loads} failed page loads, giving up (MAX_RETRY_ATTEMPTS={self.MAX_RETRY_ATTEMPTS})")
+                    self._retry_skipped.append(bank_name)
+                    break
             
             return result
             
@@ -5070,6 +5413,8 @@ class OJKExtJSScraper:
             import traceback
             print(traceback.format_exc())
             return result
+        finally:
+            self._retry_failed_loads[bank_name] = failed_loads
     
     def _update_excel_with_retry_data(self, month: str, year: str, retry_results: dict):
         """
@@ -5093,12 +5438,34 @@ class OJKExtJSScraper:
                 print(f"  [WARNING] Excel file not found: {filepath}")
                 return
             
+            # Sheets that will actually receive values - a workbook nobody writes to is not loaded at all
+            needs_sheets = {
+                'ASET': any('ASET' in (b.get('form1') or {}) for b in retry_results.values()),
+                'KREDIT': any('KREDIT' in (b.get('form1') or {}) for b in retry_results.values()),
+                'DPK': any('DPK' in (b.get('form1') or {}) for b in retry_results.values()),
+                'LABA KOTOR': any('LABA KOTOR' in (b.get('form2') or {}) for b in retry_results.values()),
+                'RASIO': any(b.get('form3') for b in retry_results.values())
+            }
+            if not any(needs_sheets.values()):
+                print(f"  [INFO] No retry values for any sheet, Excel file not opened: {filename}")
+                return
+            
             print(f"  [INFO] Updating Excel file with retry data: {filename}")
-            wb = load_workbook(filepath)
+            # The only full (writable) load in the retry flow - the zero scan streams read-only.
+            # VBA and external link parts are never used by the publikasi workbooks, so skip them
+            wb = load_workbook(filepath, keep_vba=False, keep_links=False)
             
             month_num = self._get_month_number(month)
             sheet_name_prefix = f"{month_num}-{year[-2:]}"
             previous_year = str(int(year) - 1)
+            # Sheet names are the same for every bank - build them once
+            aset_sheet = f"{sheet_name_prefix} ASET"
+            kredit_sheet = f"{sheet_name_prefix} Kredit"
+            dpk_sheet = f"{sheet_name_prefix} DPK"
+            laba_kotor_sheet = f"{sheet_name_prefix} Laba Kotor"
+            rasio_sheet = f"{sheet_name_prefix} Rasio"
+            # wb.sheetnames builds a new list on every access - take one set snapshot
+            sheetnames = set(wb.sheetnames)
             
             # Define border style
             thin_border = Border(
@@ -5108,6 +5475,20 @@ class OJKExtJSScraper:
                 bottom=Side(style='thin')
             )
             
+            # (bank name, city) -> row number per sheet, built once per sheet on first use
+            row_indexes = {}
+            
+            def get_row_index(sheet_name: str) -> dict:
+                if sheet_name not in row_indexes:
+                    row_indexes[sheet_name] = self._build_bank_row_index(wb[sheet_name])
+                return row_indexes[sheet_name]
+            
+            # Ratio tables of the Rasio sheet, indexed once for all banks
+            rasio_index = None
+            
+            # Set once any cell is written - nothing to save otherwise
+            workbook_changed = False
+            
             # Update each bank in retry_results
             for bank_name, bank_data in retry_results.items():
                 city = bank_data.get('city', '')
@@ -5115,6 +5496,7 @@ class OJKExtJSScraper:
                 form2 = bank_data.get('form2')
                 form3 = bank_data.get('form3')
                 
+                # One progress line per bank; per-sheet details go to the debug log
                 print(f"  [INFO] Updating bank: {bank_name} ({city})")
                 
                 # Track if we updated any base values (for rasio recalculation)
@@ -5122,49 +5504,59 @@ class OJKExtJSScraper:
                 
                 # Update ASET sheet
                 if form1 and 'ASET' in form1:
-                    sheet_name = f"{sheet_name_prefix} ASET"
-                    if sheet_name in wb.sheetnames:
+                    sheet_name = aset_sheet
+                    if sheet_name in sheetnames:
                         ws = wb[sheet_name]
-                        self._update_excel_row_for_retry(ws, bank_name, city, 'ASET', form1['ASET'], year, previous_year, thin_border)
+                        workbook_changed |= self._update_excel_row_for_retry(ws, get_row_index(sheet_name), bank_name, city, 'ASET', form1['ASET'], year, previous_year, thin_border)
                         base_values_updated = True
                 
                 # Update Kredit sheet
                 if form1 and 'KREDIT' in form1:
-                    sheet_name = f"{sheet_name_prefix} Kredit"
-                    if sheet_name in wb.sheetnames:
+                    sheet_name = kredit_sheet
+                    if sheet_name in sheetnames:
                         ws = wb[sheet_name]
-                        self._update_excel_row_for_retry(ws, bank_name, city, 'Kredit', form1['KREDIT'], year, previous_year, thin_border)
+                        workbook_changed |= self._update_excel_row_for_retry(ws, get_row_index(sheet_name), bank_name, city, 'Kredit', form1['KREDIT'], year, previous_year, thin_border)
                         base_values_updated = True
                 
                 # Update DPK sheet
                 if form1 and 'DPK' in form1:
-                    sheet_name = f"{sheet_name_prefix} DPK"
-                    if sheet_name in wb.sheetnames:
+                    sheet_name = dpk_sheet
+                    if sheet_name in sheetnames:
                         ws = wb[sheet_name]
-                        self._update_excel_row_for_retry(ws, bank_name, city, 'DPK', form1['DPK'], year, previous_year, thin_border)
+                        workbook_changed |= self._update_excel_row_for_retry(ws, get_row_index(sheet_name), bank_name, city, 'DPK', form1['DPK'], year, previous_year, thin_border)
                         base_values_updated = True
                 
                 # Update Laba Kotor sheet
                 if form2 and 'LABA KOTOR' in form2:
-                    sheet_name = f"{sheet_name_prefix} Laba Kotor"
-                    if sheet_name in wb.sheetnames:
+                    sheet_name = laba_kotor_sheet
+                    if sheet_name in sheetnames:
                         ws = wb[sheet_name]
-                        self._update_excel_row_for_retry(ws, bank_name, city, 'Laba Kotor', form2['LABA KOTOR'], year, previous_year, thin_border)
+                        workbook_changed |= self._update_excel_row_for_retry(ws, get_row_index(sheet_name), bank_name, city, 'Laba Kotor', form2['LABA KOTOR'], year, previous_year, thin_border)
                         base_values_updated = True
                 
                 # Update Rasio sheet with scraped form3 data first
                 if form3:
-                    sheet_name = f"{sheet_name_prefix} Rasio"
-                    if sheet_name in wb.sheetnames:
+                    sheet_name = rasio_sheet
+                    if sheet_name in sheetnames:
                         ws = wb[sheet_name]
-                        self._update_rasio_sheet_for_retry(ws, bank_name, city, form3, year, previous_year, thin_border)
+                        if rasio_index is None:
+                            rasio_index = self._build_rasio_index(ws)
+                        workbook_changed |= self._update_rasio_sheet_for_retry(ws, bank_name, city, form3, year, previous_year, thin_border, rasio_index)
                 
                 # Recalculate rasio values from updated base values
                 if base_values_updated:
-                    sheet_name = f"{sheet_name_prefix} Rasio"
-                    if sheet_name in wb.sheetnames:
+                    sheet_name = rasio_sheet
+                    if sheet_name in sheetnames:
                         ws = wb[sheet_name]
-                        self._recalculate_rasio_from_base_values(wb, ws, bank_name, city, sheet_name_prefix, year, previous_year)
+                        if rasio_index is None:
+                            rasio_index = self._build_rasio_index(ws)
+                        workbook_changed |= self._recalculate_rasio_from_base_values(wb, ws, bank_name, city, sheet_name_prefix, year, previous_year, rasio_index, row_indexes)
+            
+            if not workbook_changed:
+                # Saving rewrites (and re-copies) the whole workbook - skip it when no value changed
+                print(f"  [INFO] No values changed, Excel file not rewritten: {filepath}")
+                wb.close()
+                return
             
             # Save updated Excel file
             wb.save(filepath)
@@ -5180,12 +5572,94 @@ class OJKExtJSScraper:
             import traceback
             print(traceback.format_exc())
     
-    def _update_excel_row_for_retry(self, ws, bank_name: str, city: str, data_type: str, values: dict, year: str, previous_year: str, border):
+    def _build_bank_row_index(self, ws) -> dict:
+        """
+        Map every data row of a bank sheet to its row number in one pass
+        
+        Args:
+            ws: Worksheet object (ASET, Kredit, DPK, Laba Kotor)
+            
+        Returns:
+            Dict of (bank_name, city) -> row_num (first matching row wins, data starts at row 3).
+            Names are interned, so lookups with _bank_lookup_key() keys compare by identity
+        """
+        row_index = {}
+        for row_num, (bank_name, city) in enumerate(ws.iter_rows(min_row=3, min_col=2, max_col=3, values_only=True), start=3):
+            if bank_name and city:
+                row_index.setdefault(self._bank_lookup_key(bank_name, city), row_num)
+        return row_index
+    
+    def _bank_lookup_key(self, bank_name, city) -> tuple:
+        """
+        Normalized (bank_name, city) key for the sheet row indexes
+        Strings are interned: the many "PT BPR ..." names share long prefixes, and interned
+        keys match by identity instead of a full character compare
+        
+        Args:
+            bank_name: Bank name (cell value or str)
+            city: City name (cell value or str)
+            
+        Returns:
+            Tuple of (bank_name, city)
+        """
+        return (sys.intern(str(bank_name).strip()), sys.intern(str(city).strip()))
+    
+    def _build_rasio_index(self, ws) -> dict:
+        """
+        Read the Rasio sheet once for ratio-table lookups
+        
+        Args:
+            ws: Rasio worksheet object
+            
+        Returns:
+            Dict with 'rows' (columns B-D value tuples), 'headers' (ratio name -> index of its
+            first header row) and 'tables' (ratio name -> {(bank_name, city): row_num}, filled lazily)
+        """
+        rows = [tuple(row) + (None,) * (3 - len(row)) for row in ws.iter_rows(min_col=2, max_col=4, values_only=True)]
+        headers = {}
+        for row_idx, (_, _, header_col_d) in enumerate(rows):
+            if isinstance(header_col_d, str) and header_col_d.strip():
+                headers.setdefault(header_col_d.strip(), row_idx)
+        return {'rows': rows, 'headers': headers, 'tables': {}}
+    
+    def _find_rasio_row(self, rasio_index: dict, ratio_key: str, lookup_key: tuple) -> tuple:
+        """
+        Find a bank's row in one ratio table of the Rasio sheet
+        
+        Args:
+            rasio_index: _build_rasio_index() result
+            ratio_key: Ratio name as in the table header (column D), stripped
+            lookup_key: _bank_lookup_key(bank_name, city) result
+            
+        Returns:
+            Tuple of (found_table, row_num); row_num is None if the bank is not in the table
+        """
+        if ratio_key not in rasio_index['headers']:
+            return False, None
+        
+        table = rasio_index['tables'].get(ratio_key)
+        if table is None:
+            # Data rows follow the header row until the first empty bank name
+            table = {}
+            rows = rasio_index['rows']
+            header_idx = rasio_index['headers'][ratio_key]
+            for row_num in range(header_idx + 2, len(rows) + 1):
+                bank_name, city, _ = rows[row_num - 1]
+                if not bank_name:
+                    break
+                if city:
+                    table.setdefault(self._bank_lookup_key(bank_name, city), row_num)
+            rasio_index['tables'][ratio_key] = table
+        
+        return True, table.get(lookup_key)
+    
+    def _update_excel_row_for_retry(self, ws, row_index: dict, bank_name: str, city: str, data_type: str, values: dict, year: str, previous_year: str, border) -> bool:
         """
         Update a single row in Excel sheet with retry data
         
         Args:
             ws: Worksheet object
+            row_index: _build_bank_row_index(ws) result
             bank_name: Bank name
             city: City name
             data_type: Type of data (ASET, Kredit, DPK, Laba Kotor)
@@ -5193,39 +5667,42 @@ class OJKExtJSScraper:
             year: Current year
             previous_year: Previous year
             border: Border style
+            
+        Returns:
+            True if any cell was written
         """
         try:
             # Find the row with matching bank name and city
-            for row_num in range(3, ws.max_row + 1):
-                bank_name_cell = ws.cell(row=row_num, column=2)  # Column B: Nama Bank
-                city_cell = ws.cell(row=row_num, column=3)  # Column C: Lokasi
+            row_num = row_index.get(self._bank_lookup_key(bank_name, city))
+            if row_num is None:
+                return False
+            
+            # Update values
+            val_2025 = values.get('2025', 0.0) if isinstance(values, dict) else 0.0
+            val_2024 = values.get('2024', 0.0) if isinstance(values, dict) else 0.0
+            
+            # Only update if we have non-zero values
+            if val_2025 != 0.0 or val_2024 != 0.0:
+                # Fetch the row's cells once (columns A-F) and index into the tuple
+                row_cells = next(ws.iter_rows(min_row=row_num, max_row=row_num, max_col=6))
+                row_cells[3].value = val_2025  # Current year
+                row_cells[4].value = val_2024  # Previous year
+                
+                # Recalculate Peningkatan
+                if val_2024 and val_2024 != 0:
+                    peningkatan = ((val_2025 - val_2024) / abs(val_2024)) * 100
+                else:
+                    peningkatan = 0 if val_2025 == 0 else 100
                 
-                if (bank_name_cell.value and str(bank_name_cell.value).strip() == str(bank_name).strip() and
-                    city_cell.value and str(city_cell.value).strip() == str(city).strip()):
-                    
-                    # Update values
-                    val_2025 = values.get('2025', 0.0) if isinstance(values, dict) else 0.0
-                    val_2024 = values.get('2024', 0.0) if isinstance(values, dict) else 0.0
-                    
-                    # Only update if we have non-zero values
-                    if val_2025 != 0.0 or val_2024 != 0.0:
-                        ws.cell(row=row_num, column=4).value = val_2025  # Current year
-                        ws.cell(row=row_num, column=5).value = val_2024  # Previous year
-                        
-                        # Recalculate Peningkatan
-                        if val_2024 and val_2024 != 0:
-                            peningkatan = ((val_2025 - val_2024) / abs(val_2024)) * 100
-                        else:
-                            peningkatan = 0 if val_2025 == 0 else 100
-                        
-                        ws.cell(row=row_num, column=6).value = peningkatan / 100  # Peningkatan
-                        
-                        print(f"    Updated {data_type}: {bank_name} - 2025={val_2025:,.2f}, 2024={val_2024:,.2f}")
-                        break
+                row_cells[5].value = peningkatan / 100  # Peningkatan
+                
+                logger.debug(f"Updated {data_type}: {bank_name} - 2025={val_2025:,.2f}, 2024={val_2024:,.2f}")
+                return True
         except Exception as e:
             print(f"    [ERROR] Error updating row for {bank_name}: {e}")
+        return False
     
-    def _read_base_value_from_sheet(self, wb, sheet_name: str, bank_name: str, city: str) -> dict:
+    def _read_base_value_from_sheet(self, wb, sheet_name: str, bank_name: str, city: str, row_indexes: dict = None) -> dict:
         """
         Read base value (ASET, Kredit, DPK, Laba Kotor) from a sheet for a specific bank
         
@@ -5234,6 +5711,8 @@ class OJKExtJSScraper:
             sheet_name: Name of the sheet
             bank_name: Bank name
             city: City name
+            row_indexes: Dict of sheet_name -> _build_bank_row_index() result, shared
+                         across banks (optional, missing entries are built and stored)
             
         Returns:
             Dict with {'2025': value, '2024': value} or None if not found
@@ -5245,29 +5724,28 @@ class OJKExtJSScraper:
             ws = wb[sheet_name]
             
             # Find the row with matching bank name and city
-            for row_num in range(3, ws.max_row + 1):
-                bank_name_cell = ws.cell(row=row_num, column=2)  # Column B: Nama Bank
-                city_cell = ws.cell(row=row_num, column=3)  # Column C: Lokasi
-                
-                if (bank_name_cell.value and str(bank_name_cell.value).strip() == str(bank_name).strip() and
-                    city_cell.value and str(city_cell.value).strip() == str(city).strip()):
-                    
-                    # Read values from columns 4 (2025) and 5 (2024)
-                    val_2025 = ws.cell(row=row_num, column=4).value
-                    val_2024 = ws.cell(row=row_num, column=5).value
-                    
-                    # Convert to float, default to 0.0 if None
-                    val_2025 = float(val_2025) if val_2025 is not None else 0.0
-                    val_2024 = float(val_2024) if val_2024 is not None else 0.0
-                    
-                    return {'2025': val_2025, '2024': val_2024}
+            if row_indexes is None:
+                row_indexes = {}
+            if sheet_name not in row_indexes:
+                row_indexes[sheet_name] = self._build_bank_row_index(ws)
+            row_num = row_indexes[sheet_name].get(self._bank_lookup_key(bank_name, city))
+            if row_num is None:
+                return None
             
-            return None
+            # Read values from columns 4 (2025) and 5 (2024)
+            val_2025 = ws.cell(row=row_num, column=4).value
+            val_2024 = ws.cell(row=row_num, column=5).value
+            
+            # Convert to float, default to 0.0 if None
+            val_2025 = float(val_2025) if val_2025 is not None else 0.0
+            val_2024 = float(val_2024) if val_2024 is not None else 0.0
+            
+            return {'2025': val_2025, '2024': val_2024}
         except Exception as e:
             print(f"    [ERROR] Error reading base value from {sheet_name} for {bank_name}: {e}")
             return None
     
-    def _recalculate_rasio_from_base_values(self, wb, rasio_ws, bank_name: str, city: str, sheet_name_prefix: str, year: str, previous_year: str):
+    def _recalculate_rasio_from_base_values(self, wb, rasio_ws, bank_name: str, city: str, sheet_name_prefix: str, year: str, previous_year: str, rasio_index: dict = None, row_indexes: dict = None) -> bool:
         """
         Recalculate rasio values from updated base values (ASET, Kredit, DPK, Laba Kotor)
         
@@ -5285,7 +5763,13 @@ class OJKExtJSScraper:
             sheet_name_prefix: Sheet name prefix (e.g., "09-25")
             year: Current year
             previous_year: Previous year
+            rasio_index: _build_rasio_index(rasio_ws) result (optional, built if None)
+            row_indexes: Shared sheet row indexes for _read_base_value_from_sheet (optional)
+            
+        Returns:
+            True if any ratio value was written
         """
+        updated = False
         try:
             # Read base values from their respective sheets
             aset_sheet = f"{sheet_name_prefix} ASET"
@@ -5293,14 +5777,14 @@ class OJKExtJSScraper:
             dpk_sheet = f"{sheet_name_prefix} DPK"
             laba_kotor_sheet = f"{sheet_name_prefix} Laba Kotor"
             
-            aset_values = self._read_base_value_from_sheet(wb, aset_sheet, bank_name, city)
-            kredit_values = self._read_base_value_from_sheet(wb, kredit_sheet, bank_name, city)
-            dpk_values = self._read_base_value_from_sheet(wb, dpk_sheet, bank_name, city)
-            laba_kotor_values = self._read_base_value_from_sheet(wb, laba_kotor_sheet, bank_name, city)
+            aset_values = self._read_base_value_from_sheet(wb, aset_sheet, bank_name, city, row_indexes)
+            kredit_values = self._read_base_value_from_sheet(wb, kredit_sheet, bank_name, city, row_indexes)
+            dpk_values = self._read_base_value_from_sheet(wb, dpk_sheet, bank_name, city, row_indexes)
+            laba_kotor_values = self._read_base_value_from_sheet(wb, laba_kotor_sheet, bank_name, city, row_indexes)
             
             if not any([aset_values, kredit_values, dpk_values, laba_kotor_values]):
                 print(f"    [WARNING] No base values found for {bank_name} to recalculate rasio")
-                return
+                return False
             
             # Calculate rasio values that can be calculated from base values
             calculated_ratios = {}
@@ -5330,49 +5814,30 @@ class OJKExtJSScraper:
             # Update rasio sheet with calculated values
             if calculated_ratios:
                 print(f"    [INFO] Recalculating rasio values from base values for {bank_name}")
+                if rasio_index is None:
+                    rasio_index = self._build_rasio_index(rasio_ws)
                 
                 # The rasio sheet has multiple tables (one per ratio type)
                 # Each table starts with a header row, then data rows
                 # We need to find the table for each ratio, then find the bank within that table
                 
+                # Normalize the bank/city lookup key once, not per ratio
+                lookup_key = self._bank_lookup_key(bank_name, city)
+                
                 for ratio_name, ratio_data in calculated_ratios.items():
                     val_2025 = ratio_data.get('2025', 0.0)
                     
                     if val_2025 == 0.0:
                         continue
                     
-                    # Find the table for this ratio by looking for the header row
-                    # Header row has: ['No', 'Nama Bank', 'Lokasi', ratio_name]
-                    found_table = False
-                    
-                    for row_num in range(1, rasio_ws.max_row + 1):
-                        # Check if this is a header row for the ratio we're looking for
-                        header_col_d = rasio_ws.cell(row=row_num, column=4).value
-                        if header_col_d and str(header_col_d).strip() == str(ratio_name).strip():
-                            # Found the header row for this ratio table
-                            # Data rows start from row_num + 1
-                            data_start_row = row_num + 1
-                            found_table = True
-                            
-                            # Search for the bank in this table
-                            for data_row in range(data_start_row, rasio_ws.max_row + 1):
-                                # Check if we've reached the next table (empty row or new header)
-                                bank_name_cell = rasio_ws.cell(row=data_row, column=2)  # Column B: Nama Bank
-                                city_cell = rasio_ws.cell(row=data_row, column=3)  # Column C: Lokasi
-                                
-                                # If we hit an empty bank name, we've passed this table
-                                if not bank_name_cell.value:
-                                    break
-                                
-                                # Check if this is our bank
-                                if (str(bank_name_cell.value).strip() == str(bank_name).strip() and
-                                    city_cell.value and str(city_cell.value).strip() == str(city).strip()):
-                                    # Found the bank, update the ratio value (column D)
-                                    rasio_ws.cell(row=data_row, column=4).value = val_2025
-                                    print(f"    Recalculated Rasio {ratio_name}: {bank_name} - {val_2025:,.2f}")
-                                    break
-                            
-                            break
+                    # Find the table for this ratio (header row: ['No', 'Nama Bank', 'Lokasi', ratio_name])
+                    # and the bank within it through the sheet index
+                    found_table, data_row = self._find_rasio_row(rasio_index, str(ratio_name).strip(), lookup_key)
+                    if data_row is not None:
+                        # Found the bank, update the ratio value (column D)
+                        rasio_ws.cell(row=data_row, column=4).value = val_2025
+                        updated = True
+                        logger.debug(f"Recalculated Rasio {ratio_name}: {bank_name} - {val_2025:,.2f}")
                     
                     if not found_table:
                         print(f"    [WARNING] Could not find table for ratio {ratio_name} in rasio sheet")
@@ -5381,8 +5846,9 @@ class OJKExtJSScraper:
             print(f"    [ERROR] Error recalculating rasio from base values for {bank_name}: {e}")
             import traceback
             traceback.print_exc()
+        return updated
     
-    def _update_rasio_sheet_for_retry(self, ws, bank_name: str, city: str, form3_data: dict, year: str, previous_year: str, border):
+    def _update_rasio_sheet_for_retry(self, ws, bank_name: str, city: str, form3_data: dict, year: str, previous_year: str, border, rasio_index: dict = None) -> bool:
         """
         Update Rasio sheet with retry data
         
@@ -5400,10 +5866,17 @@ class OJKExtJSScraper:
             year: Current year
             previous_year: Previous year
             border: Border style
+            rasio_index: _build_rasio_index(ws) result (optional, built if None)
+            
+        Returns:
+            True if any ratio value was written
         """
+        updated = False
         try:
             if not form3_data:
-                return
+                return False
+            if rasio_index is None:
+                rasio_index = self._build_rasio_index(ws)
             
             # Map form3 keys to rasio sheet ratio names
             # form3_data might have keys like 'ROA', 'LDR', 'KPMM', etc.
@@ -5420,6 +5893,9 @@ class OJKExtJSScraper:
                 'Cash Ratio': 'CR'
             }
             
+            # Normalize the bank/city lookup key once, not per ratio
+            lookup_key = self._bank_lookup_key(bank_name, city)
+            
             # For each ratio in form3_data, find its table and update the bank's value
             for form3_key, ratio_values in form3_data.items():
                 if not isinstance(ratio_values, dict):
@@ -5432,38 +5908,14 @@ class OJKExtJSScraper:
                 if val_2025 == 0.0:
                     continue
                 
-                # Find the table for this ratio by looking for the header row
-                # Header row has: ['No', 'Nama Bank', 'Lokasi', ratio_name]
-                found_table = False
-                
-                for row_num in range(1, ws.max_row + 1):
-                    # Check if this is a header row for the ratio we're looking for
-                    header_col_d = ws.cell(row=row_num, column=4).value
-                    if header_col_d and str(header_col_d).strip() == str(ratio_name).strip():
-                        # Found the header row for this ratio table
-                        # Data rows start from row_num + 1
-                        data_start_row = row_num + 1
-                        found_table = True
-                        
-                        # Search for the bank in this table (we need city to match, but if not available, match by bank name only)
-                        for data_row in range(data_start_row, ws.max_row + 1):
-                            # Check if we've reached the next table (empty row or new header)
-                            bank_name_cell = ws.cell(row=data_row, column=2)  # Column B: Nama Bank
-                            city_cell = ws.cell(row=data_row, column=3)  # Column C: Lokasi
-                            
-                            # If we hit an empty bank name, we've passed this table
-                            if not bank_name_cell.value:
-                                break
-                            
-                            # Check if this is our bank (match by bank name and city)
-                            if (str(bank_name_cell.value).strip() == str(bank_name).strip() and
-                                city_cell.value and str(city_cell.value).strip() == str(city).strip()):
-                                # Found the bank, update the ratio value (column D)
-                                ws.cell(row=data_row, column=4).value = val_2025
-                                print(f"    Updated Rasio {ratio_name}: {bank_name} - {val_2025:,.2f}")
-                                break
-                        
-                        break
+                # Find the table for this ratio (header row: ['No', 'Nama Bank', 'Lokasi', ratio_name])
+                # and the bank within it (bank name and city must match) through the sheet index
+                found_table, data_row = self._find_rasio_row(rasio_index, str(ratio_name).strip(), lookup_key)
+                if data_row is not None:
+                    # Found the bank, update the ratio value (column D)
+                    ws.cell(row=data_row, column=4).value = val_2025
+                    updated = True
+                    logger.debug(f"Updated Rasio {ratio_name}: {bank_name} - {val_2025:,.2f}")
                 
                 if not found_table:
                     print(f"    [WARNING] Could not find table for ratio {ratio_name} in rasio sheet")
@@ -5472,6 +5924,7 @@ class OJKExtJSScraper:
             print(f"    [ERROR] Error updating Rasio sheet for {bank_name}: {e}")
             import traceback
             traceback.print_exc()
+        return updated
     
     def _retry_zero_value_banks(self, month: str, year: str):
         """
@@ -5510,30 +5963,96 @@ class OJKExtJSScraper:
                 return
             
             print(f"  [INFO] Found {len(banks_with_zero)} banks with zero values to retry")
-            
-            # Retry each bank
-            retry_results = {}
+            self._retry_failed_loads.clear()
+            self._retry_skipped.clear()
+            
+            # Resume from the checkpoint of an interrupted run (banks already retried are skipped)
+            checkpoint_path = self._get_retry_checkpoint_path(month, year)
+            checkpoint = self._load_retry_checkpoint(checkpoint_path)
+            retry_results = checkpoint.get('results', {})
+            processed_banks = list(checkpoint.get('processed', []))
+            if processed_banks:
+                already_processed = set(processed_banks)
+                banks_with_zero = [b for b in banks_with_zero if b['bank_name'] not in already_processed]
+                print(f"  [INFO] Resuming from retry checkpoint: {len(already_processed)} banks already retried, {len(banks_with_zero)} remaining")
+            
+            # Retry each bank - banks are independent direct-URL requests, so they are
+            # spread over a pool of browsers (this one plus extra scraper instances)
+            results_lock = threading.Lock()
+            bank_queue = queue.Queue()
             for i, bank_info in enumerate(banks_with_zero, 1):
-                bank_name = bank_info['bank_name']
-                city = bank_info['city']
-                
-                print("")
-                print(f"  [{i}/{len(banks_with_zero)}] Retrying: {bank_name} ({city})")
-                
-                # Retry bank
-                retry_data = self._retry_bank_with_direct_url(bank_name, month, year)
-                
-                # Store results
-                if retry_data['form1'] or retry_data['form2'] or retry_data['form3']:
-                    retry_results[bank_name] = {
-                        'city': city,
-                        'form1': retry_data['form1'],
-                        'form2': retry_data['form2'],
-                        'form3': retry_data['form3']
-                    }
-                
-                # Small delay before next bank
-                time.sleep(1.0)
+                bank_queue.put((i, bank_info))
+            
+            def retry_worker(scraper) -> None:
+                while True:
+                    try:
+                        i, bank_info = bank_queue.get_nowait()
+                    except queue.Empty:
+                        return
+                    
+                    bank_name = bank_info['bank_name']
+                    city = bank_info['city']
+                    
+                    print(f"\n  [{i}/{len(banks_with_zero)}] Retrying: {bank_name} ({city})")
+                    
+                    # Retry bank - one failing bank (e.g. a WebDriverException in this worker's browser)
+                    # must not abort the other workers and the Excel update
+                    try:
+                        retry_data = scraper._retry_bank_with_direct_url(bank_name, month, year)
+                    except Exception as e:
+                        print(f"  [WARNING] Retry failed for {bank_name} ({city}): {e}")
+                        continue
+                    
+                    # Store results
+                    with results_lock:
+                        if retry_data['form1'] or retry_data['form2'] or retry_data['form3']:
+                            retry_results[bank_name] = {
+                                'city': city,
+                                'form1': retry_data['form1'],
+                                'form2': retry_data['form2'],
+                                'form3': retry_data['form3']
+                            }
+                        processed_banks.append(bank_name)
+                        if len(processed_banks) % self.RETRY_CHECKPOINT_EVERY == 0:
+                            self._save_retry_checkpoint(checkpoint_path, retry_results, processed_banks)
+                    
+                    # Small jittered delay before next bank (workers don't hit the server in lockstep)
+                    time.sleep(0.2 + random.random() * 0.3)
+            
+            # One pooled HTTP session (keep-alive connections) for the HTTP-first fetches of all workers
+            shared_session = None
+            if requests is not None:
+                try:
+                    shared_session = self._get_http_session()
+                except Exception as e:
+                    print(f"  [WARNING] Could not create HTTP session: {e}")
+            
+            # Each worker owns its own WebDriver; drivers are never shared between threads
+            workers = [self]
+            num_workers = min(self.RETRY_WORKERS, len(banks_with_zero))
+            for _ in range(num_workers - 1):
+                try:
+                    worker = self.__class__(headless=self.headless)
+                    # Share succeeded forms and retry statistics across workers
+                    worker._retry_done = self._retry_done
+                    worker._retry_failed_loads = self._retry_failed_loads
+                    worker._retry_skipped = self._retry_skipped
+                    worker._session = shared_session
+                    worker.initialize()
+                    workers.append(worker)
+                except Exception as e:
+                    print(f"  [WARNING] Could not start extra retry browser: {e}")
+                    break
+            print(f"  [INFO] Retrying with {len(workers)} browser(s)")
+            
+            try:
+                with ThreadPoolExecutor(max_workers=len(workers)) as executor:
+                    list(executor.map(retry_worker, workers))
+            finally:
+                for worker in workers[1:]:
+                    # The shared HTTP session is closed by this scraper's own cleanup
+                    worker._session = None
+                    worker.cleanup()
             
             # Update Excel with retry results
             if retry_results:
@@ -5544,6 +6063,19 @@ class OJKExtJSScraper:
             else:
                 print("  [WARNING] No retry data to update in Excel")
             
+            # Retry run completed - the checkpoint is no longer needed
+            if checkpoint_path.exists():
+                try:
+                    checkpoint_path.unlink()
+                except Exception as e:
+                    print(f"  [WARNING] Could not delete retry checkpoint: {e}")
+            
+            # Failed-page-load histogram, to tune MAX_RETRY_ATTEMPTS
+            histogram = dict(sorted(Counter(self._retry_failed_loads.values()).items()))
+            print(f"  [INFO] Failed page loads per bank (failed loads: banks): {histogram}")
+            if self._retry_skipped:
+                print(f"  [WARNING] {len(self._retry_skipped)} bank(s) hit the retry cap: {', '.join(self._retry_skipped)}")
+            
             print("")
             print("=" * 70)
             print("RETRY COMPLETED")
@@ -16,17 +16,22 @@ from webdriver_manager.core.os_manager import ChromeType
 
 from config.settings import OJKConfig
 
+# ChromeDriver path resolved by ChromeDriverManager, reused for every driver in this process
+_DRIVER_PATH_CACHE = None
+
 
 class SeleniumSetup:
     """Handles Selenium WebDriver setup and configuration"""
     
     @staticmethod
-    def create_driver(headless: bool = None) -> webdriver.Chrome:
+    def create_driver(headless: bool = None, implicit_wait: float = 5) -> webdriver.Chrome:
         """
         Create and configure Chrome WebDriver
         
         Args:
             headless: Whether to run in headless mode. If None, uses OJKConfig.HEADLESS_MODE
+            implicit_wait: Implicit wait (seconds) for element finding; 0 for callers that use
+                explicit waits only (every empty find_elements probe otherwise blocks this long)
             
         Returns:
             Configured Chrome WebDriver instance
@@ -55,6 +60,58 @@ class SeleniumSetup:
         chrome_options.add_argument(f'user-agent={user_agent}')
         
         # Create service with automatic driver management
+        # The driver path is resolved once per process; every later driver (retry workers,
+        # re-initialize after cleanup) reuses it instead of re-running ChromeDriverManager
+        global _DRIVER_PATH_CACHE
+        cached = _DRIVER_PATH_CACHE is not None
+        if not cached:
+            _DRIVER_PATH_CACHE = SeleniumSetup._resolve_driver_path()
+        
+        try:
+            driver = webdriver.Chrome(service=Service(_DRIVER_PATH_CACHE), options=chrome_options)
+        except Exception as e:
+            if not cached:
+                raise
+            # Cached driver no longer usable (e.g. Chrome was updated) - resolve again once
+            print(f"[WARNING] Cached ChromeDriver failed ({e}), resolving driver again...")
+            _DRIVER_PATH_CACHE = SeleniumSetup._resolve_driver_path()
+            driver = webdriver.Chrome(service=Service(_DRIVER_PATH_CACHE), options=chrome_options)
+        
+        # Set timeouts
+        driver.set_page_load_timeout(OJKConfig.PAGE_LOAD_TIMEOUT)
+        driver.implicitly_wait(implicit_wait)  # Implicit wait for element finding
+        
+        # Concurrent WebDriver commands (e.g. a polling thread) each get a connection
+        # instead of waiting on urllib3's single-connection default pool
+        SeleniumSetup._widen_command_pool(driver, OJKConfig.WEBDRIVER_POOL_MAXSIZE)
+        
+        return driver
+    
+    @staticmethod
+    def _widen_command_pool(driver: webdriver.Chrome, maxsize: int):
+        """
+        Raise the urllib3 pool size of the driver's command connection
+        
+        Args:
+            driver: WebDriver instance
+            maxsize: Connections the pool keeps to the driver service
+        """
+        conn = getattr(driver.command_executor, '_conn', None)
+        if conn is None:
+            # keep_alive disabled - every command opens its own connection anyway
+            return
+        conn.connection_pool_kw['maxsize'] = maxsize
+        # Drop the pool opened for the new-session request so the next command creates one with the new size
+        conn.clear()
+    
+    @staticmethod
+    def _resolve_driver_path() -> str:
+        """
+        Resolve the ChromeDriver executable path via ChromeDriverManager
+        
+        Returns:
+            Path to the chromedriver executable
+        """
         # Try to get driver path, with fallback for cache issues
         try:
             driver_path = ChromeDriverManager().install()
@@ -93,16 +150,7 @@ class SeleniumSetup:
                 if chromedriver_exe.exists():
                     driver_path = str(chromedriver_exe)
         
-        service = Service(driver_path)
-        
-        # Create driver
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        
-        # Set timeouts
-        driver.set_page_load_timeout(OJKConfig.PAGE_LOAD_TIMEOUT)
-        driver.implicitly_wait(5)  # Implicit wait for element finding
-        
-        return driver
+        return driver_path
     
     @staticmethod
     def create_wait(driver: webdriver.Chrome, timeout: int = None) -> WebDriverWait:
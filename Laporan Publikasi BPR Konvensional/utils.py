@@ -19,44 +19,50 @@ def kill_chrome_processes():
     
     try:
         if system == "Windows":
-            # Windows: Use taskkill command
+            # Windows: one taskkill call with an /IM flag per process name
             processes_to_kill = ["chrome.exe", "chromedriver.exe", "GoogleCrashHandler.exe", "GoogleCrashHandler64.exe"]
-            
+            command = ["taskkill", "/F"]
             for process_name in processes_to_kill:
-                try:
-                    # Kill process by name
-                    result = subprocess.run(
-                        ["taskkill", "/F", "/IM", process_name],
-                        capture_output=True,
-                        text=True,
-                        timeout=10
-                    )
-                    if "berhasil" in result.stdout.lower() or "successfully" in result.stdout.lower():
+                command += ["/IM", process_name]
+            
+            try:
+                result = subprocess.run(
+                    command,
+                    capture_output=True,
+                    text=True,
+                    timeout=10
+                )
+                # taskkill prints one SUCCESS/BERHASIL line per terminated process
+                success_lines = [line.lower() for line in result.stdout.splitlines()
+                                 if "berhasil" in line.lower() or "success" in line.lower()]
+                for process_name in processes_to_kill:
+                    if any(process_name.lower() in line for line in success_lines):
                         killed_count += 1
                         print(f"[OK] Proses {process_name} dihentikan")
-                except subprocess.TimeoutExpired:
-                    print(f"[WARNING] Timeout saat menghentikan {process_name}")
-                except Exception as e:
-                    # Process might not exist, which is fine
-                    pass
+            except subprocess.TimeoutExpired:
+                print(f"[WARNING] Timeout saat menghentikan {', '.join(processes_to_kill)}")
+            except Exception as e:
+                # Processes might not exist, which is fine
+                pass
                     
         elif system == "Linux" or system == "Darwin":  # Linux or macOS
-            # Unix-like: Use pkill or killall
+            # Unix-like: one pkill (regex over process names) or killall (several names) call
             processes_to_kill = ["chrome", "chromedriver", "Google Chrome"]
             
-            for process_name in processes_to_kill:
-                try:
-                    if system == "Linux":
-                        subprocess.run(["pkill", "-9", process_name], timeout=10)
-                    else:  # macOS
-                        subprocess.run(["killall", "-9", process_name], timeout=10)
+            try:
+                if system == "Linux":
+                    result = subprocess.run(["pkill", "-9", "|".join(processes_to_kill)], timeout=10)
+                else:  # macOS
+                    result = subprocess.run(["killall", "-9"] + processes_to_kill, timeout=10)
+                # Exit code 0: at least one matching process was signalled
+                if result.returncode == 0:
                     killed_count += 1
-                    print(f"[OK] Proses {process_name} dihentikan")
-                except subprocess.TimeoutExpired:
-                    print(f"[WARNING] Timeout saat menghentikan {process_name}")
-                except Exception as e:
-                    # Process might not exist, which is fine
-                    pass
+                    print(f"[OK] Proses {', '.join(processes_to_kill)} dihentikan")
+            except subprocess.TimeoutExpired:
+                print(f"[WARNING] Timeout saat menghentikan {', '.join(processes_to_kill)}")
+            except Exception as e:
+                # Processes might not exist, which is fine
+                pass
         else:
             print(f"[WARNING] Sistem operasi {system} tidak didukung untuk pembersihan proses otomatis")
             
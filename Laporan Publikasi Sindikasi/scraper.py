@@ -3,17 +3,24 @@ Sindikasi Scraper
 Finds listed BPRs from both BPR Konvensional and BPR Syariah report pages
 """
 
+import io
 import time
 import logging
+import queue
 import re
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import TimeoutException
 from bs4 import BeautifulSoup
 
 try:
@@ -40,6 +47,157 @@ except ImportError:
 
 from config.settings import OJKConfig, Settings
 
+# Swaps '.' and ',' in a single str.translate call
+_SEP_SWAP = str.maketrans('.,', ',.')
+
+# Leading BPR/BPRS/bank prefix of a bank name (case-insensitive)
+_PREFIX_RE = re.compile(r'^(BPRS|BPR|PT\s*BANK|BANK)\s+', re.IGNORECASE)
+
+# SCRAPE / NAME header lines of a list file (case-insensitive)
+_SCRAPE_RE = re.compile(r'SCRAPE\s*=\s*(TRUE|FALSE)', re.IGNORECASE)
+_NAME_RE = re.compile(r'NAME\s*=\s*(.+)', re.IGNORECASE)
+
+# Characters stripped from extracted values: anything but digits/decimal point/minus, anything but digits
+_NONNUM_RE = re.compile(r'[^\d.\-]')
+_NONDIGIT_RE = re.compile(r'\D')
+
+# Split point of concatenated current/previous year numbers: 3 digits after a comma followed by a digit
+_CONCAT_SPLIT_RE = re.compile(r',(\d{3})(\d)(?=,|\d|$)')
+
+
+def _extract_whole_number(text: str) -> float:
+    """Extract an integer-like number from Indonesian-style formatted text (digits only)."""
+    if not text:
+        return 0.0
+    
+    # Keep digits only (we just need whole numbers); thousands separators are the usual
+    # non-digits, so the regex pass is only needed when anything else is left
+    digits_only = text.replace('.', '').replace(',', '')
+    if not digits_only.isdecimal():
+        digits_only = _NONDIGIT_RE.sub('', digits_only)
+    if not digits_only:
+        return 0.0
+    
+    return float(digits_only)
+
+# Current month -> (quarterly report month, year offset from the current year)
+_MONTH_TO_QUARTER = {
+    1: (12, -1), 2: (12, -1), 3: (12, -1),   # Jan, Feb, Mar -> Desember (YYYY-1)
+    4: (3, 0), 5: (3, 0), 6: (3, 0),         # Apr, May, Jun -> Maret YYYY
+    7: (6, 0), 8: (6, 0), 9: (6, 0),         # Jul, Aug, Sep -> Juni YYYY
+    10: (9, 0), 11: (9, 0), 12: (9, 0),      # Oct, Nov, Dec -> September YYYY
+}
+
+# Quarterly report month number -> month name used on the report page
+_QUARTER_MONTH_NAMES = {
+    3: "Maret",      # 03
+    6: "Juni",       # 06
+    9: "September",  # 09
+    12: "Desember"   # 12
+}
+
+
+# Bank type abbreviations spelled out in the expanded bank code format
+_BPR_EXPANSIONS = {
+    "BPR": ("Bank", "Perekonomian", "Rakyat"),
+    "BPRS": ("Bank", "Perekonomian", "Rakyat", "Syariah"),
+}
+
+
+@lru_cache(maxsize=4096)
+def _bank_code_formats(bank_name: str) -> tuple:
+    """Bank code formats for a bank name (see SindikasiScraper._format_bank_code_for_url)."""
+    # Step 1: Replace "-" with spaces
+    name = bank_name.replace("-", " ")
+    
+    # Step 2: Split by spaces and clean
+    words = [w.strip() for w in name.split() if w.strip()]
+    
+    if not words:
+        return ("",)
+    
+    # Step 3: Ensure name starts with "PT" or "Perumda"
+    first_word_upper = words[0].upper()
+    if first_word_upper not in ["PT", "PERUMDA"]:
+        # Prepend "PT" if it doesn't start with PT or Perumda
+        words.insert(0, "PT")
+    
+    # Step 4: Handle PERUMDA case (normalize to "Perumda")
+    if words[0].upper() == "PERUMDA":
+        words[0] = "Perumda"
+    
+    # Step 5: Create original format (keep Bpr/Bprs as-is)
+    # PT should always be uppercase, other words capitalized
+    original_format = "+".join("PT" if w.upper() == "PT" else w.capitalize() for w in words)
+    
+    # Step 6: Check if we need expanded format
+    if not any(w.upper() in _BPR_EXPANSIONS for w in words):
+        return (original_format,)
+    
+    # Step 7: Create expanded format (Bpr/Bprs spelled out), capitalized the same way
+    expanded_words = []
+    for word in words:
+        expanded_words.extend(_BPR_EXPANSIONS.get(word.upper(), (word,)))
+    expanded_format = "+".join("PT" if w.upper() == "PT" else w.capitalize() for w in expanded_words)
+    
+    return (original_format, expanded_format)
+
+
+@lru_cache(maxsize=8)
+def _quarter_target_period(today: date) -> tuple:
+    """(month_name, year) of the quarterly report available on the given date."""
+    target_month_num, year_offset = _MONTH_TO_QUARTER[today.month]
+    return _QUARTER_MONTH_NAMES[target_month_num], str(today.year + year_offset)
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler that collects log lines in a 64 KB write buffer instead of one write() per record
+    The buffer is written out every FLUSH_INTERVAL seconds, on ERROR (and above) records and on close()
+    """
+    
+    BUFFER_SIZE = 65536
+    FLUSH_INTERVAL = 30  # seconds
+    
+    def __init__(self, filename, mode: str = 'a', encoding: str = None, delay: bool = False, errors: str = None):
+        self._flush_timer = None
+        self._timer_stopped = False
+        super().__init__(filename, mode=mode, encoding=encoding, delay=delay, errors=errors)
+        self._schedule_flush()
+    
+    def _open(self):
+        raw = open(self.baseFilename, self.mode.replace('b', '') + 'b', buffering=self.BUFFER_SIZE)
+        return io.TextIOWrapper(raw, encoding=self.encoding, errors=self.errors, write_through=False)
+    
+    def emit(self, record):
+        super().emit(record)
+        if record.levelno >= logging.ERROR:
+            self.flush_buffer()
+    
+    def flush(self):
+        # StreamHandler.emit() calls flush() after every record - keep the lines buffered instead
+        pass
+    
+    def flush_buffer(self):
+        """Write the buffered log lines to the file"""
+        super().flush()
+    
+    def _schedule_flush(self):
+        self._flush_timer = threading.Timer(self.FLUSH_INTERVAL, self._periodic_flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+    
+    def _periodic_flush(self):
+        self.flush_buffer()
+        if not self._timer_stopped:
+            self._schedule_flush()
+    
+    def close(self):
+        self._timer_stopped = True
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+        super().close()
+
 
 class SindikasiScraper:
     """Scraper for finding BPRs in Sindikasi reports"""
@@ -60,35 +218,94 @@ class SindikasiScraper:
         self.all_bank_data = []  # Store all bank data for Excel export
         self.extjs: ExtJSHelper = None
         self.headless = headless
+        self._second_scraper = None  # Second browser for the other bank type, reused across lists (created lazily)
+        self._log_handlers = None  # File/stream handlers, set only when this instance configured the root logger
+        self._log_queue_handler = None  # QueueHandler on the root logger while the listener runs
+        self._log_listener = None  # QueueListener writing the queued records on a background thread
+        self._soup_cache = (None, None)  # (page_source, soup) of the last parsed page
+        self._div_index = None  # (soup, [(div, text, text_lower)]) for the last parsed report page
         
         # Setup logging
-        log_dir = Path(__file__).parent.parent / "logs"
-        log_dir.mkdir(exist_ok=True)
-        log_file = log_dir / f"sindikasi_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-        
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file, encoding='utf-8'),
-                logging.StreamHandler()
-            ]
-        )
+        # Same rule as logging.basicConfig: only configure the root logger if nobody did yet
+        # (scheduler_service / manual_runner set up their own handlers first)
         self.logger = logging.getLogger(__name__)
-        self.logger.info(f"Log file: {log_file}")
+        root_logger = logging.getLogger()
+        if not root_logger.handlers:
+            log_dir = Path(__file__).parent.parent / "logs"
+            log_dir.mkdir(exist_ok=True)
+            log_file = log_dir / f"sindikasi_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+            
+            # threadName tells the two browsers' lines apart when bank groups run in parallel
+            formatter = logging.Formatter('%(asctime)s - %(threadName)s - %(levelname)s - %(message)s')
+            file_handler = BufferedFileHandler(log_file, encoding='utf-8')
+            stream_handler = logging.StreamHandler()
+            file_handler.setFormatter(formatter)
+            stream_handler.setFormatter(formatter)
+            root_logger.setLevel(logging.INFO)
+            self._log_handlers = [file_handler, stream_handler]
+            self._start_log_listener()
+            self.logger.info(f"Log file: {log_file}")
+    
+    def _start_log_listener(self):
+        """
+        Route root logging through a queue: the scraping thread only enqueues records,
+        a QueueListener thread formats and writes them to the file/stream handlers
+        """
+        if self._log_handlers is None or self._log_listener is not None:
+            return
+        
+        root_logger = logging.getLogger()
+        log_queue = queue.Queue(-1)
+        queue_handler = QueueHandler(log_queue)
+        # The real format is applied by the listener's handlers
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        root_logger.addHandler(queue_handler)
+        for handler in self._log_handlers:
+            root_logger.removeHandler(handler)
+        
+        self._log_queue_handler = queue_handler
+        self._log_listener = QueueListener(log_queue, *self._log_handlers, respect_handler_level=True)
+        self._log_listener.start()
+    
+    def _stop_log_listener(self):
+        """Flush queued records and put the file/stream handlers back on the root logger"""
+        if self._log_listener is None:
+            return
+        
+        root_logger = logging.getLogger()
+        for handler in self._log_handlers:
+            root_logger.addHandler(handler)
+        root_logger.removeHandler(self._log_queue_handler)
+        self._log_listener.stop()
+        self._log_listener = None
+        self._log_queue_handler = None
+        
+        # The run is over - get the buffered lines into the log file now rather than at the next timer tick
+        for handler in self._log_handlers:
+            if isinstance(handler, BufferedFileHandler):
+                handler.flush_buffer()
     
     def initialize(self):
         """Initialize WebDriver and ExtJS helper"""
         if self.driver is None:
-            self.driver = SeleniumSetup.create_driver(headless=self.headless)
+            # No implicit wait: the only lookups are the optional iframe probes, which would otherwise
+            # block for the full timeout on every report that renders in the main page
+            self.driver = SeleniumSetup.create_driver(headless=self.headless, implicit_wait=0)
             self.wait = SeleniumSetup.create_wait(self.driver)
             self.extjs = ExtJSHelper(self.driver, self.wait)
+            # Logging goes through the queue again while a browser is running (stopped in cleanup())
+            self._start_log_listener()
             
             # Don't minimize - keep window visible for monitoring
             self.logger.info("Chrome browser initialized")
     
     def cleanup(self, kill_processes: bool = True):
         """Cleanup resources"""
+        # Close the second browser first - its Chrome processes are killed below if requested
+        if self._second_scraper is not None:
+            self._second_scraper.cleanup(kill_processes=False)
+            self._second_scraper = None
+        
         if self.driver:
             try:
                 # Suppress urllib3 warnings during cleanup
@@ -112,6 +329,11 @@ class SindikasiScraper:
                 if "connection" not in error_str and "refused" not in error_str and "session" not in error_str:
                     self.logger.error(f"Error closing browser: {e}")
                 # Connection errors are expected during cleanup, so we silently ignore them
+            # A later initialize() starts a fresh browser
+            self.driver = None
+        
+        # Write out the queued log records before the process may exit
+        self._stop_log_listener()
         
         if kill_processes:
             try:
@@ -160,13 +382,13 @@ class SindikasiScraper:
                 
                 # Parse SCRAPE flag
                 if line.upper().startswith('SCRAPE'):
-                    scrape_match = re.search(r'SCRAPE\s*=\s*(TRUE|FALSE)', line, re.IGNORECASE)
+                    scrape_match = _SCRAPE_RE.search(line)
                     if scrape_match:
                         result['scrape'] = scrape_match.group(1).upper() == 'TRUE'
                 
                 # Parse NAME
                 elif line.upper().startswith('NAME'):
-                    name_match = re.search(r'NAME\s*=\s*(.+)', line, re.IGNORECASE)
+                    name_match = _NAME_RE.search(line)
                     if name_match:
                         result['name'] = name_match.group(1).strip()
                 
@@ -197,19 +419,10 @@ class SindikasiScraper:
         self.logger.info(f"Navigating to: {url}")
         self.driver.get(url)
         
-        # Wait for page to load
-        time.sleep(0.75)
-        
-        # Check if page is in iframe or main page
-        max_attempts = 10
-        for attempt in range(max_attempts):
-            try:
-                if self.extjs.check_extjs_available():
-                    self.logger.debug("ExtJS is available in main page")
-                    return
-            except:
-                pass
-            time.sleep(0.75)
+        # Wait for ExtJS in the main page, returning as soon as it is loaded
+        if self._wait_for_extjs(7):
+            self.logger.debug("ExtJS is available in main page")
+            return
         
         # If not in main page, check for iframes
         iframes = self.driver.find_elements(By.TAG_NAME, "iframe")
@@ -218,9 +431,8 @@ class SindikasiScraper:
             for i, iframe in enumerate(iframes):
                 try:
                     self.driver.switch_to.frame(iframe)
-                    time.sleep(1.125)
                     
-                    if self.extjs.check_extjs_available():
+                    if self._wait_for_extjs(2):
                         self.logger.debug(f"ExtJS is available in iframe {i+1}")
                         return
                     
@@ -230,17 +442,34 @@ class SindikasiScraper:
                     continue
         
         # Final check
-        time.sleep(0.75)
         if self.extjs.check_extjs_available():
             self.logger.debug("ExtJS is now available")
             return
         
         self.logger.warning("ExtJS not immediately available, continuing anyway...")
     
-    def _format_bank_code_for_url(self, bank_name: str) -> list:
+    def _wait_for_extjs(self, timeout: float) -> bool:
+        """
+        Wait until ExtJS is available in the current frame, polling every 0.1s
+        
+        Args:
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            True if ExtJS became available within the timeout
+        """
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                lambda d: self.extjs.check_extjs_available()
+            )
+            return True
+        except TimeoutException:
+            return False
+    
+    def _format_bank_code_for_url(self, bank_name: str) -> tuple:
         """
         Format bank name for URL with fallback options.
-        Returns a list of possible bank code formats to try.
+        Returns the possible bank code formats to try (cached per bank name, see _bank_code_formats).
         
         Bank names always start with either "PT" or "Perumda".
         If it doesn't start with "PT", it should start with "Perumda".
@@ -249,70 +478,10 @@ class SindikasiScraper:
             bank_name: Bank name (e.g., "PT Bpr Rangkiang Aur Denai" or "Bprs Al-Makmur")
             
         Returns:
-            List of formatted bank codes: [original_format, expanded_format]
-            If no expansion needed, returns [original_format]
-        """
-        # Step 1: Replace "-" with spaces
-        name = bank_name.replace("-", " ")
-        
-        # Step 2: Split by spaces and clean
-        words = [w.strip() for w in name.split() if w.strip()]
-        
-        if not words:
-            return [""]
-        
-        # Step 3: Ensure name starts with "PT" or "Perumda"
-        first_word_upper = words[0].upper()
-        if first_word_upper not in ["PT", "PERUMDA"]:
-            # Prepend "PT" if it doesn't start with PT or Perumda
-            words.insert(0, "PT")
-        
-        # Step 4: Handle PERUMDA case (normalize to "Perumda")
-        if words[0].upper() == "PERUMDA":
-            words[0] = "Perumda"
-        
-        # Step 5: Create original format (keep Bpr/Bprs as-is)
-        # PT should always be uppercase, other words capitalized
-        original_words = []
-        for w in words:
-            if w.upper() == "PT":
-                original_words.append("PT")
-            else:
-                original_words.append(w.capitalize())
-        original_format = "+".join(original_words)
-        
-        # Step 6: Check if we need expanded format
-        has_bpr = False
-        has_bprs = False
-        expanded_words = []
-        
-        for word in words:
-            word_upper = word.upper()
-            if word_upper in ["BPR", "BPRS"]:
-                if word_upper == "BPRS":
-                    has_bprs = True
-                    expanded_words.extend(["Bank", "Perekonomian", "Rakyat", "Syariah"])
-                else:
-                    has_bpr = True
-                    expanded_words.extend(["Bank", "Perekonomian", "Rakyat"])
-            else:
-                expanded_words.append(word)
-        
-        # Step 7: Create expanded format if needed
-        formats = [original_format]
-        
-        if has_bpr or has_bprs:
-            # Capitalize expanded words, but keep PT uppercase
-            expanded_formatted = []
-            for w in expanded_words:
-                if w.upper() == "PT":
-                    expanded_formatted.append("PT")
-                else:
-                    expanded_formatted.append(w.capitalize())
-            expanded_format = "+".join(expanded_formatted)
-            formats.append(expanded_format)
-        
-        return formats
+            Tuple of formatted bank codes: (original_format, expanded_format)
+            If no expansion needed, returns (original_format,)
+        """
+        return _bank_code_formats(bank_name)
     
     def _get_target_month_year(self) -> tuple[str, str]:
         """
@@ -327,40 +496,15 @@ class SindikasiScraper:
         Returns:
             Tuple of (month_name, year) e.g., ("September", "2025")
         """
-        from datetime import datetime
-        
         now = datetime.now()
-        current_month = now.month
-        current_year = now.year
-        
-        # Quarterly mapping logic
-        month_names = {
-            3: "Maret",      # 03
-            6: "Juni",       # 06
-            9: "September",  # 09
-            12: "Desember"   # 12
-        }
         
-        # Map current month to quarterly report month
-        if current_month in [1, 2, 3]:  # Jan, Feb, Mar
-            target_month_num = 12  # Desember
-            target_year = current_year - 1
-        elif current_month in [4, 5, 6]:  # Apr, May, Jun
-            target_month_num = 3  # Maret
-            target_year = current_year
-        elif current_month in [7, 8, 9]:  # Jul, Aug, Sep
-            target_month_num = 6  # Juni
-            target_year = current_year
-        else:  # Oct, Nov, Dec
-            target_month_num = 9  # September
-            target_year = current_year
-        
-        month_name = month_names[target_month_num]
+        # Map current month to quarterly report month (cached per day)
+        month_name, target_year = _quarter_target_period(now.date())
         
         self.logger.info(f"Current date: {now.strftime('%B %Y')}")
         self.logger.info(f"Target month/year: {month_name} {target_year}")
         
-        return month_name, str(target_year)
+        return month_name, target_year
     
     def _month_name_to_number(self, month_name: str) -> int:
         """
@@ -451,49 +595,10 @@ class SindikasiScraper:
         """
         # Remove common prefixes
         name = bank_name.strip()
-        name = re.sub(r'^(BPRS|BPR|PT\s*BANK|BANK)\s+', '', name, flags=re.IGNORECASE)
+        name = _PREFIX_RE.sub('', name)
         return name.strip()
     
     
-    def _check_identifiers(self, identifiers: list) -> bool:
-        """
-        Check if all identifiers are present in the page using BeautifulSoup
-        
-        Args:
-            identifiers: List of identifier strings to check for (exact match)
-            
-        Returns:
-            True if all identifiers are found, False otherwise
-        """
-        try:
-            # Get page source and parse with BeautifulSoup
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-            
-            # Get all text from the page
-            page_text = soup.get_text()
-            
-            # Check for each identifier (exact match)
-            found_identifiers = []
-            missing_identifiers = []
-            
-            for identifier in identifiers:
-                if identifier in page_text:
-                    found_identifiers.append(identifier)
-                else:
-                    missing_identifiers.append(identifier)
-            
-            if missing_identifiers:
-                self.logger.debug(f"  Missing identifiers: {missing_identifiers}")
-                return False
-            else:
-                self.logger.info(f"  [OK] All identifiers found: {found_identifiers}")
-                return True
-                
-        except Exception as e:
-            self.logger.error(f"  [ERROR] Error checking identifiers: {e}")
-            return False
-    
     def _clean_numeric_text(self, text: str) -> float:
         """
         Clean numeric text by reversing . and , then parse as float
@@ -508,26 +613,24 @@ class SindikasiScraper:
             # Remove whitespace
             cleaned = text.strip()
             
-            # Reverse . and , (swap all occurrences)
+            # Reverse . and , (swap all occurrences in one translate pass)
             # "230,115,190" → "230.115.190"
             # "230.115.190" → "230,115,190"
-            cleaned = cleaned.replace('.', 'TEMP_DOT')
-            cleaned = cleaned.replace(',', '.')
-            cleaned = cleaned.replace('TEMP_DOT', ',')
+            cleaned = cleaned.translate(_SEP_SWAP)
             
             # After swapping, parse the number
             # Determine which separator is decimal and which is thousands
             # Pattern: if there are multiple separators, the last one is usually decimal
             # If only one separator, it could be either
             
-            dot_count = cleaned.count('.')
-            comma_count = cleaned.count(',')
+            # First/last position of each separator (-1 if absent); first != last means it occurs more than once
+            first_dot_pos = cleaned.find('.')
+            last_dot_pos = cleaned.rfind('.')
+            first_comma_pos = cleaned.find(',')
+            last_comma_pos = cleaned.rfind(',')
             
-            if dot_count > 0 and comma_count > 0:
+            if first_dot_pos >= 0 and first_comma_pos >= 0:
                 # Both present - last separator is decimal
-                last_dot_pos = cleaned.rfind('.')
-                last_comma_pos = cleaned.rfind(',')
-                
                 if last_dot_pos > last_comma_pos:
                     # Last separator is dot, so dots are thousands, comma is decimal
                     # Remove all dots (thousands), replace comma with dot for parsing
@@ -537,27 +640,25 @@ class SindikasiScraper:
                     # Last separator is comma, so commas are thousands, dot is decimal
                     # Remove all commas (thousands), keep dot as decimal
                     cleaned = cleaned.replace(',', '')
-            elif dot_count > 1:
+            elif first_dot_pos != last_dot_pos:
                 # Multiple dots - all are thousands separators, remove all
                 cleaned = cleaned.replace('.', '')
-            elif comma_count > 1:
+            elif first_comma_pos != last_comma_pos:
                 # Multiple commas - all are thousands separators, remove all
                 cleaned = cleaned.replace(',', '')
-            elif dot_count == 1:
+            elif first_dot_pos >= 0:
                 # Single dot - could be decimal or thousands
                 # Check position: if near end (last 3 chars), likely decimal, otherwise thousands
-                dot_pos = cleaned.find('.')
-                if dot_pos >= len(cleaned) - 3:
+                if first_dot_pos >= len(cleaned) - 3:
                     # Near end, likely decimal separator
                     pass  # Keep it
                 else:
                     # Likely thousands separator, remove it
                     cleaned = cleaned.replace('.', '')
-            elif comma_count == 1:
+            elif first_comma_pos >= 0:
                 # Single comma - could be decimal or thousands
                 # Check position: if near end (last 3 chars), likely decimal, otherwise thousands
-                comma_pos = cleaned.find(',')
-                if comma_pos >= len(cleaned) - 3:
+                if first_comma_pos >= len(cleaned) - 3:
                     # Near end, likely decimal separator, convert to dot
                     cleaned = cleaned.replace(',', '.')
                 else:
@@ -565,7 +666,9 @@ class SindikasiScraper:
                     cleaned = cleaned.replace(',', '')
             
             # Remove any remaining non-numeric characters except decimal point and minus
-            cleaned = re.sub(r'[^\d.\-]', '', cleaned)
+            # (plain digit strings, the usual case once separators are handled, need no regex pass)
+            if not cleaned.isdigit():
+                cleaned = _NONNUM_RE.sub('', cleaned)
             
             if not cleaned or cleaned == '-':
                 return 0.0
@@ -575,6 +678,43 @@ class SindikasiScraper:
             self.logger.debug(f"  Error parsing numeric text '{text}': {e}")
             return 0.0
     
+    def _parse_page(self, page_source: str) -> BeautifulSoup:
+        """
+        Parse page source with lxml, reusing the last soup when the page has not changed
+        (the identifier check and the extractors read the same page load)
+        
+        Args:
+            page_source: HTML of the page (or report iframe)
+            
+        Returns:
+            BeautifulSoup parsed page
+        """
+        cached_source, cached_soup = self._soup_cache
+        if cached_soup is not None and cached_source == page_source:
+            return cached_soup
+        
+        soup = BeautifulSoup(page_source, 'lxml')
+        self._soup_cache = (page_source, soup)
+        return soup
+    
+    def _index_divs(self, soup: BeautifulSoup) -> list:
+        """
+        Get the stripped text of every <div> on the page once per soup, shared by all identifier lookups
+        
+        Args:
+            soup: BeautifulSoup parsed page
+            
+        Returns:
+            List of (div, text, text_lower) tuples in document order
+        """
+        if self._div_index is None or self._div_index[0] is not soup:
+            entries = []
+            for div in soup.find_all('div'):
+                text = div.get_text(strip=True)
+                entries.append((div, text, text.lower()))
+            self._div_index = (soup, entries)
+        return self._div_index[1]
+    
     def _extract_identifier_value_from_table(self, soup: BeautifulSoup, identifier: str) -> dict:
         """
         Extract values for a single identifier from table structure (td/tr).
@@ -594,27 +734,10 @@ class SindikasiScraper:
         result = {'2025': 0.0, '2024': 0.0}
         
         try:
-            # Helper function to extract number from text
-            def extract_number(text: str) -> float:
-                """Extract an integer-like number from Indonesian-style formatted text."""
-                if not text:
-                    return 0.0
-                
-                # Normalize spaces
-                text = text.replace('\xa0', ' ').replace('&nbsp;', ' ').strip()
-                
-                # Keep digits only (we just need whole numbers)
-                digits_only = re.sub(r'\D', '', text)
-                if not digits_only:
-                    return 0.0
-                
-                value = float(digits_only)
-                return value
-            
             # Find the <div> whose text contains our identifier
             label_div = None
-            for div in soup.find_all('div'):
-                text = div.get_text(strip=True)
+            identifier_lower = identifier.lower()
+            for div, text, text_lower in self._index_divs(soup):
                 if not text:
                     continue
                 
@@ -623,11 +746,8 @@ class SindikasiScraper:
                     continue
                 
                 # Check if identifier is in text
-                if identifier.lower() in text.lower():
+                if identifier_lower in text_lower:
                     # Prefer divs where identifier is a significant part of the text
-                    text_lower = text.lower()
-                    identifier_lower = identifier.lower()
-                    
                     # If text is short or identifier is at the start/end, it's likely the right div
                     if len(text) < 200 or text_lower.startswith(identifier_lower) or text_lower.endswith(identifier_lower):
                         label_div = div
@@ -689,7 +809,7 @@ class SindikasiScraper:
                     continue
                 
                 # Extract number from text
-                number = extract_number(td_text_clean)
+                number = _extract_whole_number(td_text_clean)
                 
                 # Validate the number is reasonable
                 if number >= 0 and number < 1e15 and number != float('inf'):
@@ -765,10 +885,11 @@ class SindikasiScraper:
             
             # Find the <div> whose text contains our identifier
             label_div = None
-            all_divs = soup.find_all('div')
+            div_index = -1
+            all_divs = self._index_divs(soup)
+            identifier_lower = identifier.lower()
             
-            for div in all_divs:
-                text = div.get_text(strip=True)
+            for index, (div, text, text_lower) in enumerate(all_divs):
                 if not text:
                     continue
                 
@@ -777,14 +898,12 @@ class SindikasiScraper:
                     continue
                 
                 # Check if identifier is in text
-                if identifier.lower() in text.lower():
+                if identifier_lower in text_lower:
                     # Prefer divs where identifier is a significant part of the text
-                    text_lower = text.lower()
-                    identifier_lower = identifier.lower()
-                    
                     # If text is short or identifier is at the start/end, it's likely the right div
                     if len(text) < 200 or text_lower.startswith(identifier_lower) or text_lower.endswith(identifier_lower):
                         label_div = div
+                        div_index = index
                         self.logger.debug(f"    Found identifier '{identifier}' in <div>: '{text[:100]}...'")
                         break
             
@@ -792,50 +911,44 @@ class SindikasiScraper:
                 self.logger.debug(f"    Identifier '{identifier}' NOT FOUND in page")
                 return result
             
-            # Find the index of this div and get the next divs that contain numeric values
-            try:
-                div_index = all_divs.index(label_div)
-                # Look through next divs to find numeric values (up to 10 divs ahead)
-                numeric_count = 0
-                for j in range(1, min(11, len(all_divs) - div_index)):  # Check up to 10 next divs
-                    if numeric_count >= 2:  # We need 2 values
-                        break
+            # Get the next divs that contain numeric values (div_index was recorded during the search)
+            # Look through next divs to find numeric values (up to 10 divs ahead)
+            numeric_count = 0
+            for j in range(1, min(11, len(all_divs) - div_index)):  # Check up to 10 next divs
+                if numeric_count >= 2:  # We need 2 values
+                    break
+                
+                if div_index + j < len(all_divs):
+                    div_text = all_divs[div_index + j][1]
                     
-                    if div_index + j < len(all_divs):
-                        next_div = all_divs[div_index + j]
-                        div_text = next_div.get_text(strip=True)
-                        
-                        if not div_text:
-                            continue
-                        
-                        # Skip very long divs (likely contain entire page content)
-                        if len(div_text) > 5000:
-                            continue
-                        
-                        # Skip if it's clearly another identifier (contains common identifier keywords)
-                        if any(keyword in div_text.lower() for keyword in ['kepada', 'pihak', 'bank', 'bpr', 'report viewer', 'configuration error', 'piutang', 'aset', 'dpk', 'laba', 'rasio']):
-                            continue
-                        
-                        # Skip if too long (likely not a single ratio value)
-                        if len(div_text) > 100:
-                            continue
-                        
-                        # Extract number preserving decimal point
-                        number = extract_decimal_number(div_text)
-                        
-                        # Validate the number is reasonable
-                        if number != 0.0 or (number == 0.0 and any(char.isdigit() for char in div_text) and len(div_text) < 50):
-                            if numeric_count == 0:
-                                result['2025'] = number
-                                numeric_count += 1
-                                self.logger.debug(f"    Found 2025 value: {number} from '{div_text}'")
-                            elif numeric_count == 1:
-                                result['2024'] = number
-                                numeric_count += 1
-                                self.logger.debug(f"    Found 2024 value: {number} from '{div_text}'")
-            except ValueError:
-                self.logger.debug(f"    Identifier '{identifier}' found but couldn't find its index")
-                return result
+                    if not div_text:
+                        continue
+                    
+                    # Skip very long divs (likely contain entire page content)
+                    if len(div_text) > 5000:
+                        continue
+                    
+                    # Skip if it's clearly another identifier (contains common identifier keywords)
+                    if any(keyword in div_text.lower() for keyword in ['kepada', 'pihak', 'bank', 'bpr', 'report viewer', 'configuration error', 'piutang', 'aset', 'dpk', 'laba', 'rasio']):
+                        continue
+                    
+                    # Skip if too long (likely not a single ratio value)
+                    if len(div_text) > 100:
+                        continue
+                    
+                    # Extract number preserving decimal point
+                    number = extract_decimal_number(div_text)
+                    
+                    # Validate the number is reasonable
+                    if number != 0.0 or (number == 0.0 and any(char.isdigit() for char in div_text) and len(div_text) < 50):
+                        if numeric_count == 0:
+                            result['2025'] = number
+                            numeric_count += 1
+                            self.logger.debug(f"    Found 2025 value: {number} from '{div_text}'")
+                        elif numeric_count == 1:
+                            result['2024'] = number
+                            numeric_count += 1
+                            self.logger.debug(f"    Found 2024 value: {number} from '{div_text}'")
             
             if result['2025'] == 0.0 and result['2024'] == 0.0:
                 self.logger.debug(f"    Identifier '{identifier}' found but no numeric values extracted from next divs")
@@ -867,24 +980,6 @@ class SindikasiScraper:
         result = {'2025': 0.0, '2024': 0.0}
         
         try:
-            # Helper function to extract number from text
-            def extract_number(text: str) -> float:
-                """Extract an integer-like number from Indonesian-style formatted text."""
-                if not text:
-                    return 0.0
-                
-                original_text = text
-                # Normalize spaces
-                text = text.replace('\xa0', ' ').replace('&nbsp;', ' ').strip()
-                
-                # Keep digits only (we just need whole numbers)
-                digits_only = re.sub(r'\D', '', text)
-                if not digits_only:
-                    return 0.0
-                
-                value = float(digits_only)
-                return value
-            
             # Helper function to split concatenated numbers (current year + previous year)
             def split_concatenated_numbers(text: str) -> tuple[str, str]:
                 """
@@ -895,8 +990,7 @@ class SindikasiScraper:
                     return text, ""
                 
                 # Find the split point: look for pattern where after comma, we have 3 digits, then a digit (not comma)
-                pattern = r',(\d{3})(\d)(?=,|\d|$)'
-                match = re.search(pattern, text)
+                match = _CONCAT_SPLIT_RE.search(text)
                 
                 if match:
                     split_pos = match.end(1)  # Position after the 3 digits (before the next digit)
@@ -908,10 +1002,11 @@ class SindikasiScraper:
             
             # Find the <div> whose text contains our identifier
             label_div = None
-            all_divs = soup.find_all('div')
+            div_index = -1
+            all_divs = self._index_divs(soup)
+            identifier_lower = identifier.lower()
             
-            for div in all_divs:
-                text = div.get_text(strip=True)
+            for index, (div, text, text_lower) in enumerate(all_divs):
                 if not text:
                     continue
                 
@@ -920,14 +1015,12 @@ class SindikasiScraper:
                     continue
                 
                 # Check if identifier is in text
-                if identifier.lower() in text.lower():
+                if identifier_lower in text_lower:
                     # Prefer divs where identifier is a significant part of the text
-                    text_lower = text.lower()
-                    identifier_lower = identifier.lower()
-                    
                     # If text is short or identifier is at the start/end, it's likely the right div
                     if len(text) < 200 or text_lower.startswith(identifier_lower) or text_lower.endswith(identifier_lower):
                         label_div = div
+                        div_index = index
                         self.logger.debug(f"    Found identifier '{identifier}' in <div>: '{text[:100]}...'")
                         break
             
@@ -935,82 +1028,76 @@ class SindikasiScraper:
                 self.logger.debug(f"    Identifier '{identifier}' NOT FOUND in page")
                 return result
             
-            # Find the index of this div and get the next divs that contain numeric values
-            try:
-                div_index = all_divs.index(label_div)
-                # Look through next divs to find numeric values (up to 10 divs ahead)
-                numeric_count = 0
-                for j in range(1, min(11, len(all_divs) - div_index)):  # Check up to 10 next divs
-                    if numeric_count >= 2:  # We need 2 values
-                        break
+            # Get the next divs that contain numeric values (div_index was recorded during the search)
+            # Look through next divs to find numeric values (up to 10 divs ahead)
+            numeric_count = 0
+            for j in range(1, min(11, len(all_divs) - div_index)):  # Check up to 10 next divs
+                if numeric_count >= 2:  # We need 2 values
+                    break
+                
+                if div_index + j < len(all_divs):
+                    div_text = all_divs[div_index + j][1]
                     
-                    if div_index + j < len(all_divs):
-                        next_div = all_divs[div_index + j]
-                        div_text = next_div.get_text(strip=True)
-                        
-                        if not div_text:
-                            continue
-                        
-                        # Skip very long divs (likely contain entire page content)
-                        if len(div_text) > 5000:
-                            continue
-                        
-                        # Skip if it's clearly another identifier (contains common identifier keywords)
-                        if any(keyword in div_text.lower() for keyword in ['kepada', 'pihak', 'bank', 'bpr', 'report viewer', 'configuration error', 'piutang', 'aset', 'dpk', 'laba', 'rasio']):
-                            continue
+                    if not div_text:
+                        continue
+                    
+                    # Skip very long divs (likely contain entire page content)
+                    if len(div_text) > 5000:
+                        continue
+                    
+                    # Skip if it's clearly another identifier (contains common identifier keywords)
+                    if any(keyword in div_text.lower() for keyword in ['kepada', 'pihak', 'bank', 'bpr', 'report viewer', 'configuration error', 'piutang', 'aset', 'dpk', 'laba', 'rasio']):
+                        continue
+                    
+                    # Check if it contains concatenated numbers (has comma and might have split pattern)
+                    if ',' in div_text and len(div_text) > 10:
+                        # Try to split concatenated numbers
+                        current_year_text, prev_year_text = split_concatenated_numbers(div_text)
                         
-                        # Check if it contains concatenated numbers (has comma and might have split pattern)
-                        if ',' in div_text and len(div_text) > 10:
-                            # Try to split concatenated numbers
-                            current_year_text, prev_year_text = split_concatenated_numbers(div_text)
+                        if prev_year_text:
+                            # Found concatenated numbers, extract both
+                            current_number = _extract_whole_number(current_year_text)
+                            prev_number = _extract_whole_number(prev_year_text)
                             
-                            if prev_year_text:
-                                # Found concatenated numbers, extract both
-                                current_number = extract_number(current_year_text)
-                                prev_number = extract_number(prev_year_text)
+                            # Validate numbers are reasonable
+                            if (current_number >= 0 and current_number < 1e15 and current_number != float('inf') and
+                                prev_number >= 0 and prev_number < 1e15 and prev_number != float('inf')):
                                 
-                                # Validate numbers are reasonable
-                                if (current_number >= 0 and current_number < 1e15 and current_number != float('inf') and
-                                    prev_number >= 0 and prev_number < 1e15 and prev_number != float('inf')):
-                                    
-                                    if numeric_count == 0:
-                                        result['2025'] = current_number
-                                        numeric_count += 1
-                                    
-                                    if numeric_count == 1:
-                                        result['2024'] = prev_number
-                                        numeric_count += 1
-                                    
-                                    if numeric_count >= 2:
-                                        break
-                                    continue
-                        
-                        # Check if this div looks like it contains a single formatted number
-                        if len(div_text) > 100:
-                            continue
-                        
-                        # Extract number from single number text
-                        number = extract_number(div_text)
-                        
-                        # Validate the number is reasonable
-                        if number >= 0 and number < 1e15 and number != float('inf'):
-                            if numeric_count == 0:
-                                result['2025'] = number
-                                numeric_count += 1
-                            elif numeric_count == 1:
-                                result['2024'] = number
-                                numeric_count += 1
-                        elif number == 0 and any(char.isdigit() for char in div_text) and len(div_text) < 50:
-                            # Zero value is valid if it's a short text with digits
-                            if numeric_count == 0:
-                                result['2025'] = number
-                                numeric_count += 1
-                            elif numeric_count == 1:
-                                result['2024'] = number
-                                numeric_count += 1
-            except ValueError:
-                self.logger.debug(f"    Identifier '{identifier}' found but couldn't find its index")
-                return result
+                                if numeric_count == 0:
+                                    result['2025'] = current_number
+                                    numeric_count += 1
+                                
+                                if numeric_count == 1:
+                                    result['2024'] = prev_number
+                                    numeric_count += 1
+                                
+                                if numeric_count >= 2:
+                                    break
+                                continue
+                    
+                    # Check if this div looks like it contains a single formatted number
+                    if len(div_text) > 100:
+                        continue
+                    
+                    # Extract number from single number text
+                    number = _extract_whole_number(div_text)
+                    
+                    # Validate the number is reasonable
+                    if number >= 0 and number < 1e15 and number != float('inf'):
+                        if numeric_count == 0:
+                            result['2025'] = number
+                            numeric_count += 1
+                        elif numeric_count == 1:
+                            result['2024'] = number
+                            numeric_count += 1
+                    elif number == 0 and any(char.isdigit() for char in div_text) and len(div_text) < 50:
+                        # Zero value is valid if it's a short text with digits
+                        if numeric_count == 0:
+                            result['2025'] = number
+                            numeric_count += 1
+                        elif numeric_count == 1:
+                            result['2024'] = number
+                            numeric_count += 1
             
             if result['2025'] == 0.0 and result['2024'] == 0.0:
                 self.logger.debug(f"    Identifier '{identifier}' found but no numeric values extracted from next divs")
@@ -1024,6 +1111,22 @@ class SindikasiScraper:
         
         return result
     
+    def _wait_for_report(self, timeout: float = 5):
+        """
+        Wait until a report page shows a report iframe, report text or the server error page
+        (the driver has no implicit wait, so the iframe probe would not wait for a late iframe)
+        
+        Args:
+            timeout: Maximum seconds to wait (same as the former implicit wait)
+        """
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.25).until(lambda d: d.execute_script(
+                "return !!document.querySelector('iframe') || "
+                "/Piutang|Aset|DPK|LABA|Rasio|KPMM|Kredit|Server Error/.test(document.body ? document.body.innerText : '');"
+            ))
+        except TimeoutException:
+            self.logger.debug("    Report content not detected, parsing page as is")
+    
     def _get_page_source_with_iframe(self) -> tuple[str, object]:
         """
         Get page source, checking iframes first (similar to BPR Konvensional)
@@ -1090,7 +1193,7 @@ class SindikasiScraper:
             
             # Get page source (check iframes first)
             page_source, report_iframe = self._get_page_source_with_iframe()
-            soup = BeautifulSoup(page_source, 'html.parser')
+            soup = self._parse_page(page_source)
             
             # Extract ASET
             aset_values = self._extract_identifier_value(soup, "Total Aset")
@@ -1167,7 +1270,7 @@ class SindikasiScraper:
             
             # Get page source (check iframes first)
             page_source, report_iframe = self._get_page_source_with_iframe()
-            soup = BeautifulSoup(page_source, 'html.parser')
+            soup = self._parse_page(page_source)
             
             # Extract LABA KOTOR
             laba_kotor_values = self._extract_identifier_value(soup, "Laba Rugi Tahun Berjalan")
@@ -1226,7 +1329,7 @@ class SindikasiScraper:
             
             # Get page source (check iframes first)
             page_source, report_iframe = self._get_page_source_with_iframe()
-            soup = BeautifulSoup(page_source, 'html.parser')
+            soup = self._parse_page(page_source)
             
             for ratio_name, identifier in ratios:
                 # Use ratio extraction that preserves decimal points (like publikasi targeted scraping)
@@ -1267,7 +1370,7 @@ class SindikasiScraper:
         
         try:
             page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
+            soup = self._parse_page(page_source)
             
             # Extract ASET
             aset_values = self._extract_identifier_value(soup, "Total Aset")
@@ -1341,7 +1444,7 @@ class SindikasiScraper:
             
             # Get page source (check iframes first)
             page_source, report_iframe = self._get_page_source_with_iframe()
-            soup = BeautifulSoup(page_source, 'html.parser')
+            soup = self._parse_page(page_source)
             
             # Extract LABA KOTOR
             laba_kotor_values = self._extract_identifier_value(soup, "LABA (RUGI) TAHUN BERJALAN SEBELUM PAJAK PENGHASILAN")
@@ -1400,7 +1503,7 @@ class SindikasiScraper:
             
             # Get page source (check iframes first)
             page_source, report_iframe = self._get_page_source_with_iframe()
-            soup = BeautifulSoup(page_source, 'html.parser')
+            soup = self._parse_page(page_source)
             
             for ratio_name, identifier in ratios:
                 # Use ratio extraction that preserves decimal points (like publikasi targeted scraping)
@@ -1416,16 +1519,18 @@ class SindikasiScraper:
             self.logger.debug(traceback.format_exc())
             return result
     
-    def process_bank(self, bank_name: str, url_type: str):
+    def process_bank(self, bank_name: str, url_type: str, target_period: tuple = None):
         """
         Process a single bank using direct URL construction
         
         Args:
             bank_name: Bank name to process
             url_type: Type of URL (e.g., "BPR Konvensional" or "BPR Syariah")
+            target_period: (month_name, year) from _get_target_month_year(), determined once by the
+                           caller for the whole list (optional, determined here if None)
         """
         # Get target month and year
-        target_month_name, target_year = self._get_target_month_year()
+        target_month_name, target_year = target_period or self._get_target_month_year()
         target_month_num = self._month_name_to_number(target_month_name)
         
         # Determine bank type
@@ -1482,7 +1587,8 @@ class SindikasiScraper:
                             time.sleep(3.0)
                         else:
                             self.driver.get(url)
-                            time.sleep(2.0)  # Wait for page to load
+                            # Polls until the report iframe/text or the error page is there (no fixed sleep)
+                            self._wait_for_report()
                         
                         # Check for server error
                         if self._check_for_server_error():
@@ -1646,6 +1752,9 @@ class SindikasiScraper:
             for bank_name in banks_with_zero:
                 self.logger.info(f"  - {bank_name}")
             
+            # Same period for every retried bank
+            target_period = self._get_target_month_year()
+            
             # Retry each bank
             for i, bank_name in enumerate(banks_with_zero, 1):
                 self.logger.info("")
@@ -1658,7 +1767,7 @@ class SindikasiScraper:
                 url_type = "BPR Syariah" if bank_type == 'syariah' else "BPR Konvensional"
                 
                 # Process bank again (this will update all_bank_data)
-                self.process_bank(bank_name, url_type)
+                self.process_bank(bank_name, url_type, target_period)
                 
                 # Small delay
                 time.sleep(1.0)
@@ -2080,12 +2189,14 @@ class SindikasiScraper:
             import traceback
             self.logger.debug(traceback.format_exc())
     
-    def find_all_banks(self, list_file_path: Path):
+    def find_all_banks(self, list_file_path: Path, keep_browser: bool = False):
         """
         Main orchestrator: Find all banks from list in appropriate URL
         
         Args:
             list_file_path: Path to the list file (should be named sindikasi_NAME_DD_MM_YYYY.txt)
+            keep_browser: If True, leave the browsers open for the caller (zero-value retry, next
+                          list file); the caller is then responsible for cleanup()
         """
         # Clear previous data to ensure fresh start for each file
         self.all_bank_data = []
@@ -2127,31 +2238,74 @@ class SindikasiScraper:
         not_found = []
         
         try:
-            # Process each bank
+            # Determine which URL type each bank uses based on bank name
+            banks_by_type = {'konvensional': [], 'syariah': []}
             for i, bank_name in enumerate(list_data['banks'], 1):
-                self.logger.info("")
-                self.logger.info("=" * 70)
-                self.logger.info(f"[{i}/{len(list_data['banks'])}] Searching for: {bank_name}")
-                self.logger.info("=" * 70)
-                
-                # Determine which URL type based on bank name
-                bank_type = self._determine_bank_type(bank_name)
-                
-                if bank_type == 'syariah':
-                    self.logger.info(f"  Bank type: BPR Syariah (contains BPRS or Syariah)")
-                    url_type = "BPR Syariah"
-                else:
-                    self.logger.info(f"  Bank type: BPR Konvensional")
-                    url_type = "BPR Konvensional"
-                
-                # Process bank directly using URL construction
-                self.process_bank(bank_name, url_type)
+                banks_by_type[self._determine_bank_type(bank_name)].append((i, bank_name))
+            
+            # Within each type, process banks alphabetically by name without the BPR/BPRS prefix so that
+            # similar names follow each other; i keeps the list file position for logs and the summary
+            for banks in banks_by_type.values():
+                banks.sort(key=lambda item: self._remove_bpr_prefix(item[1]).upper())
+            
+            def process_group(scraper, bank_type: str) -> None:
+                for i, bank_name in banks_by_type[bank_type]:
+                    scraper.logger.info("")
+                    scraper.logger.info("=" * 70)
+                    scraper.logger.info(f"[{i}/{len(list_data['banks'])}] Searching for: {bank_name}")
+                    scraper.logger.info("=" * 70)
+                    
+                    if bank_type == 'syariah':
+                        scraper.logger.info(f"  Bank type: BPR Syariah (contains BPRS or Syariah)")
+                        url_type = "BPR Syariah"
+                    else:
+                        scraper.logger.info(f"  Bank type: BPR Konvensional")
+                        url_type = "BPR Konvensional"
+                    
+                    # Process bank directly using URL construction
+                    scraper.process_bank(bank_name, url_type, (target_month, target_year))
+            
+            # Konvensional and Syariah banks are independent direct-URL requests, so when the list
+            # has both, each type gets its own browser (this one plus a second scraper instance)
+            bank_types = [bank_type for bank_type, banks in banks_by_type.items() if banks]
+            workers = [self]
+            if len(bank_types) > 1:
+                try:
+                    # The second browser is started once and reused for later lists (closed in cleanup())
+                    if self._second_scraper is None:
+                        worker = self.__class__(headless=self.headless)
+                        worker.initialize()
+                        self._second_scraper = worker
+                    self._second_scraper.all_bank_data = []
+                    workers.append(self._second_scraper)
+                except Exception as e:
+                    self.logger.warning(f"Could not start second browser, processing banks serially: {e}")
+            
+            if len(workers) > 1:
+                try:
+                    with ThreadPoolExecutor(max_workers=len(workers), thread_name_prefix="sindikasi") as executor:
+                        list(executor.map(process_group, workers, bank_types))
+                except Exception:
+                    # The second browser may be broken - start a fresh one for the next list
+                    self._second_scraper.cleanup(kill_processes=False)
+                    self._second_scraper = None
+                    raise
                 
-                # Track for summary
-                if bank_type == 'syariah':
-                    found_syariah.append(bank_name)
-                else:
-                    found_konvensional.append(bank_name)
+                # Merge the second browser's bank data
+                self.all_bank_data = self.all_bank_data + workers[1].all_bank_data
+            else:
+                for bank_type in bank_types:
+                    process_group(self, bank_type)
+            
+            # Put the bank data back in list file order
+            bank_order = {}
+            for idx, bank_name in enumerate(list_data['banks']):
+                bank_order.setdefault(bank_name, idx)
+            self.all_bank_data.sort(key=lambda bank_data: bank_order.get(bank_data['bank_name'], len(bank_order)))
+            
+            # Track for summary (list file order)
+            found_konvensional = [bank_name for _, bank_name in sorted(banks_by_type['konvensional'])]
+            found_syariah = [bank_name for _, bank_name in sorted(banks_by_type['syariah'])]
             
             # Print summary
             self.logger.info("")
@@ -2214,5 +2368,6 @@ class SindikasiScraper:
             self.logger.error(traceback.format_exc())
         
         finally:
-            self.cleanup()
+            if not keep_browser:
+                self.cleanup()
 
@@ -38,6 +38,7 @@ class OJKConfig:
     # Selenium settings
     HEADLESS_MODE = False  # Set to True for headless mode
     WINDOW_SIZE = (1920, 1080)
+    WEBDRIVER_POOL_MAXSIZE = 16  # urllib3 connections kept per WebDriver (default pool holds 1)
     
     # User agents for rotation
     USER_AGENTS = [
@@ -117,6 +117,8 @@ def check_sindikasi_queue():
             return
         sindikasi_running = True
     
+    # One scraper (and its browsers) is shared by all queue files of this check
+    scraper = None
     try:
         queue_dir = Settings.QUEUE_SINDIKASI
         
@@ -170,7 +172,10 @@ def check_sindikasi_queue():
                 logger.info(f"Processing: NAME={name_from_file}, Date={day}/{month}/{year}")
                 
                 # Run sindikasi scraper
-                run_sindikasi_scraper(txt_file, name_from_file, day, month, year)
+                if scraper is None:
+                    logger.info("[INFO] Initializing sindikasi scraper...")
+                    scraper = SindikasiScraper(headless=True)
+                run_sindikasi_scraper(txt_file, name_from_file, day, month, year, scraper)
                 
                 logger.info(f"[OK] Completed processing {txt_file.name}")
                 
@@ -188,6 +193,11 @@ def check_sindikasi_queue():
                         logger.error(f"[ERROR] Failed to update SCRAPE flag in {txt_file.name}: {e}")
     
     finally:
+        if scraper:
+            try:
+                scraper.cleanup()
+            except:
+                pass
         with lock:
             sindikasi_running = False
 
@@ -244,7 +254,7 @@ def run_ibprs_scraper_job():
         with lock:
             ibprs_running = False
 
-def run_sindikasi_scraper(list_file: Path, name: str, day: str, month: str, year: str):
+def run_sindikasi_scraper(list_file: Path, name: str, day: str, month: str, year: str, scraper=None):
     """
     Run sindikasi scraper and retry for zero values
     
@@ -254,15 +264,18 @@ def run_sindikasi_scraper(list_file: Path, name: str, day: str, month: str, year
         day: Day from filename
         month: Month from filename
         year: Year from filename
+        scraper: SindikasiScraper whose browsers are reused across queue files (optional);
+                 if given, the caller closes it, otherwise one is created and closed here
     """
-    scraper = None
+    owns_scraper = scraper is None
     try:
-        logger.info("[INFO] Initializing sindikasi scraper...")
-        scraper = SindikasiScraper(headless=True)
+        if owns_scraper:
+            logger.info("[INFO] Initializing sindikasi scraper...")
+            scraper = SindikasiScraper(headless=True)
         
-        # Initialize and run scraper
+        # Initialize and run scraper - browsers stay open for the zero-value retry below
         scraper.initialize()
-        scraper.find_all_banks(list_file)
+        scraper.find_all_banks(list_file, keep_browser=True)
         
         # After scraping, check for zero values and retry
         logger.info("[INFO] Checking for zero values and retrying...")
@@ -272,8 +285,15 @@ def run_sindikasi_scraper(list_file: Path, name: str, day: str, month: str, year
         logger.error(f"[ERROR] Error running sindikasi scraper: {e}")
         import traceback
         logger.error(traceback.format_exc())
+        # The shared browsers may be crashed or hung - close them so the next queue file starts fresh
+        # (initialize() only creates a driver when there is none)
+        if not owns_scraper and scraper:
+            try:
+                scraper.cleanup()
+            except:
+                pass
     finally:
-        if scraper:
+        if owns_scraper and scraper:
             try:
                 scraper.cleanup()
             except:
@@ -303,7 +323,8 @@ def retry_zero_value_banks_sindikasi(scraper, name: str, day: str, month: str, y
             return
         
         logger.info(f"[INFO] Reading Excel file: {filename}")
-        wb = load_workbook(filepath)
+        # Scan only - read-only mode streams rows instead of building every cell object
+        wb = load_workbook(filepath, read_only=True, data_only=True)
         ws = wb.active
         
         # Find banks with zero values
@@ -312,11 +333,8 @@ def retry_zero_value_banks_sindikasi(scraper, name: str, day: str, month: str, y
         banks_with_zero = set()  # Use set to avoid duplicates
         
         current_bank = None
-        for row_num in range(2, ws.max_row + 1):
-            bank_name_cell = ws.cell(row=row_num, column=1).value
-            label_cell = ws.cell(row=row_num, column=2).value
-            val_2025 = ws.cell(row=row_num, column=3).value
-            val_2024 = ws.cell(row=row_num, column=4).value
+        for row in ws.iter_rows(min_row=2, max_col=4, values_only=True):
+            bank_name_cell, label_cell, val_2025, val_2024 = tuple(row) + (None,) * (4 - len(row))
             
             # Skip empty rows
             if not bank_name_cell and not label_cell:
@@ -345,6 +363,9 @@ def retry_zero_value_banks_sindikasi(scraper, name: str, day: str, month: str, y
         if scraper.driver is None:
             scraper.initialize()
         
+        # Same period for every retried bank (and for the regenerated Excel file)
+        target_month, target_year = scraper._get_target_month_year()
+        
         # Retry each bank
         for i, bank_name in enumerate(banks_with_zero, 1):
             logger.info(f"[{i}/{len(banks_with_zero)}] Retrying: {bank_name}")
@@ -354,14 +375,13 @@ def retry_zero_value_banks_sindikasi(scraper, name: str, day: str, month: str, y
             url_type = "BPR Syariah" if bank_type == 'syariah' else "BPR Konvensional"
             
             # Process bank again (this will update all_bank_data)
-            scraper.process_bank(bank_name, url_type)
+            scraper.process_bank(bank_name, url_type, (target_month, target_year))
             
             # Small delay
             time.sleep(1.0)
         
         # Re-create Excel file with updated data
         logger.info("[INFO] Regenerating Excel file with retry data...")
-        target_month, target_year = scraper._get_target_month_year()
         scraper._create_excel_file(
             target_month,
             target_year,
@@ -0,0 +1,51 @@
+"""
+Tests for numeric text parsing in the BPR Konvensional scraper
+"""
+
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+
+# Import using importlib to handle directory name with spaces
+ROOT = Path(__file__).parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+module_path = ROOT / "Laporan Publikasi BPR Konvensional" / "scraper.py"
+spec = importlib.util.spec_from_file_location("konvensional_scraper", module_path)
+konvensional_module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(konvensional_module)
+OJKExtJSScraper = konvensional_module.OJKExtJSScraper
+
+
+class CleanNumericTextTest(unittest.TestCase):
+    """_clean_numeric_text returns unsigned values in Indonesian/English formats"""
+
+    def setUp(self):
+        self.scraper = OJKExtJSScraper(headless=True)
+
+    def test_parenthesized_value_is_not_negated(self):
+        self.assertEqual(self.scraper._clean_numeric_text("(1,234)"), 1234.0)
+
+    def test_leading_minus_is_ignored(self):
+        self.assertEqual(self.scraper._clean_numeric_text("-12,5"), 12.5)
+
+    def test_dot_thousands_comma_decimal(self):
+        self.assertEqual(self.scraper._clean_numeric_text("1.234.567,89"), 1234567.89)
+
+    def test_comma_decimal(self):
+        self.assertEqual(self.scraper._clean_numeric_text("3,25"), 3.25)
+
+    def test_loss_in_parentheses_keeps_year_columns(self):
+        page_source = (
+            "<html><body>"
+            "<div>LABA (RUGI) TAHUN BERJALAN SEBELUM PAJAK PENGHASILAN</div>"
+            "<div>(1,234,567)</div><div>2,345,678</div>"
+            "</body></html>"
+        )
+        result = self.scraper._parse_form2_direct_url(page_source=page_source)
+        self.assertEqual(result['LABA KOTOR'], {'2025': 1234567.0, '2024': 2345678.0})
+
+
+if __name__ == "__main__":
+    unittest.main()